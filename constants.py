@@ -36,9 +36,21 @@ DISPLAY_MODE_OPTIONS = [
     DISPLAY_FULLSCREEN
 ]
 
+# Render mode options
+RENDER_MODE_NATIVE = "Native"            # Draw directly at the window resolution
+RENDER_MODE_LOGICAL = "Logical"          # Draw at the original resolution and scale once
+RENDER_MODE_LOGICAL_CRISP = "Logical (crisp text)"  # Same, but text renders at window resolution
+
+RENDER_MODE_OPTIONS = [
+    RENDER_MODE_NATIVE,
+    RENDER_MODE_LOGICAL,
+    RENDER_MODE_LOGICAL_CRISP
+]
+
 # Default settings
 DEFAULT_RESOLUTION = RESOLUTION_800x600
 DEFAULT_DISPLAY_MODE = DISPLAY_WINDOWED
+DEFAULT_RENDER_MODE = RENDER_MODE_NATIVE
 
 # Colors
 BLACK = (0, 0, 0)
@@ -72,6 +84,13 @@ FLEE_ANIMATION_DURATION = 40
 ACTION_DELAY_DURATION = 30  # Delay between turns (0.5 seconds at 60fps)
 SPELL_ANIMATION_DURATION = 30  # Duration for spell casting animations
 
+# Particle counts for battle effects
+SPELL_PARTICLE_COUNT = 40      # Sparks/particles per spell effect
+ULTIMATE_PARTICLE_COUNT = 160  # Particles per stacked ultimate effect
+
+# Number of upcoming turns shown in the battle HUD
+TURN_FORECAST_LENGTH = 5
+
 # Menu options
 PAUSE_OPTIONS = ["ITEMS", "SETTINGS", "CLOSE"] 
 SETTINGS_OPTIONS = ["TEXT SPEED", "RESOLUTION", "DISPLAY MODE", "BACK"]
@@ -81,4 +100,8 @@ BATTLE_OPTIONS = [
 ]
 
 # Message log size
-MAX_LOG_SIZE = 3  # Number of messages to keep in the battle log
\ No newline at end of file
+MAX_LOG_SIZE = 3  # Number of messages to keep in the battle log
+
+# Map loading
+MAX_RESIDENT_MAPS = 4  # Map areas kept built at once (the current map and its neighbors always stay)
+PREFETCH_EDGE_DISTANCE = 96  # Start loading a connected map when the player is this close to its edge
@@ -1,18 +1,18 @@
 """
 Map initialization for the RPG game.
 """
-from systems.map.map_system import MapSystem, MapArea
+from systems.map.map_system import MapSystem, MapDefinition
 from entities.enemy import Enemy
 from entities.npc import NPC
 from entities.party_recruiter import PartyRecruiter
 from data.encounter_pools import initialize_encounter_pools
+from systems.ui.render_target import get_render_size
 import random
-import pygame
 from constants import BLACK, BLUE, GREEN, RED, PURPLE, WHITE, ORIGINAL_WIDTH, ORIGINAL_HEIGHT
 
 def initialize_maps(player, party=None):
     """
-    Create and initialize all map areas.
+    Register all map areas and enter the starting one.
     
     Args:
         player: The player entity to place on the initial map
@@ -27,26 +27,29 @@ def initialize_maps(player, party=None):
     # Create the map system with the encounter manager
     map_system = MapSystem(encounter_manager)
     
-    # Create map areas with different background colors for visual distinction
-    center_map = MapArea("Debug Area - Center", BLACK, "center")
-    north_map = MapArea("Debug Area - North", (0, 0, 20), "north")  # Very dark blue
-    east_map = MapArea("Debug Area - East", (20, 0, 0), "east")   # Very dark red
-    south_map = MapArea("Debug Area - South", (0, 20, 0), "south")  # Very dark green
-    west_map = MapArea("Debug Area - West", (20, 0, 20), "west")  # Very dark purple
-    
-    # Set encounter chances
-    center_map.encounter_chance = 0     # No encounters
-    north_map.encounter_chance = 0      # No encounters
-    east_map.encounter_chance = 0.20    # 20% chance per step (rat-infested)
-    south_map.encounter_chance = 0.05   # 5% chance per step
-    west_map.encounter_chance = 0.15    # 15% chance per step
-    
-    # Add maps to the system
-    map_system.add_map("center", center_map)
-    map_system.add_map("north", north_map)
-    map_system.add_map("east", east_map)
-    map_system.add_map("south", south_map)
-    map_system.add_map("west", west_map)
+    # Register map areas with different background colors for visual distinction.
+    # Areas are only built when the player first enters them.
+    map_system.register_map(MapDefinition(
+        "center", "Debug Area - Center", BLACK,
+        encounter_chance=0                          # No encounters
+    ))
+    map_system.register_map(MapDefinition(
+        "north", "Debug Area - North", (0, 0, 20),  # Very dark blue
+        encounter_chance=0,                         # No encounters
+        populate=lambda map_area: add_party_recruiter(map_area, party)
+    ))
+    map_system.register_map(MapDefinition(
+        "east", "Debug Area - East", (20, 0, 0),    # Very dark red
+        encounter_chance=0.20                       # 20% chance per step (rat-infested)
+    ))
+    map_system.register_map(MapDefinition(
+        "south", "Debug Area - South", (0, 20, 0),  # Very dark green
+        encounter_chance=0.05                       # 5% chance per step
+    ))
+    map_system.register_map(MapDefinition(
+        "west", "Debug Area - West", (20, 0, 20),   # Very dark purple
+        encounter_chance=0.15                       # 15% chance per step
+    ))
     
     # Connect maps
     map_system.connect_maps("center", "north", "north")
@@ -54,8 +57,22 @@ def initialize_maps(player, party=None):
     map_system.connect_maps("center", "south", "south")
     map_system.connect_maps("center", "west", "west")
     
+    # Set center as current map and add the player to it
+    map_system.set_current_map("center")
+    map_system.get_current_map().add_entity(player)
+    
+    return map_system
+
+def add_party_recruiter(map_area, party=None):
+    """
+    Add the party recruiter NPC to a map area.
+    
+    Args:
+        map_area (MapArea): The map area being built
+        party: The player's party (optional)
+    """
     # Get current screen dimensions
-    current_width, current_height = pygame.display.get_surface().get_size()
+    current_width, current_height = get_render_size()
 
     # Position NPC in the top center area
     npc_x = ORIGINAL_WIDTH * 0.5
@@ -64,12 +81,4 @@ def initialize_maps(player, party=None):
     # Always create a party recruiter, even if party is None
     recruiter = PartyRecruiter(npc_x, npc_y, 32, 48, WHITE, party)
     recruiter.update_scale(current_width, current_height)
-    north_map.add_entity(recruiter)
-    
-    # Add player to center map
-    center_map.add_entity(player)
-    
-    # Set center as current map
-    map_system.set_current_map("center")
-    
-    return map_system
\ No newline at end of file
+    map_area.add_entity(recruiter)
@@ -0,0 +1,340 @@
+"""
+Input and RNG replay for the RPG game.
+Records the event stream, the keys polled each frame and the seeds of the
+named random streams to a compact gzipped JSON file, and plays it back so
+the exact same session can be benchmarked before and after a change.
+"""
+import gzip
+import json
+import pygame
+from utils.rng import get_seeds, seed_streams
+
+REPLAY_VERSION = 1
+
+# Event attributes worth keeping, by event type
+_EVENT_ATTRIBUTES = {
+    pygame.KEYDOWN: ("key", "mod", "unicode", "scancode"),
+    pygame.KEYUP: ("key", "mod", "unicode", "scancode"),
+    pygame.MOUSEBUTTONDOWN: ("pos", "button"),
+    pygame.MOUSEBUTTONUP: ("pos", "button"),
+    pygame.MOUSEMOTION: ("pos", "rel", "buttons"),
+    pygame.QUIT: (),
+}
+
+class KeyState:
+    """
+    Pressed-key lookup that behaves like pygame.key.get_pressed().
+    """
+    def __init__(self, pressed=()):
+        """
+        Initialize the key state.
+
+        Args:
+            pressed: Key codes that are held down
+        """
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+class LiveInput:
+    """
+    Reads input straight from pygame.
+    """
+    def get_events(self):
+        """
+        Get the events queued since the last call.
+
+        Returns:
+            list: pygame events
+        """
+        return pygame.event.get()
+
+    def get_pressed(self):
+        """
+        Get the keyboard state.
+
+        Returns:
+            Key state indexable by pygame key constants
+        """
+        return pygame.key.get_pressed()
+
+    def frame_time(self, dt):
+        """
+        Get the time step to simulate this frame with.
+
+        Args:
+            dt (float): Measured seconds since the last frame
+
+        Returns:
+            float: Seconds to simulate
+        """
+        return dt
+
+    def end_frame(self):
+        """Mark the end of a frame."""
+        pass
+
+    def close(self):
+        """Stop reading input."""
+        pass
+
+class _RecordedKeyState:
+    """
+    Key state that records every key the game polls, for ReplayRecorder.
+    """
+    def __init__(self, recorder, live_state):
+        self.recorder = recorder
+        self.live_state = live_state
+
+    def __getitem__(self, key):
+        pressed = bool(self.live_state[key])
+        self.recorder.record_key(key, pressed)
+        return pressed
+
+class ReplayRecorder(LiveInput):
+    """
+    Reads live input and records it to a replay file.
+    """
+    def __init__(self, path, seeds=None):
+        """
+        Initialize the recorder and seed the random streams.
+
+        Args:
+            path (str): File to write the replay to
+            seeds (dict): Stream seeds to use (fresh seeds if not given)
+        """
+        self.path = path
+        self.seeds = seed_streams(seeds)
+        self.frame = 0
+        self.call = 0                # get_events calls so far this frame
+        self.events = []             # [frame, call, type, attributes]
+        self.key_changes = []        # [frame, key, pressed]
+        self.key_values = {}         # Last recorded value of each polled key
+        self.frame_state = None      # Key state handed out this frame
+        self.frame_times = []        # Milliseconds simulated, one per frame_time call
+
+    def get_events(self):
+        """
+        Get the events queued since the last call, recording them.
+
+        Returns:
+            list: pygame events
+        """
+        events = pygame.event.get()
+        for event in events:
+            attributes = _EVENT_ATTRIBUTES.get(event.type)
+            if attributes is None:
+                continue
+            values = {name: getattr(event, name) for name in attributes if hasattr(event, name)}
+            self.events.append([self.frame, self.call, event.type, values])
+        self.call += 1
+        return events
+
+    def get_pressed(self):
+        """
+        Get the keyboard state, recording each key the game looks at.
+
+        Returns:
+            Key state indexable by pygame key constants
+        """
+        # Hand out the same state for the whole frame, as replay will
+        if self.frame_state is None:
+            self.frame_state = _RecordedKeyState(self, pygame.key.get_pressed())
+        return self.frame_state
+
+    def frame_time(self, dt):
+        """
+        Get the time step for this frame, recording it.
+
+        Args:
+            dt (float): Measured seconds since the last frame
+
+        Returns:
+            float: Seconds to simulate (rounded to whole milliseconds)
+        """
+        milliseconds = round(dt * 1000)
+        self.frame_times.append(milliseconds)
+        return milliseconds / 1000
+
+    def record_key(self, key, pressed):
+        """
+        Record a polled key if its value changed.
+
+        Args:
+            key (int): pygame key constant
+            pressed (bool): Whether the key is held down
+        """
+        if self.key_values.get(key, False) != pressed:
+            self.key_values[key] = pressed
+            self.key_changes.append([self.frame, key, pressed])
+
+    def end_frame(self):
+        """Mark the end of a frame."""
+        self.frame += 1
+        self.call = 0
+        self.frame_state = None
+
+    def close(self):
+        """Write the replay file."""
+        data = {
+            "version": REPLAY_VERSION,
+            "seeds": get_seeds(),
+            "frames": self.frame,
+            "events": self.events,
+            "keys": self.key_changes,
+            "frame_times": self.frame_times,
+        }
+        with gzip.open(self.path, "wt", encoding="utf-8") as replay_file:
+            json.dump(data, replay_file, separators=(",", ":"))
+
+class ReplayPlayer(LiveInput):
+    """
+    Feeds recorded input back to the game.
+    """
+    def __init__(self, path):
+        """
+        Load a replay file and seed the random streams from it.
+
+        Args:
+            path (str): Replay file to play back
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as replay_file:
+            data = json.load(replay_file)
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+
+        self.total_frames = data["frames"]
+        self.seeds = seed_streams(data["seeds"])
+        self.frame = 0
+        self.call = 0
+
+        # Group events by (frame, call) for quick lookup
+        self.events = {}
+        for frame, call, event_type, values in data["events"]:
+            if "pos" in values:
+                values["pos"] = tuple(values["pos"])
+            if "rel" in values:
+                values["rel"] = tuple(values["rel"])
+            if "buttons" in values:
+                values["buttons"] = tuple(values["buttons"])
+            self.events.setdefault((frame, call), []).append(pygame.event.Event(event_type, values))
+
+        self.key_changes = data["keys"]
+        self.frame_times = data.get("frame_times", [])
+        self.next_frame_time = 0
+        self.next_key_change = 0
+        self.key_state = KeyState()
+        self._apply_key_changes()
+
+    @property
+    def finished(self):
+        """Whether every recorded frame has been played."""
+        return self.frame >= self.total_frames
+
+    def get_events(self):
+        """
+        Get the events recorded for this point of the frame.
+
+        Returns:
+            list: pygame events
+        """
+        # Keep the window responsive, but ignore live input
+        pygame.event.pump()
+        events = self.events.get((self.frame, self.call), [])
+        self.call += 1
+        return events
+
+    def get_pressed(self):
+        """
+        Get the recorded keyboard state for this frame.
+
+        Returns:
+            KeyState: Pressed keys
+        """
+        return self.key_state
+
+    def frame_time(self, dt):
+        """
+        Get the recorded time step for this frame.
+
+        Args:
+            dt (float): Measured seconds since the last frame (ignored)
+
+        Returns:
+            float: Seconds simulated when the frame was recorded
+        """
+        if self.next_frame_time < len(self.frame_times):
+            milliseconds = self.frame_times[self.next_frame_time]
+            self.next_frame_time += 1
+            return milliseconds / 1000
+        return 1 / 60
+
+    def _apply_key_changes(self):
+        """Apply the key changes recorded up to the current frame."""
+        while (self.next_key_change < len(self.key_changes) and
+               self.key_changes[self.next_key_change][0] <= self.frame):
+            _, key, pressed = self.key_changes[self.next_key_change]
+            if pressed:
+                self.key_state.pressed.add(key)
+            else:
+                self.key_state.pressed.discard(key)
+            self.next_key_change += 1
+
+    def end_frame(self):
+        """Mark the end of a frame."""
+        self.frame += 1
+        self.call = 0
+        self._apply_key_changes()
+
+# Input source the game reads from
+_input_source = LiveInput()
+
+def set_input_source(source):
+    """
+    Set where the game reads its input from.
+
+    Args:
+        source: LiveInput, ReplayRecorder or ReplayPlayer
+    """
+    global _input_source
+    _input_source = source
+
+def get_input_source():
+    """
+    Get the input source in use.
+
+    Returns:
+        The current input source
+    """
+    return _input_source
+
+def get_events():
+    """
+    Get input events from the current input source.
+
+    Returns:
+        list: pygame events
+    """
+    return _input_source.get_events()
+
+def frame_time(dt):
+    """
+    Get the time step to simulate this frame with from the current input source.
+
+    Args:
+        dt (float): Measured seconds since the last frame
+
+    Returns:
+        float: Seconds to simulate
+    """
+    return _input_source.frame_time(dt)
+
+def get_pressed():
+    """
+    Get the keyboard state from the current input source.
+
+    Returns:
+        Key state indexable by pygame key constants
+    """
+    return _input_source.get_pressed()
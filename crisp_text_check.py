@@ -0,0 +1,126 @@
+"""
+Crisp-text layering check for the RPG game.
+Plays a battle and draws every frame twice: onto the crisp-text logical
+surface, with its held-back text then drawn in at logical resolution, and
+onto a plain surface. Any pixel that differs means held-back text ended up
+on the wrong layer, e.g.:
+
+    python crisp_text_check.py --enemies 3 --frames 2000
+"""
+import argparse
+import os
+import random
+import sys
+
+# Draws offscreen; no window is needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from constants import ORIGINAL_WIDTH, ORIGINAL_HEIGHT
+from systems.character.character_creator import CharacterCreator
+from systems.character.party_system import Party
+from systems.map.encounter_system import EnemySpec
+from systems.battle.battle_system import BattleSystem
+from systems.ui.render_target import LogicalSurface
+from entities.enemy import Enemy
+from entities.player import Player
+
+def build_battle(enemy_count, enemy_class, seed):
+    """
+    Set up a battle between a small party and a group of enemies.
+
+    Args:
+        enemy_count (int): Number of enemies
+        enemy_class (str): Monster class of the enemies
+        seed (int): Seed for the battle rolls and background
+
+    Returns:
+        BattleSystem: The new battle
+    """
+    creator = CharacterCreator()
+    party = Party()
+    party.add_member(creator.create_character("Warrior", "warrior", 5))
+    party.add_member(creator.create_character("Mage", "mage", 5))
+
+    spec = EnemySpec(enemy_class, 1)
+    enemies = [Enemy.create_from_spec(spec, 0, 0, unique_id=i + 1) for i in range(enemy_count)]
+    return BattleSystem(party, enemies, 1, background_seed=seed, rng=random.Random(seed))
+
+def play_frame(battle_system):
+    """
+    Advance the battle one frame, attacking the first standing enemy on party turns.
+
+    Args:
+        battle_system (BattleSystem): The battle
+    """
+    ui = battle_system.ui
+    # Skip the text animation so turns come quickly
+    ui.displayed_message = ui.full_message
+    ui.message_index = len(ui.full_message)
+
+    current = battle_system.turn_order.get_current()
+    if isinstance(current, Player) and not battle_system.actions.action_processing:
+        target = next(enemy for enemy in battle_system.enemies if not enemy.is_defeated())
+        battle_system.actions.perform_attack(current, target)
+    battle_system.update()
+
+def differing_area(first, second):
+    """
+    Compare two surfaces pixel by pixel.
+
+    Args:
+        first (pygame.Surface): One render
+        second (pygame.Surface): The other render
+
+    Returns:
+        pygame.Rect: Bounding rect of the differing pixels, or None if they match
+    """
+    differs = np.any(pygame.surfarray.pixels3d(first) != pygame.surfarray.pixels3d(second), axis=2)
+    xs, ys = np.nonzero(differs)
+    if len(xs) == 0:
+        return None
+    return pygame.Rect(xs.min(), ys.min(), xs.max() - xs.min() + 1, ys.max() - ys.min() + 1)
+
+def main():
+    """Parse the command line and run the check."""
+    parser = argparse.ArgumentParser(description="Check crisp-text rendering against plain rendering.")
+    parser.add_argument("--enemies", type=int, default=3, help="Enemies in the battle")
+    parser.add_argument("--enemy-class", default="rat", help="Monster class of the enemies")
+    parser.add_argument("--frames", type=int, default=2000, help="Most frames to check")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    if args.enemies < 1:
+        parser.error("--enemies must be at least 1")
+
+    pygame.init()
+    size = (ORIGINAL_WIDTH, ORIGINAL_HEIGHT)
+    pygame.display.set_mode(size)
+    battle_system = build_battle(args.enemies, args.enemy_class, args.seed)
+
+    crisp = LogicalSurface(size)
+    plain = pygame.Surface(size)
+    frames = 0
+    mismatches = []
+    while frames < args.frames and not battle_system.battle_over:
+        play_frame(battle_system)
+        frames += 1
+
+        battle_system.draw(crisp)
+        # Draw in whatever text is still held back, as present would
+        crisp.bake_text(crisp.get_rect())
+        battle_system.draw(plain)
+
+        area = differing_area(crisp, plain)
+        if area is not None:
+            mismatches.append((frames, area))
+
+    print(f"{frames} frames checked, {len(mismatches)} differ from plain rendering")
+    for frame, area in mismatches[:10]:
+        print(f"    frame {frame}: pixels differ in {area}")
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+Bestiary for the RPG game.
+Builds one immutable prototype per monster class and level, and spawns
+enemies by copying prototypes into pooled Enemy instances.
+"""
+from dataclasses import dataclass
+from typing import Tuple
+from constants import RED
+
+# Enemy colors by class
+ENEMY_COLORS = {
+    "rat": (120, 100, 80),          # Brown
+    "snake": (70, 130, 70),         # Green
+    "slime": (100, 200, 200),       # Light blue
+    "turtle": (70, 140, 90),        # Dark green
+    "hermit_crab": (180, 120, 100)  # Reddish brown
+}
+
+# Most defeated enemies kept per class and level for reuse
+MAX_POOLED_PER_PROTOTYPE = 8
+
+@dataclass(frozen=True)
+class EnemyPrototype:
+    """Stats and look shared by every enemy of one class and level."""
+    class_id: str
+    level: int
+    character_class: object
+    name: str
+    color: Tuple[int, int, int]
+    size: Tuple[int, int]
+    stats: Tuple[Tuple[str, int], ...]  # (stat name, value) pairs
+    xp: int
+    passive_names: Tuple[str, ...]
+
+class Bestiary:
+    """
+    Registry of enemy prototypes with a free list of defeated enemies.
+    """
+    def __init__(self):
+        """Initialize an empty bestiary."""
+        self.classes = None     # Monster class ID -> CharacterClass, loaded on first use
+        self.prototypes = {}    # (class_id, level) -> EnemyPrototype
+        self.free_lists = {}    # (class_id, level) -> released Enemy instances
+
+    def _load_classes(self):
+        """
+        Load the monster classes.
+
+        Returns:
+            dict: Class ID -> CharacterClass
+        """
+        if self.classes is None:
+            from data.character_classes import (
+                rat, snake, slime, turtle, hermit_crab  # Import monster classes
+            )
+            self.classes = {
+                "rat": rat,
+                "snake": snake,
+                "slime": slime,
+                "turtle": turtle,
+                "hermit_crab": hermit_crab
+            }
+        return self.classes
+
+    def get_prototype(self, class_id, level):
+        """
+        Get the prototype for a monster class and level, building it once.
+
+        Args:
+            class_id (str): Monster class ID
+            level (int): Enemy level
+
+        Returns:
+            EnemyPrototype: The prototype, or None if the class is unknown
+        """
+        key = (class_id, level)
+        prototype = self.prototypes.get(key)
+        if prototype is None:
+            character_class = self._load_classes().get(class_id)
+            if character_class is None:
+                return None
+            stats = character_class.get_stat_block(level)
+            prototype = EnemyPrototype(
+                class_id=class_id,
+                level=level,
+                character_class=character_class,
+                name=character_class.name,
+                color=ENEMY_COLORS.get(class_id, RED),
+                size=(32, 32),
+                stats=tuple(stats.items()),
+                xp=level * 5,  # Same XP rule as Enemy
+                passive_names=tuple(character_class.get_abilities_for_level(level)["passives"])
+            )
+            self.prototypes[key] = prototype
+        return prototype
+
+    def spawn(self, enemy_spec, x, y, unique_id=None):
+        """
+        Spawn an enemy from a specification, reusing a released one if possible.
+
+        Args:
+            enemy_spec: The enemy specification from the encounter system
+            x (int): Initial x coordinate
+            y (int): Initial y coordinate
+            unique_id (int): Optional unique identifier for this enemy
+
+        Returns:
+            Enemy: The spawned enemy
+        """
+        from entities.enemy import Enemy
+
+        prototype = self.get_prototype(enemy_spec.class_id, enemy_spec.level)
+        if prototype is None:
+            # Fallback to default enemy if class not found
+            return Enemy(x, y, None, 1, RED, unique_id)
+
+        free_list = self.free_lists.get((prototype.class_id, prototype.level))
+        if free_list:
+            enemy = free_list.pop()
+            enemy.reset_from_prototype(prototype, x, y, unique_id)
+        else:
+            enemy = Enemy.from_prototype(prototype, x, y, unique_id)
+        return enemy
+
+    def release(self, enemies):
+        """
+        Return enemies that are done with battle to the pool.
+
+        Args:
+            enemies: List of enemies that will not be used again
+        """
+        for enemy in enemies:
+            prototype = enemy.prototype
+            if prototype is None:
+                continue
+            free_list = self.free_lists.setdefault((prototype.class_id, prototype.level), [])
+            if len(free_list) < MAX_POOLED_PER_PROTOTYPE and enemy not in free_list:
+                free_list.append(enemy)
+
+# Shared bestiary used for all encounter spawns
+bestiary = Bestiary()
@@ -12,6 +12,13 @@ class Enemy(Entity):
     """
     Enemy entity that can battle with the player.
     """
+    __slots__ = (
+        "xp", "defending", "defense_multiplier", "passives",
+        "entity_id",        # Unique identifier for targeting
+        "battle_position",  # Index in the battle formation
+        "prototype",        # Bestiary prototype this enemy was spawned from (None if built directly)
+    )
+    
     def __init__(self, x, y, character_class=None, level=1, color=RED, unique_id=None):
         """
         Initialize an enemy.
@@ -64,6 +71,9 @@ class Enemy(Entity):
         # Position in battle formation (for multi-enemy battles)
         self.battle_position = 0
         
+        # Not spawned from the bestiary, so it isn't returned to a pool
+        self.prototype = None
+        
     def defend(self):
         """
         Enter defensive stance to halve incoming damage and increase evasion by 25%.
@@ -108,6 +118,80 @@ class Enemy(Entity):
         """
         self.defending = False
         
+    @classmethod
+    def from_prototype(cls, prototype, x, y, unique_id=None):
+        """
+        Create an enemy from a bestiary prototype without recalculating its stats.
+        
+        Args:
+            prototype: The EnemyPrototype to copy
+            x (int): Initial x coordinate
+            y (int): Initial y coordinate
+            unique_id (int): Optional unique identifier for this enemy
+            
+        Returns:
+            Enemy: The created enemy instance
+        """
+        enemy = cls.__new__(cls)
+        
+        # Per-instance state that survives reuse from the pool
+        enemy.rect = pygame.Rect(x, y, *prototype.size)
+        enemy._image = None
+        enemy.scale_epoch = None
+        enemy.scaled_resolution = None
+        enemy.entity_id = f"enemy_{id(enemy)}"
+        enemy.passives = PassiveSet(add_defaults=False)
+        for passive_name in prototype.passive_names:
+            enemy.passives.add_passive(passive_name)
+        
+        enemy.reset_from_prototype(prototype, x, y, unique_id)
+        return enemy
+    
+    def reset_from_prototype(self, prototype, x, y, unique_id=None):
+        """
+        Reset this enemy to a fresh copy of a prototype.
+        
+        The image is kept, so a pooled enemy spawns without allocating a surface.
+        
+        Args:
+            prototype: The EnemyPrototype to copy
+            x (int): Initial x coordinate
+            y (int): Initial y coordinate
+            unique_id (int): Optional unique identifier for this enemy
+        """
+        self.prototype = prototype
+        
+        # Rescale to the new position on the next update_scale
+        self.scale_epoch = None
+        self.original_x = x
+        self.original_y = y
+        self.original_width, self.original_height = prototype.size
+        self.color = prototype.color
+        
+        self.character_class = prototype.character_class
+        self.level = prototype.level
+        if unique_id is not None:
+            self.name = f"{prototype.name} #{unique_id}"
+        else:
+            self.name = prototype.name
+        
+        # Battle stats
+        for stat_name, value in prototype.stats:
+            setattr(self, stat_name, value)
+        self.max_hp = self.hp
+        self.max_sp = self.sp
+        self.xp = prototype.xp
+        
+        self.defending = False
+        self.defense_multiplier = 1
+        self.battle_position = 0
+        
+        # Clear where the last battle or map put it
+        self.battle_pos_x = None
+        self.battle_pos_y = None
+        self.last_x = None
+        self.last_y = None
+    
     @classmethod
     def create_from_spec(cls, enemy_spec, x, y, unique_id=None):
         """
@@ -122,35 +206,5 @@ class Enemy(Entity):
         Returns:
             Enemy: The created enemy instance
         """
-        from data.character_classes import (
-            rat, snake, slime, turtle, hermit_crab  # Import monster classes
-        )
-        
-        # Map the class IDs to actual class objects
-        class_map = {
-            "rat": rat,
-            "snake": snake,
-            "slime": slime,
-            "turtle": turtle,
-            "hermit_crab": hermit_crab
-        }
-        
-        # Choose color based on class
-        color_map = {
-            "rat": (120, 100, 80),     # Brown
-            "snake": (70, 130, 70),    # Green
-            "slime": (100, 200, 200),  # Light blue
-            "turtle": (70, 140, 90),   # Dark green
-            "hermit_crab": (180, 120, 100)  # Reddish brown
-        }
-        
-        # Get the character class object
-        character_class = class_map.get(enemy_spec.class_id)
-        color = color_map.get(enemy_spec.class_id, RED)  # Default to RED if not found
-        
-        if character_class:
-            # Create the enemy with the specified class, level, and unique ID
-            return cls(x, y, character_class, enemy_spec.level, color, unique_id)
-        else:
-            # Fallback to default enemy if class not found
-            return cls(x, y, None, 1, RED, unique_id)
\ No newline at end of file
+        from entities.bestiary import bestiary
+        return bestiary.spawn(enemy_spec, x, y, unique_id)
@@ -3,12 +3,90 @@ NPC class.
 """
 import pygame
 from constants import WHITE, SCREEN_WIDTH, SCREEN_HEIGHT, ORIGINAL_WIDTH, ORIGINAL_HEIGHT
-from utils.utils import scale_position, scale_dimensions
+from utils.utils import scale_position, scale_dimensions, get_display_epoch
 
-class Entity(pygame.sprite.Sprite):
+class EntityGroup:
+    """
+    Insertion-ordered set of entities that can draw itself, in place of
+    pygame.sprite.Group (entities use __slots__, so they aren't Sprites).
+    """
+    __slots__ = ("_entities",)
+    
+    def __init__(self, *entities):
+        """
+        Initialize the group.
+        
+        Args:
+            *entities: Entities to start with
+        """
+        self._entities = {}  # Entity -> None, kept as a dict for its ordering
+        self.add(*entities)
+    
+    def add(self, *entities):
+        """Add entities to the group (already present ones are ignored)."""
+        for entity in entities:
+            self._entities[entity] = None
+    
+    def remove(self, *entities):
+        """Remove entities from the group (missing ones are ignored)."""
+        for entity in entities:
+            self._entities.pop(entity, None)
+    
+    def empty(self):
+        """Remove every entity from the group."""
+        self._entities.clear()
+    
+    def sprites(self):
+        """
+        Get the entities in the group.
+        
+        Returns:
+            list: Entities in the order they were added
+        """
+        return list(self._entities)
+    
+    def __contains__(self, entity):
+        return entity in self._entities
+    
+    def __iter__(self):
+        # Iterate over a copy so entities can be added or removed while looping
+        return iter(list(self._entities))
+    
+    def __len__(self):
+        return len(self._entities)
+    
+    def draw(self, surface):
+        """
+        Draw every entity's image at its rect.
+        
+        Args:
+            surface: The pygame surface to draw on
+        """
+        surface.blits([(entity.image, entity.rect) for entity in self._entities], doreturn=False)
+
+class Entity:
     """
     Base class for all game entities (player, enemies, etc.).
+    
+    Every attribute is declared in __slots__ so instances don't carry a
+    __dict__; subclasses declare their own additions the same way.
     """
+    __slots__ = (
+        # Geometry at the original resolution and at the current one
+        "original_x", "original_y", "original_width", "original_height",
+        "rect", "scale_epoch", "scaled_resolution",
+        # Appearance
+        "color", "_image",
+        # Identity and stats
+        "character_class", "level", "name",
+        "max_hp", "hp", "max_sp", "sp",
+        "attack", "defense", "intelligence", "resilience", "acc", "spd",
+        # Position in battle formation, set by BattleFormation (None outside battle)
+        "battle_pos_x", "battle_pos_y",
+        # Position on the previous frame, set by MapArea.update (None until first checked)
+        "last_x", "last_y",
+    )
+    
     def __init__(self, x, y, width, height, color, character_class=None, level=1, name=None):
         """
         Initialize a new entity.
@@ -23,8 +101,6 @@ class Entity(pygame.sprite.Sprite):
             level (int): Entity level
             name (str): Entity name (optional)
         """
-        super().__init__()
-        
         # Store original (design-time) dimensions
         self.original_x = x
         self.original_y = y
@@ -32,14 +108,22 @@ class Entity(pygame.sprite.Sprite):
         self.original_height = height
         self.color = color
         
-        # Create a simple rectangle for the entity
-        self.image = pygame.Surface([width, height])
-        self.image.fill(color)
+        # The image is only created when something draws the entity,
+        # so battles can run without a display
+        self._image = None
         
         # Set the position
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
+        self.rect = pygame.Rect(x, y, width, height)
+        
+        # Display epoch and resolution the image was last scaled for
+        self.scale_epoch = None
+        self.scaled_resolution = None
+        
+        # Battle formation and map movement tracking
+        self.battle_pos_x = None
+        self.battle_pos_y = None
+        self.last_x = None
+        self.last_y = None
 
         self.character_class = character_class
         self.level = level
@@ -78,14 +162,41 @@ class Entity(pygame.sprite.Sprite):
             self.acc = 1  # ACC determines chance to land hit
             self.spd = 1  # SPD determines turn order and chance to dodge incoming hits
     
+    @property
+    def image(self):
+        """
+        Get the entity's image, creating it on first use.
+        
+        Returns:
+            pygame.Surface: A rectangle filled with the entity's color
+        """
+        if self._image is None:
+            self._image = pygame.Surface(self.rect.size)
+            self._image.fill(self.color)
+        return self._image
+    
+    @image.setter
+    def image(self, value):
+        self._image = value
+    
     def update_scale(self, current_width, current_height):
         """
         Update entity dimensions and position based on current screen resolution.
+        Does nothing if the entity is already scaled for this display epoch and resolution.
         
         Args:
             current_width (int): Current screen width
             current_height (int): Current screen height
+            
+        Returns:
+            bool: True if the entity was rescaled, False if nothing changed
         """
+        # Skip the rebuild if the display hasn't changed since the last scale
+        epoch = get_display_epoch()
+        resolution = (current_width, current_height)
+        if self.scale_epoch == epoch and self.scaled_resolution == resolution:
+            return False
+        
         # Scale dimensions and position
         scaled_pos = scale_position(
             self.original_x, self.original_y, 
@@ -99,14 +210,14 @@ class Entity(pygame.sprite.Sprite):
             current_width, current_height
         )
         
-        # Create new image with scaled dimensions
-        self.image = pygame.Surface([scaled_size[0], scaled_size[1]])
-        self.image.fill(self.color)
+        # Update rect and rebuild the image when next drawn if the size changed
+        if self.rect.size != tuple(scaled_size):
+            self._image = None
+        self.rect = pygame.Rect(scaled_pos[0], scaled_pos[1], scaled_size[0], scaled_size[1])
         
-        # Update rect
-        self.rect = self.image.get_rect()
-        self.rect.x = scaled_pos[0]
-        self.rect.y = scaled_pos[1]
+        self.scale_epoch = epoch
+        self.scaled_resolution = resolution
+        return True
         
     def take_damage(self, amount, damage_type="physical", attacker=None, battle_system=None):
         """
@@ -155,7 +266,10 @@ class Entity(pygame.sprite.Sprite):
         """
         Keep the entity within the screen boundaries.
         """
-        current_width, current_height = pygame.display.get_surface().get_size()
+        # Imported here: the systems package imports entities, so a
+        # module-level import would be circular
+        from systems.ui.render_target import get_render_size
+        current_width, current_height = get_render_size()
         
         if self.rect.x < 0:
             self.rect.x = 0
@@ -1,15 +1,36 @@
 """
 NPC class.
 """
+import math
 import pygame
 from entities.entity import Entity
 from constants import WHITE, SCREEN_WIDTH, SCREEN_HEIGHT, ORIGINAL_WIDTH, ORIGINAL_HEIGHT
 from utils.utils import scale_position, scale_dimensions
+from systems.ui.render_target import get_render_size
+
+# Movement behaviors
+BEHAVIOR_FOLLOW = "follow"  # Walk up to the player
+BEHAVIOR_PATROL = "patrol"  # Walk a loop of patrol points
+BEHAVIOR_FLEE = "flee"      # Keep away from the player
 
 class NPC(Entity):
     """
     Non-player character entity that can be interacted with.
     """
+    __slots__ = (
+        "dialogue", "interaction_distance",
+        # Movement
+        "behavior", "patrol_points", "patrol_index", "path", "path_version", "last_update",
+    )
+    
+    # Distance in pixels between centers for the player to interact
+    INTERACTION_DISTANCE = 80
+    
+    # Movement settings, in design pixels
+    WALK_SPEED = 60        # Pixels per second
+    FOLLOW_DISTANCE = 64   # Following NPCs stop this close to the player
+    FLEE_DISTANCE = 160    # Fleeing NPCs stop running this far from the player
+    
     def __init__(self, x, y, width=32, height=48, color=WHITE, name="NPC", dialogue=None):
         """
         Initialize an NPC.
@@ -26,7 +47,158 @@ class NPC(Entity):
         super().__init__(x, y, width, height, color)
         self.name = name
         self.dialogue = dialogue or ["Hello!"]
-        self.interaction_distance = 50  # Distance in pixels for interaction
+        self.interaction_distance = self.INTERACTION_DISTANCE  # Distance in pixels for interaction
+        
+        # Movement (static unless a behavior is set)
+        self.behavior = None
+        self.patrol_points = []   # (x, y) design pixel points to visit in order
+        self.patrol_index = 0
+        self.path = []            # Remaining cell centers to the current patrol point
+        self.path_version = None  # Collision version the path was found with
+        self.last_update = None   # Scheduler clock time of the last behavior update
+        
+    def set_behavior(self, behavior, patrol_points=None):
+        """
+        Set how this NPC moves around the map.
+        
+        Args:
+            behavior (str): BEHAVIOR_FOLLOW, BEHAVIOR_PATROL, BEHAVIOR_FLEE or None to stand still
+            patrol_points (list): (x, y) design pixel points for BEHAVIOR_PATROL
+        """
+        self.behavior = behavior
+        self.patrol_points = list(patrol_points or [])
+        self.patrol_index = 0
+        self.path = []
+        self.path_version = None
+        
+    def update_behavior(self, map_area, player, dt):
+        """
+        Take one frame's worth of movement for the current behavior.
+        
+        Args:
+            map_area: The map area the NPC is on
+            player: The player entity, or None if the player is on another map
+            dt (float): Seconds since this NPC was last updated
+        """
+        position = self.design_center()
+        
+        # Only patrols carry on without the player around
+        if player is None:
+            if self.behavior == BEHAVIOR_PATROL:
+                target = self.next_patrol_waypoint(map_area, position)
+                if target:
+                    self.move_toward(map_area, None, target, dt)
+            return
+        
+        player_position = (player.original_x + player.original_width / 2,
+                           player.original_y + player.original_height / 2)
+        dx = player_position[0] - position[0]
+        dy = player_position[1] - position[1]
+        player_distance = dx * dx + dy * dy
+        
+        target = None
+        if self.behavior == BEHAVIOR_FOLLOW:
+            if player_distance > self.FOLLOW_DISTANCE * self.FOLLOW_DISTANCE:
+                # Shares one distance field with every other NPC after the player
+                target = map_area.pathfinder.step_toward(position, player_position)
+        elif self.behavior == BEHAVIOR_FLEE:
+            if player_distance < self.FLEE_DISTANCE * self.FLEE_DISTANCE:
+                target = map_area.pathfinder.step_away(position, player_position)
+        elif self.behavior == BEHAVIOR_PATROL:
+            target = self.next_patrol_waypoint(map_area, position)
+        
+        if target:
+            self.move_toward(map_area, player, target, dt)
+            
+    def next_patrol_waypoint(self, map_area, position):
+        """
+        Get the next point to walk to on the patrol route.
+        
+        Args:
+            map_area: The map area the NPC is on
+            position (tuple): The NPC's center in design pixels
+            
+        Returns:
+            tuple: (x, y) design pixel waypoint, or None if there is nowhere to go
+        """
+        if not self.patrol_points:
+            return None
+        
+        # Plan the leg to the current patrol point once, and again if the walls changed
+        if not self.path or self.path_version != map_area.collision_version:
+            for _ in range(len(self.patrol_points)):
+                goal = self.patrol_points[self.patrol_index]
+                path = map_area.pathfinder.find_path(position, goal)
+                if path:
+                    self.path = path
+                    self.path_version = map_area.collision_version
+                    break
+                # Already there or unreachable, so head for the next point
+                self.patrol_index = (self.patrol_index + 1) % len(self.patrol_points)
+            else:
+                return None
+        
+        # Drop waypoints that have been reached
+        waypoint = self.path[0]
+        if abs(waypoint[0] - position[0]) < 1 and abs(waypoint[1] - position[1]) < 1:
+            self.path.pop(0)
+            if not self.path:
+                self.patrol_index = (self.patrol_index + 1) % len(self.patrol_points)
+                return None
+            waypoint = self.path[0]
+        return waypoint
+        
+    def design_center(self):
+        """
+        Get the NPC's center at the original resolution.
+        
+        Returns:
+            tuple: (x, y) in design pixels
+        """
+        return (self.original_x + self.original_width / 2,
+                self.original_y + self.original_height / 2)
+        
+    def move_toward(self, map_area, player, target, dt):
+        """
+        Walk toward a point, unless something is in the way.
+        
+        Args:
+            map_area: The map area the NPC is on
+            player: The player entity (NPCs don't walk through the player), or None
+            target (tuple): (x, y) design pixel point to walk toward
+            dt (float): Seconds since the last frame
+            
+        Returns:
+            bool: True if the NPC moved, False if it was blocked
+        """
+        center_x, center_y = self.design_center()
+        dx = target[0] - center_x
+        dy = target[1] - center_y
+        distance = math.hypot(dx, dy)
+        if distance == 0:
+            return False
+        
+        # Don't overshoot the target
+        step = min(self.WALK_SPEED * dt, distance)
+        new_x = self.original_x + dx / distance * step
+        new_y = self.original_y + dy / distance * step
+        
+        # Try the move at the current resolution
+        current_width, current_height = get_render_size()
+        scaled_x, scaled_y = scale_position(new_x, new_y, ORIGINAL_WIDTH, ORIGINAL_HEIGHT,
+                                            current_width, current_height)
+        moved_rect = self.rect.copy()
+        moved_rect.topleft = (scaled_x, scaled_y)
+        if ((player is not None and moved_rect.colliderect(player.rect)) or
+                map_area.is_blocked(moved_rect) or
+                map_area.spatial_index.first_colliding(moved_rect, exclude=self)):
+            return False
+        
+        self.original_x = new_x
+        self.original_y = new_y
+        self.rect = moved_rect
+        map_area.entity_moved(self)
+        return True
         
     def can_interact(self, player):
         """
@@ -38,15 +210,12 @@ class NPC(Entity):
         Returns:
             bool: True if interaction is possible, False otherwise
         """
-        # Calculate distance between player and NPC
+        # Calculate distance between player and NPC (squared, no square root needed)
         dx = self.rect.centerx - player.rect.centerx
         dy = self.rect.centery - player.rect.centery
-        distance = (dx**2 + dy**2)**0.5
-        
-        interaction_distance = 80
         
         # Check if player is close enough
-        if distance > interaction_distance:
+        if dx * dx + dy * dy > self.interaction_distance * self.interaction_distance:
             return False
             
         # Check if player is approximately facing the NPC
@@ -12,6 +12,8 @@ class PartyRecruiter(NPC):
     """
     Special NPC for recruiting and managing party members.
     """
+    __slots__ = ("party", "character_creator", "ui", "show_party_ui")
+    
     def __init__(self, x, y, width=32, height=48, color=WHITE, party=None):
         """
         Initialize the party recruiter.
@@ -10,11 +10,19 @@ from systems.abilities.skill_system import SkillSet
 from systems.abilities.ultimate_system import UltimateSet
 from systems.abilities.passive_system import PassiveSet
 from utils.utils import scale_position, scale_dimensions
+from systems.ui.render_target import get_render_size
+from core.replay import get_pressed
 
 class Player(Entity):
     """
     Player character controllable by the user.
     """
+    __slots__ = (
+        "base_speed", "speed", "facing",                        # Movement
+        "experience", "max_level", "defending",                 # Progression and battle state
+        "inventory", "spellbook", "skillset", "ultimates", "passives",
+    )
+    
     def __init__(self, x, y, character_class=None, level=1, name="Hero"):
         """
         Initialize the player.
@@ -93,9 +101,13 @@ class Player(Entity):
         Args:
             current_width (int): Current screen width
             current_height (int): Current screen height
+            
+        Returns:
+            bool: True if the player was rescaled, False if nothing changed
         """
         # Call the parent class update_scale method
-        super().update_scale(current_width, current_height)
+        if not super().update_scale(current_width, current_height):
+            return False
         
         # Scale the movement speed based on resolution
         width_scale = current_width / ORIGINAL_WIDTH
@@ -104,23 +116,26 @@ class Player(Entity):
         
         # Adjust speed proportionally to resolution
         self.speed = max(1, int(self.base_speed * scale_factor))
+        return True
         
-    def update(self, current_map=None):
+    def update(self, current_map=None, keys=None):
         """
         Update the player's state and position with map boundary checks.
         
         Args:
             current_map: The current map for boundary checking
+            keys: Keyboard state (read from the current input source if not given)
         """
         # Get current screen dimensions
-        current_width, current_height = pygame.display.get_surface().get_size()
+        current_width, current_height = get_render_size()
         
         # Store the current position to revert if there's a collision
         previous_x = self.rect.x
         previous_y = self.rect.y
         
         # Get keyboard input
-        keys = pygame.key.get_pressed()
+        if keys is None:
+            keys = get_pressed()
         
         # Calculate boundary line thickness and buffer zone
         line_thickness = max(1, int(5 * (current_width / ORIGINAL_WIDTH)))
@@ -153,11 +168,9 @@ class Player(Entity):
         
         # Check for NPC collisions after horizontal movement
         if current_map and moved_x:
-            for npc in current_map.npcs:
-                if self.rect.colliderect(npc.rect):
-                    # Reset only the x-position if collision occurred after x-movement
-                    self.rect.x = previous_x
-                    break
+            if current_map.colliding_npc(self.rect) or current_map.is_blocked(self.rect):
+                # Reset only the x-position if collision occurred after x-movement
+                self.rect.x = previous_x
         
         # Handle vertical movement
         if keys[pygame.K_UP] and (not current_map or self.rect.top > buffer_zone or current_map.connections["north"]):
@@ -182,11 +195,9 @@ class Player(Entity):
         
         # Check for NPC collisions after vertical movement
         if current_map and moved_y:
-            for npc in current_map.npcs:
-                if self.rect.colliderect(npc.rect):
-                    # Reset only the y-position if collision occurred after y-movement
-                    self.rect.y = previous_y
-                    break
+            if current_map.colliding_npc(self.rect) or current_map.is_blocked(self.rect):
+                # Reset only the y-position if collision occurred after y-movement
+                self.rect.y = previous_y
         
         # Update original position to track where we are
         scale_factor_x = ORIGINAL_WIDTH / current_width
@@ -199,7 +210,7 @@ class Player(Entity):
         Reset to center of screen after battle.
         """
         # Get current screen dimensions
-        current_width, current_height = pygame.display.get_surface().get_size()
+        current_width, current_height = get_render_size()
         
         # Set position to center of current screen
         self.rect.x = current_width // 2
@@ -321,9 +332,8 @@ class Player(Entity):
         # Apply the spell effect based on type
         if spell.effect_type == "damage" and target:
             # Calculate magic damage using INT and spell power
-            from systems.battle.battle_system import BattleSystem
-            battle_system = BattleSystem(self, target, "FAST")  # Temporary instance just for calculation
-            damage = battle_system.calculate_magic_damage(self, target, spell.base_power)
+            from systems.battle.battle_mechanics import BattleMechanics
+            damage = BattleMechanics().calculate_magic_damage(self, target, spell.base_power)
             
             # Apply damage to target
             target.take_damage(damage)
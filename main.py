@@ -3,7 +3,8 @@ Main entry point for the RPG game.
 """
 import pygame
 import sys
-import random
+import time
+import argparse
 from constants import (
     BLACK, WHITE, GREEN, RED, GRAY, BLUE, YELLOW, PURPLE, SCREEN_WIDTH, SCREEN_HEIGHT,
     ORIGINAL_WIDTH, ORIGINAL_HEIGHT, 
@@ -18,16 +19,27 @@ from core.map_initialization import initialize_maps
 from game_states import GameStateManager
 from entities.player import Player
 from entities.enemy import Enemy
+from entities.bestiary import bestiary
 from entities.party_recruiter import PartyRecruiter
 from systems.battle.battle_system import BattleSystem
 from systems.battle.battle_ui_helpers import draw_enemy_name_tags, draw_enemy_health_bars, draw_turn_order_indicator
 from systems.battle.battle_visualizer import draw_battle_background, BattleVisualizer
 from systems.battle.battle_targeting import TargetingSystem
+from systems.battle.effect_atlas import effect_atlas
 from systems.inventory.inventory import get_item_effect
 from systems.map.map_system import MapSystem, MapArea
 from systems.ui.dialogue_system import DialogueSystem
+from systems.ui import draw
+from systems.ui.font_manager import font_manager
+from systems.ui.text_cache import render_text, text_cache
+from systems.ui.dirty_rect_renderer import DirtyRectRenderer
+from systems.ui.overlay import draw_overlay, clear_overlays, menu_backdrop
+from systems.ui.render_target import create_render_target, get_render_target
 from systems.settings_manager import SettingsManager
 from core.game_initialization import initialize_party, create_party_recruiter
+from core.replay import (ReplayRecorder, ReplayPlayer, set_input_source,
+                         get_events, get_pressed, frame_time)
+from utils.rng import get_stream, EFFECTS_STREAM
 import utils.utils as utils
 from utils.utils import scale_position, scale_dimensions, scale_font_size
 
@@ -56,9 +68,24 @@ def apply_display_settings(settings_manager, map_system=None):
     # Apply the new display settings
     screen = pygame.display.set_mode((width, height), flags)
     
-    # If we have a map system, update all entities in all maps
+    # Cached fonts, text and effect frames were sized for the old resolution
+    font_manager.clear()
+    text_cache.clear()
+    clear_overlays()
+    effect_atlas.clear()
+    
+    # Let scaled entities know the display changed
+    utils.bump_display_epoch()
+    
+    # In logical render mode everything is drawn at the original resolution,
+    # so entities don't need rescaling
+    if get_render_target() is not None:
+        return screen
+    
+    # If we have a map system, update the entities in the resident maps
+    # (maps built later are scaled when they are first drawn)
     if map_system and hasattr(map_system, 'maps'):
-        # Get all maps
+        # Get the maps that are currently built
         for map_id, map_area in map_system.maps.items():
             # Scale all entities in this map
             for entity in map_area.entities:
@@ -349,7 +376,7 @@ def handle_input(event, state_manager, battle_system, player, map_system,
                         
                 # Check if battle has ended and player pressed ENTER to continue
                 if battle_system and battle_system.battle_over and battle_system.message_index >= len(battle_system.full_message):
-                    keys = pygame.key.get_pressed()
+                    keys = get_pressed()
                     if keys[pygame.K_RETURN]:
                         # Only remove enemy if player won (not if they fled)
                         if battle_system.victory:
@@ -359,7 +386,8 @@ def handle_input(event, state_manager, battle_system, player, map_system,
                         # Return to world map
                         state_manager.change_state(WORLD_MAP)
                         player.reset_position()
-                        # Set battle_system to None
+                        # Return the enemies to the pool and set battle_system to None
+                        bestiary.release(battle_system.enemies)
                         battle_system = None
                         
                         # This None value will be returned and assigned in the main loop
@@ -454,10 +482,8 @@ def draw_settings_menu(screen, settings_manager, selected_settings_option, font)
         # Get current screen dimensions
         current_width, current_height = screen.get_size()
         
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((current_width, current_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # Semi-transparent black (50% opacity)
-        screen.blit(overlay, (0, 0))
+        # Draw semi-transparent overlay (50% opacity)
+        draw_overlay(screen, alpha=128)
         
         # Scale menu position and size
         menu_x, menu_y = scale_position(SCREEN_WIDTH//2, 200, ORIGINAL_WIDTH, ORIGINAL_HEIGHT, current_width, current_height)
@@ -465,44 +491,44 @@ def draw_settings_menu(screen, settings_manager, selected_settings_option, font)
         option_spacing = int(40 * (current_height / ORIGINAL_HEIGHT))
         
         # Draw settings menu title
-        menu_title = font.render("SETTINGS", True, WHITE)
+        menu_title = render_text(font, "SETTINGS", WHITE)
         title_x = menu_x - menu_title.get_width()//2
         screen.blit(menu_title, (title_x, menu_y))
         
         # Draw TEXT SPEED option with current setting
         current_speed = settings_manager.get_text_speed()
         if selected_settings_option == 0:
-            option_text = font.render(f"> TEXT SPEED: {current_speed}", True, WHITE)
+            option_text = render_text(font, f"> TEXT SPEED: {current_speed}", WHITE)
         else:
-            option_text = font.render(f"  TEXT SPEED: {current_speed}", True, GRAY)
+            option_text = render_text(font, f"  TEXT SPEED: {current_speed}", GRAY)
         screen.blit(option_text, (option_x, option_y_base))
         
         # Draw RESOLUTION option with current setting
         current_res = settings_manager.settings["resolution"]
         if selected_settings_option == 1:
-            option_text = font.render(f"> RESOLUTION: {current_res}", True, WHITE)
+            option_text = render_text(font, f"> RESOLUTION: {current_res}", WHITE)
         else:
-            option_text = font.render(f"  RESOLUTION: {current_res}", True, GRAY)
+            option_text = render_text(font, f"  RESOLUTION: {current_res}", GRAY)
         screen.blit(option_text, (option_x, option_y_base + option_spacing))
         
         # Draw DISPLAY MODE option with current setting
         current_mode = settings_manager.get_display_mode()
         if selected_settings_option == 2:
-            option_text = font.render(f"> DISPLAY MODE: {current_mode}", True, WHITE)
+            option_text = render_text(font, f"> DISPLAY MODE: {current_mode}", WHITE)
         else:
-            option_text = font.render(f"  DISPLAY MODE: {current_mode}", True, GRAY)
+            option_text = render_text(font, f"  DISPLAY MODE: {current_mode}", GRAY)
         screen.blit(option_text, (option_x, option_y_base + option_spacing * 2))
         
         # Draw BACK option
         if selected_settings_option == 3:
-            option_text = font.render(f"> BACK", True, WHITE)
+            option_text = render_text(font, f"> BACK", WHITE)
         else:
-            option_text = font.render(f"  BACK", True, GRAY)
+            option_text = render_text(font, f"  BACK", GRAY)
         screen.blit(option_text, (option_x, option_y_base + option_spacing * 3))
     except Exception as e:
         print(f"Error drawing settings menu: {e}")
         # Draw a simple error message if something goes wrong
-        error_msg = font.render("Error drawing settings menu.", True, WHITE)
+        error_msg = render_text(font, "Error drawing settings menu.", WHITE)
         screen.blit(error_msg, (50, 50))
 
 def draw_game(screen, state_manager, battle_system, map_system,
@@ -519,6 +545,9 @@ def draw_game(screen, state_manager, battle_system, map_system,
         # Draw the current map, which handles all entities
         current_map = map_system.get_current_map()
         current_map.draw(screen)
+        
+        # Menus were closed, so the next one needs a fresh backdrop
+        menu_backdrop.invalidate()
     
     elif state_manager.is_dialogue:
         # First draw the map, then draw dialogue on top
@@ -533,30 +562,27 @@ def draw_game(screen, state_manager, battle_system, map_system,
             
     # Draw menu states (using helper functions)
     elif state_manager.is_pause:
-        # Draw the base state first
+        # Draw the dimmed map behind the menu
         current_map = map_system.get_current_map()
-        current_map.draw(screen)
+        menu_backdrop.draw(screen, (state_manager.current_state, current_map), current_map.draw)
         
-        # Draw the pause menu overlay
-        _draw_overlay(screen)
+        # Draw the pause menu
         _draw_pause_menu(screen, selected_pause_option, font)
             
     elif state_manager.is_settings:
-        # Draw the base state first
+        # Draw the dimmed map behind the menu
         current_map = map_system.get_current_map()
-        current_map.draw(screen)
+        menu_backdrop.draw(screen, (state_manager.current_state, current_map), current_map.draw)
         
-        # Draw the settings menu overlay
-        _draw_overlay(screen)
+        # Draw the settings menu
         _draw_settings_menu(screen, selected_settings_option, text_speed_setting, font)
         
     elif state_manager.is_inventory:
-        # Draw the base state first
+        # Draw the dimmed map behind the menu
         current_map = map_system.get_current_map()
-        current_map.draw(screen)
+        menu_backdrop.draw(screen, (state_manager.current_state, current_map), current_map.draw)
         
-        # Draw the inventory menu overlay
-        _draw_overlay(screen)
+        # Draw the inventory menu
         # Get player from the current map
         player = None
         for entity in current_map.entities:
@@ -568,9 +594,9 @@ def draw_game(screen, state_manager, battle_system, map_system,
             _draw_inventory(screen, player, selected_inventory_option, inventory_mode, font)
     
     elif state_manager.is_party_management:
-       # Draw the base state first
+       # Draw the map behind the menu (the party UI dims it itself)
        current_map = map_system.get_current_map()
-       current_map.draw(screen)
+       menu_backdrop.draw(screen, (state_manager.current_state, current_map), current_map.draw, alpha=None)
        
        # Draw party management UI
        for npc in current_map.npcs:
@@ -588,57 +614,46 @@ def _draw_base_state(screen, state_manager, battle_system, enemies, map_system):
 
 def _draw_overlay(screen):
     """Draw a semi-transparent overlay for menus."""
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 128))  # Semi-transparent black
-    screen.blit(overlay, (0, 0))
+    draw_overlay(screen, (0, 0, 0), 128)  # Semi-transparent black
 
 def _draw_pause_menu(screen, selected_pause_option, font):
     """Draw the pause menu."""
-    # Add the overlay
-    _draw_overlay(screen)
-    
     # Draw menu title
-    menu_title = font.render("PAUSE", True, WHITE)
+    menu_title = render_text(font, "PAUSE", WHITE)
     screen.blit(menu_title, (SCREEN_WIDTH//2 - menu_title.get_width()//2, 200))
     
     # Draw menu options
     for i, option in enumerate(PAUSE_OPTIONS):
         if i == selected_pause_option:
-            option_text = font.render(f"> {option}", True, WHITE)
+            option_text = render_text(font, f"> {option}", WHITE)
         else:
-            option_text = font.render(f"  {option}", True, GRAY)
+            option_text = render_text(font, f"  {option}", GRAY)
         screen.blit(option_text, (SCREEN_WIDTH//2 - 50, 250 + i*40))
 
 def _draw_settings_menu(screen, selected_settings_option, text_speed_setting, font):
     """Draw the settings menu."""
-    # Add the overlay
-    _draw_overlay(screen)
-    
     # Draw menu title
-    menu_title = font.render("SETTINGS", True, WHITE)
+    menu_title = render_text(font, "SETTINGS", WHITE)
     screen.blit(menu_title, (SCREEN_WIDTH//2 - menu_title.get_width()//2, 200))
     
     # Draw TEXT SPEED option with current setting
     if selected_settings_option == 0:
-        option_text = font.render(f"> TEXT SPEED: {text_speed_setting}", True, WHITE)
+        option_text = render_text(font, f"> TEXT SPEED: {text_speed_setting}", WHITE)
     else:
-        option_text = font.render(f"  TEXT SPEED: {text_speed_setting}", True, GRAY)
+        option_text = render_text(font, f"  TEXT SPEED: {text_speed_setting}", GRAY)
     screen.blit(option_text, (SCREEN_WIDTH//2 - 100, 250))
     
     # Draw BACK option
     if selected_settings_option == 1:
-        option_text = font.render(f"> {SETTINGS_OPTIONS[1]}", True, WHITE)
+        option_text = render_text(font, f"> {SETTINGS_OPTIONS[1]}", WHITE)
     else:
-        option_text = font.render(f"  {SETTINGS_OPTIONS[1]}", True, GRAY)
+        option_text = render_text(font, f"  {SETTINGS_OPTIONS[1]}", GRAY)
     screen.blit(option_text, (SCREEN_WIDTH//2 - 100, 290))
 
 def _draw_inventory(screen, player, selected_inventory_option, inventory_mode, font):
     """Draw the inventory menu."""
-    # Add the overlay
-    _draw_overlay(screen)
-    
     # Draw menu title
-    menu_title = font.render("INVENTORY", True, WHITE)
+    menu_title = render_text(font, "INVENTORY", WHITE)
     screen.blit(menu_title, (SCREEN_WIDTH//2 - menu_title.get_width()//2, 150))
     
     # Get item names and add BACK option
@@ -646,11 +661,11 @@ def _draw_inventory(screen, player, selected_inventory_option, inventory_mode, f
     options = item_names + ["BACK"]
     
     # Draw inventory header
-    header_text = font.render("ITEM           QTY   DESCRIPTION", True, WHITE)
+    header_text = render_text(font, "ITEM           QTY   DESCRIPTION", WHITE)
     screen.blit(header_text, (SCREEN_WIDTH//2 - 200, 190))
     
     # Draw horizontal line under header
-    pygame.draw.line(screen, WHITE, (SCREEN_WIDTH//2 - 200, 220), (SCREEN_WIDTH//2 + 200, 220))
+    draw.line(screen, WHITE, (SCREEN_WIDTH//2 - 200, 220), (SCREEN_WIDTH//2 + 200, 220))
     
     # Draw each item with quantity and description
     for i, item_name in enumerate(item_names):
@@ -660,15 +675,15 @@ def _draw_inventory(screen, player, selected_inventory_option, inventory_mode, f
         
         # Prepare display text with highlighted selection
         if i == selected_inventory_option:
-            name_text = font.render(f"> {item_name}", True, WHITE)
+            name_text = render_text(font, f"> {item_name}", WHITE)
         else:
-            name_text = font.render(f"  {item_name}", True, GRAY)
+            name_text = render_text(font, f"  {item_name}", GRAY)
             
         # Draw item name
         screen.blit(name_text, (SCREEN_WIDTH//2 - 200, 230 + i*30))
         
         # Draw quantity
-        qty_text = font.render(f"{quantity:2d}", True, GRAY if i != selected_inventory_option else WHITE)
+        qty_text = render_text(font, f"{quantity:2d}", GRAY if i != selected_inventory_option else WHITE)
         screen.blit(qty_text, (SCREEN_WIDTH//2 - 50, 230 + i*30))
         
         # Draw description (truncated if needed)
@@ -676,27 +691,53 @@ def _draw_inventory(screen, player, selected_inventory_option, inventory_mode, f
             desc = item.description
             if len(desc) > 30:
                 desc = desc[:27] + "..."
-            desc_text = font.render(desc, True, GRAY if i != selected_inventory_option else WHITE)
+            desc_text = render_text(font, desc, GRAY if i != selected_inventory_option else WHITE)
             screen.blit(desc_text, (SCREEN_WIDTH//2 - 25, 230 + i*30))
     
     # Draw BACK option
     if len(options) - 1 == selected_inventory_option:
-        back_text = font.render(f"> BACK", True, WHITE)
+        back_text = render_text(font, f"> BACK", WHITE)
     else:
-        back_text = font.render(f"  BACK", True, GRAY)
+        back_text = render_text(font, f"  BACK", GRAY)
     screen.blit(back_text, (SCREEN_WIDTH//2 - 200, 230 + len(item_names)*30))
     
     # Draw context-sensitive help
     if inventory_mode == "pause":
-        help_text = font.render("Select an item to use outside of battle", True, YELLOW)
+        help_text = render_text(font, "Select an item to use outside of battle", YELLOW)
     else:
-        help_text = font.render("Select an item to use in battle", True, YELLOW)
+        help_text = render_text(font, "Select an item to use in battle", YELLOW)
     screen.blit(help_text, (SCREEN_WIDTH//2 - 200, 230 + (len(options) + 1)*30))
 
+def parse_args():
+    """
+    Parse the command line.
+    
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="My RPG Game")
+    parser.add_argument("--record", metavar="FILE",
+                        help="Record input and random seeds to a replay file")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="Play back a replay file at an uncapped frame rate and report FPS")
+    return parser.parse_args()
+
 def main():
     """Main function to run the game."""
+    args = parse_args()
+    
     # Initialize Pygame
     pygame.init()
+    
+    # Choose the input source before anything draws from the random streams
+    input_source = None
+    if args.replay:
+        input_source = ReplayPlayer(args.replay)
+    elif args.record:
+        input_source = ReplayRecorder(args.record)
+    if input_source:
+        set_input_source(input_source)
+    replaying = isinstance(input_source, ReplayPlayer)
 
     # Initialize settings manager
     settings_manager = SettingsManager()
@@ -705,9 +746,12 @@ def main():
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("My RPG Game")
     
+    # Draw to a logical surface and scale once per frame if enabled
+    render_target = create_render_target(settings_manager.get_render_mode())
+    
     # Initialize fonts
     pygame.font.init()
-    font = pygame.font.SysFont('Arial', 24)
+    font = font_manager.get_font(24, scaled=False)
     
     # Clock for controlling the frame rate
     clock = pygame.time.Clock()
@@ -738,11 +782,19 @@ def main():
     # Battle system (will be initialized when battle starts)
     battle_system = None
     
+    # Optional renderer that only pushes changed regions on the world map
+    dirty_rect_renderer = None
+    if settings_manager.get_dirty_rect_rendering() and render_target is None:
+        dirty_rect_renderer = DirtyRectRenderer()
+    
     # Main game loop
+    frames = 0
+    start_time = time.perf_counter()
+    dt = 1 / 60  # Seconds the last frame took
     running = True
     while running:
         # Process events
-        for event in pygame.event.get():
+        for event in get_events():
             if event.type == pygame.QUIT:
                 running = False
                 
@@ -758,13 +810,12 @@ def main():
             # Handle ENTER key for interactions (dialogue, etc.)
             if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
                 if state_manager.is_world_map:
-                    # Check for nearby NPCs
+                    # Check for a nearby NPC to talk to
                     current_map = map_system.get_current_map()
-                    for npc in current_map.npcs:
-                        if npc.can_interact(player):
-                            npc.interact(dialogue_system)
-                            state_manager.change_state(DIALOGUE)
-                            break
+                    npc = current_map.find_interactable(player)
+                    if npc:
+                        npc.interact(dialogue_system)
+                        state_manager.change_state(DIALOGUE)
                 elif state_manager.is_dialogue:
                     if not dialogue_system.advance_dialogue():
                         state_manager.return_to_previous()
@@ -794,21 +845,33 @@ def main():
         
         # Update game logic based on current state
         if state_manager.is_world_map:
+            # Release prefetched maps the player has turned away from
+            map_system.poll_prefetch()
+            
             # Get the current map
             current_map = map_system.get_current_map()
             
             # Update player with current map for boundary checking
             player.update(current_map)  # Removed enemy collision detection parameter
+            
+            # Time step for this frame (recorded or replayed)
+            step_dt = frame_time(dt)
+            
+            # Move NPCs, spreading the work over frames by distance to the player
+            map_system.update_npcs(player, step_dt)
 
             # Check for map transitions or random encounters
-            map_update_result = current_map.update(player, map_system.encounter_manager)
+            map_update_result = current_map.update(player, map_system.encounter_manager,
+                                                   dt=step_dt)
             
             if isinstance(map_update_result, list):
                 # We got a list of enemies - trigger battle
                 encountered_enemies = map_update_result
                 # Switch to battle state
                 state_manager.change_state(BATTLE)
-                battle_system = BattleSystem(party, encountered_enemies, text_speed_setting)
+                # Seed the background per encounter so it stays stable for the battle
+                battle_system = BattleSystem(party, encountered_enemies, text_speed_setting,
+                                             background_seed=get_stream(EFFECTS_STREAM).getrandbits(32))
             elif map_update_result:
                 # Map transition
                 new_map, entry_side = map_update_result
@@ -816,11 +879,12 @@ def main():
             
             # Check if battle is over and return to world map
             if battle_system is not None and battle_system.battle_over and battle_system.message_index >= len(battle_system.full_message):
-                keys = pygame.key.get_pressed()
+                keys = get_pressed()
                 if keys[pygame.K_RETURN]:
                     # Return to world map
                     state_manager.change_state(WORLD_MAP)
                     player.reset_position()
+                    bestiary.release(battle_system.enemies)
                     battle_system = None
             
         elif state_manager.is_dialogue:
@@ -845,7 +909,7 @@ def main():
                     
             if recruiter:
                 # Handle party UI events
-                for event in pygame.event.get():
+                for event in get_events():
                     if event.type == pygame.QUIT:
                         running = False
                     elif recruiter.update(event):
@@ -859,24 +923,61 @@ def main():
             
             # Check if battle is over
             if battle_system and battle_system.battle_over and battle_system.message_index >= len(battle_system.full_message):
-                keys = pygame.key.get_pressed()
+                keys = get_pressed()
                 if keys[pygame.K_RETURN]:
                     # Return to world map
                     state_manager.change_state(WORLD_MAP)
                     player.reset_position()
+                    bestiary.release(battle_system.enemies)
                     battle_system = None
         
         # Draw the current game state
-        draw_game(
-            screen, state_manager, battle_system, map_system,
-            selected_pause_option, selected_settings_option, text_speed_setting,
-            selected_inventory_option, inventory_mode, font, settings_manager,
-            dialogue_system
-        )
+        screen = pygame.display.get_surface()
+        draw_surface = render_target.surface if render_target else screen
+        if dirty_rect_renderer and (state_manager.is_world_map or state_manager.is_dialogue):
+            # Only the changed regions are redrawn and pushed to the display
+            dirty_rect_renderer.render(screen, map_system.get_current_map(),
+                                       state_manager.current_state, dialogue_system)
+            menu_backdrop.invalidate()
+        else:
+            draw_game(
+                draw_surface, state_manager, battle_system, map_system,
+                selected_pause_option, selected_settings_option, text_speed_setting,
+                selected_inventory_option, inventory_mode, font, settings_manager,
+                dialogue_system
+            )
+            
+            # Scale the logical surface to the window, or just flip
+            if render_target:
+                render_target.present(screen)
+            else:
+                pygame.display.flip()
+            
+            # Other states draw over the map, so redraw it fully when we return
+            if dirty_rect_renderer:
+                dirty_rect_renderer.invalidate()
         
-        # Flip the display and maintain frame rate
-        pygame.display.flip()
-        clock.tick(60)
+        # Replays run as fast as possible for benchmarking
+        frames += 1
+        if input_source:
+            input_source.end_frame()
+        if replaying:
+            dt = clock.tick() / 1000
+            if input_source.finished:
+                running = False
+        else:
+            # Maintain frame rate
+            dt = clock.tick(60) / 1000
+    
+    if input_source:
+        input_source.close()
+    if replaying:
+        elapsed = time.perf_counter() - start_time
+        print(f"Replayed {frames} frames in {elapsed:.2f}s ({frames / elapsed:.1f} FPS)")
+        print(map_system.npc_scheduler.summary())
+    
+    # Stop background map loading
+    map_system.close()
     
     # Save settings and quit
     settings_manager.save_settings()
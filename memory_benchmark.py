@@ -0,0 +1,119 @@
+"""
+Entity memory benchmark for the RPG game.
+Builds a crowd of enemies and reserve characters and reports how much
+memory each instance takes, and how much the slotted attribute layout
+saves over keeping the same attributes in a per-instance __dict__, e.g.:
+
+    python memory_benchmark.py --enemies 10000 --characters 1000
+"""
+import argparse
+import copy
+import tracemalloc
+
+# systems goes first: entities.player imports from systems, whose
+# package __init__ imports entities.player back
+from systems.character.character_creator import CharacterCreator
+from systems.map.encounter_system import EnemySpec
+from entities.enemy import Enemy
+
+class _DictLayout:
+    """Plain object used to measure the same attributes kept in a __dict__."""
+    pass
+
+def slot_names(cls):
+    """
+    List every slot an entity class declares, including inherited ones.
+
+    Args:
+        cls: The entity class
+
+    Returns:
+        list: Slot names
+    """
+    names = []
+    for klass in reversed(cls.__mro__):
+        names.extend(getattr(klass, "__slots__", ()))
+    return names
+
+def traced_bytes(build, count):
+    """
+    Measure the memory allocated by building objects.
+
+    Args:
+        build: Callable taking an index and returning a new object
+        count (int): Number of objects to build
+
+    Returns:
+        tuple: (objects, bytes allocated and still held)
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return objects, after - before
+
+def layout_bytes(instances):
+    """
+    Compare the per-instance container cost of slots against a __dict__.
+
+    Both copies point at the same attribute values, so only the instance
+    layout itself is measured.
+
+    Args:
+        instances (list): Entities of one class
+
+    Returns:
+        tuple: (bytes per slotted instance, bytes per __dict__ instance)
+    """
+    names = [name for name in slot_names(type(instances[0])) if hasattr(instances[0], name)]
+
+    def as_dict_layout(i):
+        copy_ = _DictLayout()
+        copy_.__dict__.update({name: getattr(instances[i], name) for name in names})
+        return copy_
+
+    count = len(instances)
+    _, slotted = traced_bytes(lambda i: copy.copy(instances[i]), count)
+    _, with_dict = traced_bytes(as_dict_layout, count)
+    return slotted / count, with_dict / count
+
+def report(label, build, count):
+    """
+    Build instances and print their memory use.
+
+    Args:
+        label (str): What is being built
+        build: Callable taking an index and returning a new entity
+        count (int): Number of entities to build
+    """
+    instances, total = traced_bytes(build, count)
+    slotted, with_dict = layout_bytes(instances)
+    saved = with_dict - slotted
+    print(f"{count} {label}: {total / count:.0f} B per instance in total "
+          f"({total / 1024 / 1024:.1f} MiB)")
+    print(f"    layout: {slotted:.0f} B slotted vs {with_dict:.0f} B with __dict__, "
+          f"saves {saved:.0f} B per instance ({saved * count / 1024 / 1024:.1f} MiB)")
+
+def main():
+    """Parse the command line and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Measure per-instance entity memory.")
+    parser.add_argument("--enemies", type=int, default=10000, help="Enemies to build")
+    parser.add_argument("--characters", type=int, default=1000,
+                        help="Reserve party characters to build")
+    parser.add_argument("--enemy-class", default="rat", help="Monster class of the enemies")
+    parser.add_argument("--character-class", default="warrior",
+                        help="Class of the reserve characters")
+    args = parser.parse_args()
+
+    spec = EnemySpec(args.enemy_class, 5)
+    report("enemies", lambda i: Enemy.create_from_spec(spec, 0, 0, unique_id=i + 1),
+           args.enemies)
+
+    creator = CharacterCreator()
+    report("reserve characters",
+           lambda i: creator.create_character(f"Reserve {i + 1}", args.character_class, 5),
+           args.characters)
+
+if __name__ == "__main__":
+    main()
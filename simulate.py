@@ -0,0 +1,268 @@
+"""
+Monte Carlo battle simulator for the RPG game.
+Runs many headless battles between a party and an encounter pool and reports
+balance statistics, e.g.:
+
+    python simulate.py warrior:5,mage:3 rat_pool -n 20000
+"""
+import argparse
+import math
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from constants import ATTACK_ANIMATION_DURATION, ACTION_DELAY_DURATION
+from data.encounter_pools import initialize_encounter_pools
+from entities.enemy import Enemy
+from systems.battle.battle_core import BattleCore
+from systems.character.character_creator import CharacterCreator
+
+# z-score for 95% confidence intervals
+Z_95 = 1.96
+
+# On-screen time of one battle turn at 60 fps (attack animation + delay before the next turn)
+DEFAULT_SECONDS_PER_TURN = (ATTACK_ANIMATION_DURATION + ACTION_DELAY_DURATION) / 60
+
+# Encounter manager for the worker process, built on first use
+_encounter_manager = None
+
+def parse_party_spec(spec):
+    """
+    Parse a party spec such as "warrior:5,mage:3".
+
+    Args:
+        spec (str): Comma separated class_id:level pairs (level defaults to 1)
+
+    Returns:
+        list: (class_id, level) tuples
+    """
+    available_classes = CharacterCreator().available_classes
+    members = []
+    for entry in spec.split(","):
+        class_id, _, level = entry.strip().partition(":")
+        if class_id not in available_classes:
+            raise argparse.ArgumentTypeError(
+                f"Unknown class '{class_id}' (choose from {', '.join(available_classes)})")
+        try:
+            level = int(level) if level else 1
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid level in '{entry}'")
+        members.append((class_id, level))
+    return members
+
+def get_encounter_pool(pool_id):
+    """
+    Look up an encounter pool by pool id or by the id of a map it is assigned to.
+
+    Args:
+        pool_id (str): Pool id (e.g. "rat_pool") or map id (e.g. "east")
+
+    Returns:
+        EncounterPool: The pool, or None if not found
+    """
+    global _encounter_manager
+    if _encounter_manager is None:
+        _encounter_manager = initialize_encounter_pools()
+    pool = _encounter_manager.pools.get(pool_id)
+    if pool is None:
+        pool = _encounter_manager.get_pool_for_map(pool_id)
+    return pool
+
+def simulate_battle(party_spec, pool_id, seed, index):
+    """
+    Run a single battle with a fresh party.
+
+    Args:
+        party_spec (list): (class_id, level) tuples
+        pool_id (str): Encounter pool to draw the enemies from
+        seed (int): Base seed of the whole run
+        index (int): Index of this battle in the run
+
+    Returns:
+        BattleResult: The outcome of the battle
+    """
+    # Each battle gets its own stream, so results don't depend on the worker count
+    rng = random.Random(f"{seed}:{index}")
+
+    creator = CharacterCreator()
+    party = [creator.create_character(f"{class_id.title()} {i + 1}", class_id, level)
+             for i, (class_id, level) in enumerate(party_spec)]
+
+    enemy_specs = get_encounter_pool(pool_id).generate_encounter(rng)
+    multiple = len(enemy_specs) > 1
+    enemies = [Enemy.create_from_spec(spec, 0, 0, unique_id=i + 1 if multiple else None)
+               for i, spec in enumerate(enemy_specs)]
+
+    return BattleCore(party, enemies, rng=rng).run()
+
+def simulate_chunk(party_spec, pool_id, seed, start, count):
+    """
+    Run a contiguous range of battles in a worker process.
+
+    Args:
+        party_spec (list): (class_id, level) tuples
+        pool_id (str): Encounter pool to draw the enemies from
+        seed (int): Base seed of the whole run
+        start (int): Index of the first battle
+        count (int): Number of battles to run
+
+    Returns:
+        list: (victory, turns, xp_gained, hp_fraction) tuples
+    """
+    results = []
+    for index in range(start, start + count):
+        result = simulate_battle(party_spec, pool_id, seed, index)
+        results.append((result.victory, result.turns, result.xp_gained,
+                        result.party_hp / result.party_max_hp))
+    return results
+
+def wilson_interval(successes, trials, z=Z_95):
+    """
+    Wilson score interval for a proportion.
+
+    Args:
+        successes (int): Number of successes
+        trials (int): Number of trials
+        z (float): z-score of the confidence level
+
+    Returns:
+        tuple: (low, high) bounds
+    """
+    if trials == 0:
+        return 0.0, 0.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return centre - margin, centre + margin
+
+def mean_interval(values, z=Z_95):
+    """
+    Mean with a normal-approximation confidence interval.
+
+    Args:
+        values (list): Samples
+        z (float): z-score of the confidence level
+
+    Returns:
+        tuple: (mean, margin) or (None, None) if there are no samples
+    """
+    if not values:
+        return None, None
+    mean = statistics.fmean(values)
+    if len(values) < 2:
+        return mean, 0.0
+    return mean, z * statistics.stdev(values) / math.sqrt(len(values))
+
+def ratio_interval(numerators, denominators, z=Z_95):
+    """
+    Ratio of sums with a delta-method confidence interval.
+
+    Args:
+        numerators (list): Per-sample numerators
+        denominators (list): Per-sample denominators
+        z (float): z-score of the confidence level
+
+    Returns:
+        tuple: (ratio, margin)
+    """
+    n = len(numerators)
+    mean_denominator = statistics.fmean(denominators)
+    ratio = sum(numerators) / sum(denominators)
+    if n < 2:
+        return ratio, 0.0
+    residuals = [x - ratio * y for x, y in zip(numerators, denominators)]
+    return ratio, z * statistics.stdev(residuals) / (mean_denominator * math.sqrt(n))
+
+def run_simulation(party_spec, pool_id, battles, seed, workers=None, chunk_size=None):
+    """
+    Run battles across a process pool.
+
+    Args:
+        party_spec (list): (class_id, level) tuples
+        pool_id (str): Encounter pool to draw the enemies from
+        battles (int): Number of battles to run
+        seed (int): Base seed of the run
+        workers (int): Number of worker processes (defaults to the CPU count)
+        chunk_size (int): Battles per task (defaults to a few tasks per worker)
+
+    Returns:
+        list: (victory, turns, xp_gained, hp_fraction) tuples in battle order
+    """
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        # A few tasks per worker keeps them all busy without much overhead
+        chunk_size = max(1, math.ceil(battles / (workers * 4)))
+
+    starts = range(0, battles, chunk_size)
+    counts = [min(chunk_size, battles - start) for start in starts]
+
+    if workers == 1:
+        chunks = [simulate_chunk(party_spec, pool_id, seed, start, count)
+                  for start, count in zip(starts, counts)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(simulate_chunk,
+                                       [party_spec] * len(counts), [pool_id] * len(counts),
+                                       [seed] * len(counts), starts, counts))
+
+    return [result for chunk in chunks for result in chunk]
+
+def report(results, seconds_per_turn):
+    """
+    Print balance statistics for a run.
+
+    Args:
+        results (list): (victory, turns, xp_gained, hp_fraction) tuples
+        seconds_per_turn (float): Estimated on-screen time of one turn
+    """
+    battles = len(results)
+    wins = [r for r in results if r[0]]
+    low, high = wilson_interval(len(wins), battles)
+    print(f"Battles:          {battles}")
+    print(f"Win rate:         {len(wins) / battles:.1%}  (95% CI {low:.1%} - {high:.1%})")
+
+    turns, margin = mean_interval([r[1] for r in wins])
+    if turns is not None:
+        print(f"Turns to win:     {turns:.2f} +/- {margin:.2f}")
+
+    hp, margin = mean_interval([r[3] for r in wins])
+    if hp is not None:
+        print(f"HP remaining:     {hp:.1%} +/- {margin:.1%}  (after wins)")
+
+    minutes = [r[1] * seconds_per_turn / 60 for r in results]
+    xp_rate, margin = ratio_interval([r[2] for r in results], minutes)
+    print(f"XP per minute:    {xp_rate:.1f} +/- {margin:.1f}  (battle time only)")
+
+def main():
+    """Parse the command line and run the simulation."""
+    parser = argparse.ArgumentParser(description="Simulate battles against an encounter pool.")
+    parser.add_argument("party", type=parse_party_spec,
+                        help="Party as class:level pairs, e.g. warrior:5,mage:3")
+    parser.add_argument("pool", help="Encounter pool id (e.g. rat_pool) or map id (e.g. east)")
+    parser.add_argument("-n", "--battles", type=int, default=10000, help="Number of battles")
+    parser.add_argument("--seed", type=int, default=0, help="Base random seed")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Battles per worker task")
+    parser.add_argument("--seconds-per-turn", type=float, default=DEFAULT_SECONDS_PER_TURN,
+                        help="On-screen seconds per turn used for XP per minute")
+    args = parser.parse_args()
+
+    if args.battles < 1:
+        parser.error("--battles must be at least 1")
+    if get_encounter_pool(args.pool) is None:
+        parser.error(f"Unknown encounter pool or map '{args.pool}'")
+
+    start_time = time.perf_counter()
+    results = run_simulation(args.party, args.pool, args.battles, args.seed,
+                             args.workers, args.chunk_size)
+    elapsed = time.perf_counter() - start_time
+
+    report(results, args.seconds_per_turn)
+    print(f"Simulated in {elapsed:.2f}s ({len(results) / elapsed:.0f} battles/s)")
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,6 @@ Passive ability system for the RPG game.
 Passive abilities provide automatic effects that don't require manual activation.
 """
 from dataclasses import dataclass
-import random
 import sys
 import os
 
@@ -12,6 +11,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # For type annotations
 from typing import Optional, List, Tuple, Any, Dict, Union
+from utils.rng import get_stream, PASSIVE_STREAM
 
 @dataclass
 class Passive:
@@ -120,15 +120,18 @@ class PassiveSet:
         triggered = False
         message = ""
         
+        # Use the battle's own random generator when it has one
+        rng = getattr(battle_system, 'rng', None) or get_stream(PASSIVE_STREAM)
+        
         for name, passive in self.passives.items():
             if passive.trigger_type == trigger_type:
                 # Check random chance to trigger
-                if random.random() < passive.chance:
+                if rng.random() < passive.chance:
                     # Handle specific passive types
                     if passive.effect_type == "counter" and battle_system and entity and target:
                         # Calculate counter-attack damage
                         hit_chance = battle_system.calculate_hit_chance(entity, target)
-                        counter_hits = random.random() < hit_chance
+                        counter_hits = rng.random() < hit_chance
                         
                         if counter_hits:
                             damage = battle_system.calculate_damage(entity, target)
@@ -1,9 +1,9 @@
 """
 Battle action handling for the RPG game.
 This module handles executing different battle actions such as attacks, spells, skills, etc.
+The battle core resolves the rules; this module starts the matching animations
+and words the messages shown once they finish.
 """
-import random
-
 class BattleActions:
     """
     Handles processing of all combat actions for both players and enemies.
@@ -90,7 +90,7 @@ class BattleActions:
     
     def _handle_defend(self, character):
         """Handle defend command."""
-        character.defend()
+        self.battle_system.core.defend(character)
         self.battle_system.animations.character_defending = True
         self.battle_system.set_message(
             f"{character.name} is defending! Incoming damage reduced and evasion increased!"
@@ -106,6 +106,19 @@ class BattleActions:
         self.battle_system.animations.active_character = character
         self.battle_system.set_message(f"{character.name} tried to flee!")
     
+    def _queue_results(self, message, outcome=None):
+        """
+        Store an action's results to show once its animation finishes.
+        
+        Args:
+            message: Message to display
+            outcome: The battle core's ActionOutcome, if the action went through the core
+        """
+        animations = self.battle_system.animations
+        animations.pending_message = message
+        animations.pending_xp = list(outcome.xp_awards) if outcome else []
+        animations.counter_message = outcome.passive_message if outcome else ""
+    
     def _handle_skill(self, character):
         """Handle skill command initiation."""
         skill_names = character.skillset.get_skill_names()
@@ -164,28 +177,9 @@ class BattleActions:
         self.battle_system.animations.target = target
         self.action_processing = True
         
-        # Calculate and use hit chance
-        hit_chance = self.battle_system.mechanics.calculate_hit_chance(attacker, target)
-        attack_hits = random.random() < hit_chance
-        
-        if attack_hits:
-            # Calculate damage
-            damage = self.battle_system.mechanics.calculate_damage(attacker, target)
-            
-            # Store damage for application after animation
-            self.battle_system.animations.pending_damage = damage
-            
-            # Set message based on attacker and target
-            attacker_name = attacker.name
-            target_name = target.name
-            
-            self.battle_system.animations.pending_message = f"{attacker_name} attacked {target_name} for {damage} damage!"
-        else:
-            # Attack missed
-            attacker_name = attacker.name
-            target_name = target.name
-            self.battle_system.animations.pending_message = f"{attacker_name}'s attack on {target_name} missed!"
-            self.battle_system.animations.pending_damage = 0
+        # Resolve the attack; its results are shown after the animation
+        outcome = self.battle_system.core.attack(attacker, target)
+        self._queue_results(outcome.message, outcome)
     
     def cast_spell(self, caster, target, spell):
         """
@@ -204,33 +198,9 @@ class BattleActions:
         self.battle_system.animations.current_spell = spell
         self.action_processing = True
         
-        # Apply SP cost
-        caster.use_sp(spell.sp_cost)
-        
-        # Handle spell effects based on type
-        if spell.effect_type == "damage":
-            # Calculate magic damage
-            damage = self.battle_system.mechanics.calculate_magic_damage(caster, target, spell.base_power)
-            
-            # Store damage for application after animation
-            self.battle_system.animations.pending_damage = damage
-            
-            # Set message
-            caster_name = caster.name
-            target_name = target.name
-            self.battle_system.animations.pending_message = f"{caster_name} cast {spell.name} on {target_name} for {damage} magic damage!"
-        
-        elif spell.effect_type == "healing":
-            # Calculate healing amount (add intelligence to base power)
-            healing_amount = spell.base_power + caster.intelligence
-            
-            # Store healing info for application after animation
-            self.battle_system.animations.pending_damage = -healing_amount  # Negative indicates healing
-            
-            # Set message
-            caster_name = caster.name
-            target_name = target.name
-            self.battle_system.animations.pending_message = f"{caster_name} cast {spell.name} on {target_name} to restore HP!"
+        # Pay the SP cost and resolve the spell's damage or healing
+        outcome = self.battle_system.core.cast_spell(caster, target, spell)
+        self._queue_results(outcome.message, outcome)
     
     def use_skill(self, user, target, skill):
         """
@@ -257,6 +227,7 @@ class BattleActions:
             self.battle_system.mechanics.apply_damage(user, skill.hp_cost, "self-inflicted")
         
         # Handle skill effects based on type
+        message = f"{user.name} used {skill.name} on {target.name}!"
         if skill.effect_type == "analyze":
             # Get target stats
             target_stats = (
@@ -268,12 +239,8 @@ class BattleActions:
                 f"ACC: {target.acc}\n"
                 f"RES: {target.resilience}"
             )
-            
-            # Set message
-            user_name = user.name
-            target_name = target.name
-            self.battle_system.animations.pending_message = f"{user_name} used {skill.name} on {target_name}! {target_stats}"
-            self.battle_system.animations.pending_damage = 0
+            message = f"{message} {target_stats}"
+        self._queue_results(message)
     
     def use_ultimate(self, user, target, ultimate):
         """
@@ -292,21 +259,9 @@ class BattleActions:
         self.battle_system.animations.current_ultimate = ultimate
         self.action_processing = True
         
-        # Mark ultimate as used
-        ultimate.available = False
-        
-        # Handle ultimate effects based on type
-        if ultimate.effect_type == "damage":
-            # Calculate damage with power multiplier
-            damage = int(user.attack * ultimate.power_multiplier)
-            
-            # Store damage for application after animation
-            self.battle_system.animations.pending_damage = damage
-            
-            # Set message
-            user_name = user.name
-            target_name = target.name
-            self.battle_system.animations.pending_message = f"{user_name} used {ultimate.name} on {target_name} for a massive {damage} damage!"
+        # Mark the ultimate as used and resolve its damage
+        outcome = self.battle_system.core.use_ultimate(user, target, ultimate)
+        self._queue_results(outcome.message, outcome)
     
     def process_enemy_turn(self):
         """Process the current enemy's turn in battle."""
@@ -315,54 +270,41 @@ class BattleActions:
         if not current_enemy:
             return
         
-        # Start enemy attack animation
-        self.battle_system.animations.enemy_attacking = True
-        self.battle_system.animations.animation_timer = 0
-        self.battle_system.animations.current_enemy = current_enemy
-        self.action_processing = True
-        
-        # Choose a target from active party members
-        valid_targets = [c for c in self.battle_system.party.active_members if not c.is_defeated()]
-        if not valid_targets:
+        # Choose a random target from active party members
+        target = self.battle_system.core.choose_enemy_target()
+        if not target:
             # No valid targets, end battle
             self.battle_system.battle_over = True
             self.battle_system.victory = False
             self.battle_system.set_message("Defeat! All party members have fallen!")
             return
         
-        # Select random target for now (could be more strategic in the future)
-        target = random.choice(valid_targets)
+        # Start enemy attack animation
+        self.battle_system.animations.enemy_attacking = True
+        self.battle_system.animations.animation_timer = 0
+        self.battle_system.animations.current_enemy = current_enemy
         self.battle_system.animations.target = target
+        self.action_processing = True
         
-        # Calculate hit chance and determine if attack hits
-        hit_chance = self.battle_system.mechanics.calculate_hit_chance(current_enemy, target)
-        attack_hits = random.random() < hit_chance
+        # Resolve the attack, wording the message around the target's stance
+        defending = target.defending
+        outcome = self.battle_system.core.attack(current_enemy, target)
+        enemy_name = current_enemy.name
+        target_name = target.name
         
-        if attack_hits:
-            # Calculate damage
-            damage = self.battle_system.mechanics.calculate_damage(current_enemy, target)
-            self.battle_system.animations.pending_damage = damage
-            
-            # Prepare message
-            enemy_name = current_enemy.name
-            target_name = target.name
-            
-            if target.defending:
+        if outcome.hit:
+            damage = outcome.amount
+            if defending:
                 original_damage = damage * 2  # Approximate original damage
-                self.battle_system.animations.pending_message = f"{enemy_name} attacked {target_name}! Defense reduced damage from {original_damage} to {damage}!"
+                message = f"{enemy_name} attacked {target_name}! Defense reduced damage from {original_damage} to {damage}!"
             else:
-                self.battle_system.animations.pending_message = f"{enemy_name} attacked {target_name} for {damage} damage!"
+                message = f"{enemy_name} attacked {target_name} for {damage} damage!"
         else:
-            # Attack missed
-            enemy_name = current_enemy.name
-            target_name = target.name
-            
-            if target.defending:
-                self.battle_system.animations.pending_message = f"{enemy_name}'s attack on {target_name} missed! Their defensive stance helped them evade!"
+            if defending:
+                message = f"{enemy_name}'s attack on {target_name} missed! Their defensive stance helped them evade!"
             else:
-                self.battle_system.animations.pending_message = f"{enemy_name}'s attack on {target_name} missed!"
-                
-            self.battle_system.animations.pending_damage = 0
+                message = f"{enemy_name}'s attack on {target_name} missed!"
+        self._queue_results(message, outcome)
     
     def select_target(self, attacker, potential_targets, target_type="random"):
         """
@@ -380,7 +322,7 @@ class BattleActions:
             return None
             
         if target_type == "random":
-            return random.choice(potential_targets)
+            return self.battle_system.rng.choice(potential_targets)
         elif target_type == "weakest":
             return min(potential_targets, key=lambda t: t.hp)
         elif target_type == "strongest":
@@ -389,4 +331,4 @@ class BattleActions:
             return min(potential_targets, key=lambda t: t.hp / t.max_hp)
         else:
             # Default to random
-            return random.choice(potential_targets)
\ No newline at end of file
+            return self.battle_system.rng.choice(potential_targets)
\ No newline at end of file
@@ -4,13 +4,17 @@ Manages all visual animations during battle including attacks, spells, and movem
 """
 import pygame
 import random
+import math
 from constants import (
     BLACK, WHITE, GREEN, RED, BLUE, YELLOW, PURPLE,
     ATTACK_ANIMATION_DURATION, FLEE_ANIMATION_DURATION,
     SPELL_ANIMATION_DURATION, ACTION_DELAY_DURATION,
+    SPELL_PARTICLE_COUNT, ULTIMATE_PARTICLE_COUNT,
     ORIGINAL_WIDTH, ORIGINAL_HEIGHT
 )
-from entities.player import Player
+from systems.battle.effect_atlas import effect_atlas
+from systems.battle.particle_system import ParticleSystem
+from utils.rng import get_stream, EFFECTS_STREAM
 
 class BattleAnimations:
     """
@@ -56,9 +60,11 @@ class BattleAnimations:
         self.current_skill = None
         self.current_ultimate = None
         
-        # Store pending effects
-        self.pending_damage = 0
+        # Results of the current action, shown once its animation finishes
+        # (the battle core has already applied them)
         self.pending_message = ""
+        self.pending_xp = []          # (party member, XP) awarded by the action
+        self.acting_combatant = None  # Whose turn ends once the results are shown
         
         # Passive ability tracking
         self.counter_triggered = False
@@ -66,6 +72,7 @@ class BattleAnimations:
         
         # Visual effects
         self.effects = []
+        self.particles = ParticleSystem(seed=get_stream(EFFECTS_STREAM).getrandbits(32))
     
     def update(self):
         """Update all active animations and effects."""
@@ -73,14 +80,11 @@ class BattleAnimations:
         if not self.battle_system.ui.is_text_complete():
             return
             
-        # Handle counter passive effect after enemy attack message is shown
+        # Handle counter passive effect after the attack message is shown
         if self.counter_triggered:
-            current_combatant = self.battle_system.turn_order.get_current()
-            if not isinstance(current_combatant, Player):
-                # Handle counter attack
-                self.character_countering = True
-                self.counter_animation_timer = 0
-                self.counter_triggered = False
+            self.character_countering = True
+            self.counter_animation_timer = 0
+            self.counter_triggered = False
         
         # Handle counter-attack animation
         elif self.character_countering:
@@ -209,21 +213,43 @@ class BattleAnimations:
             
             # Now that counter animation is complete, display the message
             self.battle_system.ui.set_message(self.counter_message)
-            
-            # Check if enemy was defeated by the counter
-            if self.target and self.target.is_defeated():
-                # Check if all enemies are defeated
-                if self.battle_system.mechanics.check_all_enemies_defeated(self.battle_system.enemies):
-                    self.battle_system.victory = True
-                    self.battle_system.battle_over = True
-                    self.battle_system.ui.set_message("Victory! All enemies defeated!")
-                else:
-                    # Remove the defeated enemy from turn order
-                    self.battle_system.turn_order.remove_combatant(self.target)
+            self.counter_message = ""
+            self._end_action()
+    
+    def _show_results(self, actor):
+        """
+        Show the results of a finished action animation.
+        
+        The battle core resolved the action when it started; this only displays
+        the message and XP, then plays any counter-attack before the turn ends.
+        
+        Args:
+            actor: The combatant whose action it was
+        """
+        self.acting_combatant = actor
+        self.battle_system.ui.set_message(self.pending_message)
+        for member, xp_gained in self.pending_xp:
+            self.battle_system.ui.message_log.append(f"{member.name} gained {xp_gained} XP!")
+        self.pending_xp = []
+        
+        # The turn ends after the counter animation if a passive fired
+        if self.counter_message:
+            self.counter_triggered = True
+        else:
+            self._end_action()
+    
+    def _end_action(self):
+        """End the acting combatant's turn, or announce the end of the battle."""
+        core = self.battle_system.core
+        if core.battle_over:
+            if core.victory:
+                self.battle_system.ui.set_message("Victory! All enemies defeated!")
             else:
-                # Only advance turn if counter didn't defeat target
-                current_combatant = self.battle_system.turn_order.advance()
-                self.battle_system.actions.action_processing = False
+                self.battle_system.ui.set_message("Defeat! All party members have fallen!")
+        elif self.acting_combatant:
+            core.end_turn(self.acting_combatant)
+        self.acting_combatant = None
+        self.battle_system.actions.action_processing = False
     
     def _update_attack_animation(self):
         """Update attack animation."""
@@ -231,54 +257,7 @@ class BattleAnimations:
         if self.animation_timer >= self.animation_duration:
             self.character_attacking = False
             self.animation_timer = 0
-            
-            # Apply damage to target
-            if self.target and self.pending_damage > 0:
-                # Check for passive triggers when taking damage
-                actual_damage, passive_triggered, passive_message = (
-                    self.battle_system.mechanics.apply_damage(
-                        self.target, 
-                        self.pending_damage,
-                        damage_type="physical",
-                        attacker=self.active_character,
-                        battle_system=self.battle_system
-                    )
-                )
-                
-                # Store counter information if passive was triggered
-                if passive_triggered:
-                    self.counter_triggered = True
-                    self.counter_message = passive_message
-            
-            # Display the attack message
-            self.battle_system.ui.set_message(self.pending_message)
-            
-            # Check if target was defeated
-            if self.target and self.target.is_defeated():
-                # Award XP to attacker
-                if hasattr(self.target, 'xp'):
-                    xp_gained = self.target.xp
-                    self.active_character.gain_experience(xp_gained)
-                    self.battle_system.ui.message_log.append(f"{self.active_character.name} gained {xp_gained} XP!")
-                
-                # Check if all enemies are defeated
-                if self.battle_system.mechanics.check_all_enemies_defeated(self.battle_system.enemies):
-                    self.battle_system.victory = True
-                    self.battle_system.battle_over = True
-                    self.battle_system.ui.set_message("Victory! All enemies defeated!")
-                    return
-                else:
-                    # Remove the defeated enemy from turn order
-                    self.battle_system.turn_order.remove_combatant(self.target)
-            
-            # End current character's turn if not already done
-            if self.active_character:
-                self.active_character.end_turn()
-            
-            # Advance to next combatant if battle is not over
-            if not self.battle_system.battle_over:
-                current_combatant = self.battle_system.turn_order.advance()
-                self.battle_system.actions.action_processing = False
+            self._show_results(self.active_character)
     
     def _update_defense_animation(self):
         """Update defense animation."""
@@ -288,12 +267,8 @@ class BattleAnimations:
             self.character_defending = False
             
             # End current character's turn
-            if self.active_character:
-                self.active_character.end_turn()
-            
-            # Advance to next combatant
-            current_combatant = self.battle_system.turn_order.advance()
-            self.battle_system.actions.action_processing = False
+            self.acting_combatant = self.active_character
+            self._end_action()
     
     def _update_spell_animation(self):
         """Update spell casting animation."""
@@ -301,67 +276,7 @@ class BattleAnimations:
         if self.animation_timer >= self.spell_animation_duration:
             self.character_casting = False
             self.animation_timer = 0
-            
-            # Apply spell effect to target
-            if self.target:
-                if self.pending_damage > 0:
-                    # Damage spell
-                    actual_damage, passive_triggered, passive_message = (
-                        self.battle_system.mechanics.apply_damage(
-                            self.target, 
-                            self.pending_damage,
-                            damage_type="magical",
-                            attacker=self.active_character,
-                            battle_system=self.battle_system
-                        )
-                    )
-                    
-                    # Handle passive response if triggered
-                    if passive_triggered:
-                        self.counter_triggered = True
-                        self.counter_message = passive_message
-                        
-                elif self.pending_damage < 0:
-                    # Healing spell (negative damage)
-                    actual_healing = self.battle_system.mechanics.apply_healing(
-                        self.target, 
-                        -self.pending_damage  # Convert back to positive
-                    )
-                    
-                    # Update the message with actual healing amount
-                    message = self.pending_message
-                    message = message.replace("to restore HP", f"restoring {actual_healing} HP")
-                    self.pending_message = message
-            
-            # Display the spell message
-            self.battle_system.ui.set_message(self.pending_message)
-            
-            # Check if target was defeated (for damage spells)
-            if self.target and self.target.is_defeated():
-                # Award XP to caster
-                if hasattr(self.target, 'xp'):
-                    xp_gained = self.target.xp
-                    self.active_character.gain_experience(xp_gained)
-                    self.battle_system.ui.message_log.append(f"{self.active_character.name} gained {xp_gained} XP!")
-                
-                # Check if all enemies are defeated
-                if self.battle_system.mechanics.check_all_enemies_defeated(self.battle_system.enemies):
-                    self.battle_system.victory = True
-                    self.battle_system.battle_over = True
-                    self.battle_system.ui.set_message("Victory! All enemies defeated!")
-                    return
-                else:
-                    # Remove the defeated enemy from turn order
-                    self.battle_system.turn_order.remove_combatant(self.target)
-            
-            # End current character's turn
-            if self.active_character:
-                self.active_character.end_turn()
-            
-            # Advance to next combatant if battle is not over
-            if not self.battle_system.battle_over:
-                current_combatant = self.battle_system.turn_order.advance()
-                self.battle_system.actions.action_processing = False
+            self._show_results(self.active_character)
     
     def _update_skill_animation(self):
         """Update skill usage animation."""
@@ -369,17 +284,7 @@ class BattleAnimations:
         if self.animation_timer >= self.animation_duration:
             self.character_using_skill = False
             self.animation_timer = 0
-            
-            # Display the skill message
-            self.battle_system.ui.set_message(self.pending_message)
-            
-            # End current character's turn
-            if self.active_character:
-                self.active_character.end_turn()
-            
-            # Advance to next combatant
-            current_combatant = self.battle_system.turn_order.advance()
-            self.battle_system.actions.action_processing = False
+            self._show_results(self.active_character)
     
     def _update_ultimate_animation(self):
         """Update ultimate ability animation."""
@@ -387,53 +292,7 @@ class BattleAnimations:
         if self.animation_timer >= self.animation_duration:
             self.character_using_ultimate = False
             self.animation_timer = 0
-            
-            # Apply ultimate effect to target
-            if self.target and self.pending_damage > 0:
-                actual_damage, passive_triggered, passive_message = (
-                    self.battle_system.mechanics.apply_damage(
-                        self.target, 
-                        self.pending_damage,
-                        damage_type="ultimate",
-                        attacker=self.active_character,
-                        battle_system=self.battle_system
-                    )
-                )
-                
-                # Handle passive response if triggered
-                if passive_triggered:
-                    self.counter_triggered = True
-                    self.counter_message = passive_message
-            
-            # Display the ultimate message
-            self.battle_system.ui.set_message(self.pending_message)
-            
-            # Check if target was defeated
-            if self.target and self.target.is_defeated():
-                # Award XP to character
-                if hasattr(self.target, 'xp'):
-                    xp_gained = self.target.xp
-                    self.active_character.gain_experience(xp_gained)
-                    self.battle_system.ui.message_log.append(f"{self.active_character.name} gained {xp_gained} XP!")
-                
-                # Check if all enemies are defeated
-                if self.battle_system.mechanics.check_all_enemies_defeated(self.battle_system.enemies):
-                    self.battle_system.victory = True
-                    self.battle_system.battle_over = True
-                    self.battle_system.ui.set_message("Victory! All enemies defeated!")
-                    return
-                else:
-                    # Remove the defeated enemy from turn order
-                    self.battle_system.turn_order.remove_combatant(self.target)
-            
-            # End current character's turn
-            if self.active_character:
-                self.active_character.end_turn()
-            
-            # Advance to next combatant if battle is not over
-            if not self.battle_system.battle_over:
-                current_combatant = self.battle_system.turn_order.advance()
-                self.battle_system.actions.action_processing = False
+            self._show_results(self.active_character)
     
     def _update_enemy_attack_animation(self):
         """Update enemy attack animation."""
@@ -441,48 +300,7 @@ class BattleAnimations:
         if self.animation_timer >= self.animation_duration:
             self.enemy_attacking = False
             self.animation_timer = 0
-            
-            # Apply damage to target (only if attack didn't miss)
-            if "missed" not in self.pending_message and self.target and self.pending_damage > 0:
-                # We pass the battle system and current enemy for potential passive triggers
-                actual_damage, passive_triggered, passive_message = (
-                    self.battle_system.mechanics.apply_damage(
-                        self.target, 
-                        self.pending_damage,
-                        damage_type="physical",
-                        attacker=self.current_enemy,
-                        battle_system=self.battle_system
-                    )
-                )
-                
-                # Store passive information if triggered
-                if passive_triggered:
-                    self.counter_triggered = True
-                    self.counter_message = passive_message
-            
-            # Display the standard attack message
-            self.battle_system.ui.set_message(self.pending_message)
-            
-            # Check if target was defeated
-            if self.target and self.target.is_defeated():
-                # Check if all party members are defeated
-                if self.battle_system.mechanics.check_all_party_defeated(self.battle_system.party.active_members):
-                    self.battle_system.battle_over = True
-                    self.battle_system.victory = False
-                    self.battle_system.ui.set_message("Defeat! All party members have fallen!")
-                    return
-                else:
-                    # Remove the defeated character from turn order
-                    self.battle_system.turn_order.remove_combatant(self.target)
-            
-            # End current enemy's turn
-            if self.current_enemy:
-                self.current_enemy.end_turn()
-            
-            # Advance to next combatant if battle is not over and no counter was triggered
-            if not self.battle_system.battle_over and not self.counter_triggered:
-                current_combatant = self.battle_system.turn_order.advance()
-                self.battle_system.actions.action_processing = False
+            self._show_results(self.current_enemy)
     
     def _update_flee_animation(self):
         """Update flee animation."""
@@ -534,12 +352,42 @@ class BattleAnimations:
             
             # Add random offset for multiple effects
             if offset:
-                offset_x = random.randint(-50, 50)
-                offset_y = random.randint(-50, 50)
+                offset_x = get_stream(EFFECTS_STREAM).randint(-50, 50)
+                offset_y = get_stream(EFFECTS_STREAM).randint(-50, 50)
                 effect['position'] = (target.rect.centerx + offset_x, target.rect.centery + offset_y)
         
         # Add to effects list
         self.effects.append(effect)
+        
+        # Spawn the effect's particles
+        self._emit_particles(effect)
+    
+    def _emit_particles(self, effect):
+        """
+        Spawn the particles that go with an effect.
+        
+        Args:
+            effect: The effect data
+        """
+        x, y = effect['position']
+        size = effect['size']
+        
+        if effect['type'] == "fire":
+            # Sparks thrown upward from the flames
+            self.particles.emit(x, y, SPELL_PARTICLE_COUNT, (255, 255, 200),
+                                speed=(0.5, 2.5), life=(10, effect['duration']),
+                                angle=(math.pi, 2 * math.pi), spread=size * 0.5,
+                                gravity=0.08, size=(1, 3))
+        elif effect['type'] == "heal":
+            # Soft particles drifting up from the target
+            self.particles.emit(x, y, SPELL_PARTICLE_COUNT, (150, 255, 200),
+                                speed=(0.1, 0.6), life=(15, effect['duration']),
+                                spread=size * 0.8, gravity=-0.05, size=(2, 4))
+        elif effect['type'] == "ultimate":
+            # Bright burst flying out in every direction
+            self.particles.emit(x, y, ULTIMATE_PARTICLE_COUNT, (255, 255, 255),
+                                speed=(1.0, 4.0), life=(10, effect['duration']),
+                                spread=size * 0.3, size=(1, 4))
     
     def _update_effects(self):
         """Update all visual effects."""
@@ -548,6 +396,9 @@ class BattleAnimations:
             effect['current_frame'] += 1
             if effect['current_frame'] >= effect['duration']:
                 self.effects.remove(effect)
+        
+        # Update all particles in one step
+        self.particles.update()
     
     def draw(self, screen):
         """
@@ -556,32 +407,62 @@ class BattleAnimations:
         Args:
             screen: The pygame surface to draw on
         """
+        resolution = screen.get_size()
+        
         # Draw each effect
         for effect in self.effects:
-            # Calculate effect parameters
-            progress = effect['current_frame'] / effect['duration']
-            size = int(effect['size'] * (1 - progress * 0.5))  # Maintain size longer
-            alpha = int(255 * (1 - progress))
-            
-            # Create a surface for the effect
-            effect_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            
-            # Draw different effects based on type
-            if effect['type'] == "fire":
-                self._draw_fire_effect(effect_surface, size, alpha)
-            elif effect['type'] == "heal":
-                self._draw_heal_effect(effect_surface, size, alpha)
-            elif effect['type'] == "analyze":
-                self._draw_analyze_effect(effect_surface, size, alpha)
-            elif effect['type'] == "ultimate":
-                self._draw_ultimate_effect(effect_surface, size, alpha)
-            else:
-                # Default effect
-                pygame.draw.circle(effect_surface, (*effect['color'], alpha), (size, size), size)
+            # Get the pre-rendered frames for this effect
+            effect_key = ("battle", effect['type'], effect['size'], effect['color'], resolution)
+            frames = effect_atlas.get_frames(
+                effect_key, effect['duration'],
+                lambda frame, effect=effect: self._render_effect_frame(effect, frame)
+            )
+            effect_surface = frames[effect['current_frame']]
             
             # Draw the effect at the target position
+            size = effect_surface.get_width() // 2
             position = effect['position']
             screen.blit(effect_surface, (position[0] - size, position[1] - size))
+        
+        # Draw all particles on top of the effects
+        self.particles.draw(screen)
+    
+    def _render_effect_frame(self, effect, frame):
+        """
+        Render a single animation frame of an effect.
+        
+        Args:
+            effect: The effect data
+            frame: Index of the frame to render
+            
+        Returns:
+            pygame.Surface: The rendered frame
+        """
+        # Calculate effect parameters
+        progress = frame / effect['duration']
+        size = int(effect['size'] * (1 - progress * 0.5))  # Maintain size longer
+        alpha = int(255 * (1 - progress))
+        
+        # Seed per frame so the atlas always renders the same energy lines
+        rng = random.Random(frame)
+        
+        # Create a surface for the effect
+        effect_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        
+        # Draw different effects based on type
+        if effect['type'] == "fire":
+            self._draw_fire_effect(effect_surface, size, alpha)
+        elif effect['type'] == "heal":
+            self._draw_heal_effect(effect_surface, size, alpha)
+        elif effect['type'] == "analyze":
+            self._draw_analyze_effect(effect_surface, size, alpha)
+        elif effect['type'] == "ultimate":
+            self._draw_ultimate_effect(effect_surface, size, alpha, rng)
+        else:
+            # Default effect
+            pygame.draw.circle(effect_surface, (*effect['color'], alpha), (size, size), size)
+        
+        return effect_surface
     
     def _draw_fire_effect(self, surface, size, alpha):
         """
@@ -603,13 +484,6 @@ class BattleAnimations:
             circle_size = size * (0.8 - i * 0.2)
             offset_y = int(size * 0.1 * i)  # Offset for flame shape
             pygame.draw.circle(surface, color, (size, size - offset_y), int(circle_size))
-        
-        # Add some random sparks
-        for _ in range(5):
-            spark_x = random.randint(size // 2, size + size // 2)
-            spark_y = random.randint(size // 2, size + size // 2)
-            spark_size = random.randint(1, 3)
-            pygame.draw.circle(surface, (255, 255, 200, alpha), (spark_x, spark_y), spark_size)
     
     def _draw_heal_effect(self, surface, size, alpha):
         """
@@ -624,19 +498,6 @@ class BattleAnimations:
         glow_color = (100, 255, 150, alpha)
         pygame.draw.circle(surface, glow_color, (size, size), size)
         
-        # Add some particles
-        for _ in range(8):
-            particle_size = size // 4
-            angle = random.random() * 6.28  # Random angle in radians
-            distance = random.random() * size * 0.8
-            
-            # Calculate particle position
-            px = int(size + math.cos(angle) * distance)
-            py = int(size + math.sin(angle) * distance)
-            
-            # Draw particle
-            pygame.draw.circle(surface, (150, 255, 200, alpha), (px, py), particle_size)
-        
         # Draw plus sign
         line_width = max(1, size // 8)
         pygame.draw.line(surface, (255, 255, 255, alpha), 
@@ -667,7 +528,7 @@ class BattleAnimations:
         pygame.draw.line(surface, (255, 255, 255, alpha), 
                         (size - size//2, size), (size + size//2, size), 1)
     
-    def _draw_ultimate_effect(self, surface, size, alpha):
+    def _draw_ultimate_effect(self, surface, size, alpha, rng):
         """
         Draw an ultimate ability effect.
         
@@ -675,6 +536,7 @@ class BattleAnimations:
             surface: The surface to draw on
             size: The effect size
             alpha: The effect alpha (transparency)
+            rng: Random generator for the energy lines
         """
         # Draw energetic burst
         for i in range(3):
@@ -684,7 +546,7 @@ class BattleAnimations:
         
         # Draw some energy lines
         for _ in range(8):
-            angle = random.random() * 6.28  # Random angle in radians
+            angle = rng.random() * 6.28  # Random angle in radians
             length = size * 1.5
             
             # Calculate line endpoints
@@ -695,11 +557,3 @@ class BattleAnimations:
             
             # Draw energy line
             pygame.draw.line(surface, (255, 255, 100, alpha), (x1, y1), (x2, y2), 2)
-        
-        # Add some bright particles
-        for _ in range(12):
-            px = random.randint(0, size * 2)
-            py = random.randint(0, size * 2)
-            particle_size = random.randint(1, 4)
-            
-            pygame.draw.circle(surface, (255, 255, 255, alpha), (px, py), particle_size)
\ No newline at end of file
@@ -0,0 +1,366 @@
+"""
+Display-free battle core for the RPG game.
+Runs turn order, mechanics, actions and passives without any rendering, so
+battles can be resolved headlessly (e.g. for balance simulations).
+"""
+from dataclasses import dataclass, field
+
+from systems.battle.battle_mechanics import BattleMechanics
+from systems.battle.turn_order import TurnOrder
+from entities.player import Player
+from utils.rng import get_stream, BATTLE_STREAM
+
+@dataclass
+class BattleResult:
+    """Outcome of a battle resolved by the battle core."""
+    victory: bool
+    fled: bool
+    turns: int               # Number of actions taken by all combatants
+    xp_gained: int           # Total XP awarded to the party
+    party_hp: int            # HP remaining across the party
+    party_max_hp: int        # Max HP across the party
+
+@dataclass
+class ActionOutcome:
+    """What a single action did, for callers that present it themselves."""
+    message: str                 # Message describing the result
+    hit: bool = True             # False if an attack missed
+    amount: int = 0              # Damage rolled or HP restored
+    passive_message: str = ""    # Message from a passive the action triggered
+    xp_awards: list = field(default_factory=list)  # (party member, XP) per defeat
+
+    def full_message(self):
+        """The message with any passive result appended."""
+        if self.passive_message:
+            return f"{self.message} {self.passive_message}"
+        return self.message
+
+class BattleCore:
+    """
+    Pure battle logic shared by the interactive battle system and headless simulations.
+    """
+    def __init__(self, party_members, enemies, rng=None):
+        """
+        Initialize the battle core.
+
+        Args:
+            party_members: List of active party members
+            enemies: A list of enemy entities or a single enemy
+            rng: Random generator for all battle rolls (defaults to the battle stream)
+        """
+        self.party_members = list(party_members)
+
+        # Ensure enemies is a list
+        if not isinstance(enemies, list):
+            self.enemies = [enemies]
+        else:
+            self.enemies = enemies
+
+        self.rng = rng if rng is not None else get_stream(BATTLE_STREAM)
+        self.mechanics = BattleMechanics()
+        self.turn_order = TurnOrder(self.party_members, self.enemies, rng=self.rng)
+
+        # Battle state
+        self.battle_over = False
+        self.victory = False
+        self.fled = False
+        self.turns = 0
+        self.xp_gained = 0
+        self.log = []
+
+    def calculate_hit_chance(self, attacker, defender):
+        """
+        Calculate the chance for an attack to hit.
+
+        Args:
+            attacker: The attacking entity
+            defender: The defending entity
+
+        Returns:
+            float: The chance to hit as a decimal between 0 and 1
+        """
+        return self.mechanics.calculate_hit_chance(attacker, defender)
+
+    def calculate_damage(self, attacker, defender):
+        """
+        Calculate physical damage for an attack.
+
+        Args:
+            attacker: The attacking entity
+            defender: The defending entity
+
+        Returns:
+            int: The calculated damage amount
+        """
+        return self.mechanics.calculate_damage(attacker, defender)
+
+    def calculate_magic_damage(self, caster, target, base_power):
+        """
+        Calculate magic damage for a spell.
+
+        Args:
+            caster: The entity casting the spell
+            target: The target of the spell
+            base_power: Base power of the spell
+
+        Returns:
+            int: The calculated magic damage amount
+        """
+        return self.mechanics.calculate_magic_damage(caster, target, base_power)
+
+    def living_enemies(self):
+        """
+        Get the enemies that are still standing.
+
+        Returns:
+            list: Enemies that are not defeated
+        """
+        return [enemy for enemy in self.enemies if not enemy.is_defeated()]
+
+    def living_party_members(self):
+        """
+        Get the party members that are still standing.
+
+        Returns:
+            list: Party members that are not defeated
+        """
+        return [member for member in self.party_members if not member.is_defeated()]
+
+    def attack(self, attacker, target):
+        """
+        Resolve a physical attack immediately.
+
+        Args:
+            attacker: The attacking entity
+            target: The target of the attack
+
+        Returns:
+            ActionOutcome: What the attack did
+        """
+        hit_chance = self.calculate_hit_chance(attacker, target)
+        if self.rng.random() >= hit_chance:
+            return ActionOutcome(f"{attacker.name}'s attack on {target.name} missed!", hit=False)
+
+        damage = self.calculate_damage(attacker, target)
+        message = f"{attacker.name} attacked {target.name} for {damage} damage!"
+        return self._apply_damage(attacker, target, damage, "physical", message)
+
+    def cast_spell(self, caster, target, spell):
+        """
+        Resolve a spell immediately.
+
+        Args:
+            caster: The character casting the spell
+            target: The target of the spell
+            spell: The spell being cast
+
+        Returns:
+            ActionOutcome: What the spell did
+        """
+        caster.use_sp(spell.sp_cost)
+
+        if spell.effect_type == "damage":
+            damage = self.calculate_magic_damage(caster, target, spell.base_power)
+            message = f"{caster.name} cast {spell.name} on {target.name} for {damage} magic damage!"
+            return self._apply_damage(caster, target, damage, "magical", message)
+        elif spell.effect_type == "healing":
+            healing = self.mechanics.apply_healing(target, spell.base_power + caster.intelligence)
+            return ActionOutcome(
+                f"{caster.name} cast {spell.name} on {target.name} restoring {healing} HP!",
+                amount=healing
+            )
+        return ActionOutcome(f"{caster.name} cast {spell.name}, but nothing happened.")
+
+    def use_ultimate(self, user, target, ultimate):
+        """
+        Resolve an ultimate ability immediately.
+
+        Args:
+            user: The character using the ultimate
+            target: The target of the ultimate
+            ultimate: The ultimate ability being used
+
+        Returns:
+            ActionOutcome: What the ultimate did
+        """
+        ultimate.available = False
+
+        if ultimate.effect_type == "damage":
+            damage = int(user.attack * ultimate.power_multiplier)
+            message = f"{user.name} used {ultimate.name} on {target.name} for a massive {damage} damage!"
+            return self._apply_damage(user, target, damage, "ultimate", message)
+        return ActionOutcome(f"{user.name} used {ultimate.name}, but nothing happened.")
+
+    def defend(self, character):
+        """
+        Put a character into a defensive stance.
+
+        Args:
+            character: The character defending
+
+        Returns:
+            ActionOutcome: What the action did
+        """
+        character.defend()
+        return ActionOutcome(f"{character.name} is defending!")
+
+    def _apply_damage(self, attacker, target, damage, damage_type, message):
+        """
+        Apply damage, trigger passives and handle defeats.
+
+        Args:
+            attacker: The entity dealing the damage
+            target: The entity taking the damage
+            damage: Amount of damage to apply
+            damage_type: Type of damage ("physical", "magical", "ultimate")
+            message: Message describing the attack
+
+        Returns:
+            ActionOutcome: What the damage did, including passive results and XP awards
+        """
+        outcome = ActionOutcome(message, amount=damage)
+        _, passive_triggered, passive_message = self.mechanics.apply_damage(
+            target, damage, damage_type=damage_type, attacker=attacker, battle_system=self
+        )
+        if passive_triggered:
+            outcome.passive_message = passive_message
+
+        self._handle_defeat(target, attacker, outcome)
+        # A counter-attack can defeat the attacker
+        self._handle_defeat(attacker, target, outcome)
+        return outcome
+
+    def _handle_defeat(self, entity, defeated_by, outcome):
+        """
+        Handle an entity being defeated: award XP, remove it from the turn
+        order and check whether the battle is over.
+
+        Args:
+            entity: The entity to check
+            defeated_by: The entity that defeated it
+            outcome: The outcome of the action, to record XP awards on
+        """
+        if not entity.is_defeated() or entity not in self.turn_order.combatants:
+            return
+
+        # Award XP to the party member who landed the final blow
+        if isinstance(defeated_by, Player) and hasattr(entity, 'xp'):
+            if defeated_by.gain_experience(entity.xp):
+                # A level up can change SPD
+                self.turn_order.notify_speed_changed(defeated_by)
+            self.xp_gained += entity.xp
+            outcome.xp_awards.append((defeated_by, entity.xp))
+
+        if self.mechanics.check_all_enemies_defeated(self.enemies):
+            self.battle_over = True
+            self.victory = True
+        elif self.mechanics.check_all_party_defeated(self.party_members):
+            self.battle_over = True
+            self.victory = False
+        else:
+            self.turn_order.remove_combatant(entity)
+
+    def default_player_action(self, character):
+        """
+        Choose an action for a party member when no policy is given:
+        attack a random enemy that is still standing.
+
+        Args:
+            character: The party member whose turn it is
+
+        Returns:
+            tuple: (action, target) where action is "ATTACK"
+        """
+        return "ATTACK", self.rng.choice(self.living_enemies())
+
+    def step(self, policy=None):
+        """
+        Resolve the current combatant's turn and advance to the next one.
+
+        Args:
+            policy: Callable taking (core, character) and returning an action
+                tuple for party members: ("ATTACK", target), ("DEFEND", None),
+                ("MAGIC", target, spell) or ("ULTIMATE", target, ultimate).
+                Defaults to default_player_action.
+
+        Returns:
+            str: Message describing what happened, or None if the battle is over
+        """
+        if self.battle_over:
+            return None
+
+        current = self.turn_order.get_current()
+        if current is None:
+            self.battle_over = True
+            return None
+
+        if isinstance(current, Player):
+            if policy is None:
+                action = self.default_player_action(current)
+            else:
+                action = policy(self, current)
+            kind, target = action[0], action[1]
+            if kind == "DEFEND":
+                outcome = self.defend(current)
+            elif kind == "MAGIC":
+                outcome = self.cast_spell(current, target, action[2])
+            elif kind == "ULTIMATE":
+                outcome = self.use_ultimate(current, target, action[2])
+            else:
+                outcome = self.attack(current, target)
+        else:
+            outcome = self.attack(current, self.choose_enemy_target())
+
+        message = outcome.full_message()
+        self.turns += 1
+        self.log.append(message)
+        self.end_turn(current)
+        return message
+
+    def choose_enemy_target(self):
+        """
+        Choose the party member an enemy attacks: a random one still standing.
+
+        Returns:
+            The targeted party member, or None if the whole party is down
+        """
+        living = self.living_party_members()
+        return self.rng.choice(living) if living else None
+
+    def end_turn(self, current):
+        """
+        End a combatant's turn and move on to the next one, unless the battle is over.
+
+        Args:
+            current: The combatant whose turn it was
+        """
+        if self.battle_over:
+            return
+        current.end_turn()
+        # A combatant felled by a counter-attack was already removed,
+        # which moved the turn order on to the next combatant
+        if current in self.turn_order.combatants:
+            self.turn_order.advance()
+
+    def run(self, policy=None, max_turns=1000):
+        """
+        Resolve the whole battle.
+
+        Args:
+            policy: Action policy for party members (see step)
+            max_turns: Safety limit on the number of turns
+
+        Returns:
+            BattleResult: The outcome of the battle
+        """
+        while not self.battle_over and self.turns < max_turns:
+            self.step(policy)
+
+        return BattleResult(
+            victory=self.victory,
+            fled=self.fled,
+            turns=self.turns,
+            xp_gained=self.xp_gained,
+            party_hp=sum(member.hp for member in self.party_members),
+            party_max_hp=sum(member.max_hp for member in self.party_members)
+        )
@@ -1,5 +1,11 @@
+"""
+Battle mechanics for the RPG game.
+Pure combat formulas, with no display or animation dependencies.
+"""
+import math
+
 class BattleMechanics:
-    def _calculate_hit_chance(self, attacker, defender):
+    def calculate_hit_chance(self, attacker, defender):
         """
         Calculate the chance to hit based on attacker's ACC and defender's SPD.
         
@@ -31,7 +37,7 @@ class BattleMechanics:
         
         return hit_chance
     
-    def _calculate_damage(self, attacker, defender):
+    def calculate_damage(self, attacker, defender):
         """
         Calculate damage based on attacker's ATK and defender's DEF stats.
         
@@ -47,12 +53,11 @@ class BattleMechanics:
     
         # If defender is defending, reduce all damage by 50% (rounded up)
         if defender.defending:
-            import math
             damage = math.ceil(damage / 2)
     
         return damage
     
-    def _calculate_magic_damage(self, caster, target, base_power):
+    def calculate_magic_damage(self, caster, target, base_power):
         """
         Calculate magic damage based on caster's INT and target's RES stats.
     
@@ -69,28 +74,33 @@ class BattleMechanics:
 
         # If target is defending, reduce all damage by 50% (rounded up)
         if target.defending:
-            import math
             damage = math.ceil(damage / 2)
     
         return damage
         
-    def _check_all_enemies_defeated(self):
+    def check_all_enemies_defeated(self, enemies):
         """
         Check if all enemies are defeated.
         
+        Args:
+            enemies: The enemies in the battle
+        
         Returns:
             bool: True if all enemies are defeated, False otherwise
         """
-        return all(enemy.is_defeated() for enemy in self.enemies)
+        return all(enemy.is_defeated() for enemy in enemies)
     
-    def _check_all_party_defeated(self):
+    def check_all_party_defeated(self, party_members):
         """
         Check if all party members are defeated.
         
+        Args:
+            party_members: The active party members in the battle
+        
         Returns:
             bool: True if all party members are defeated, False otherwise
         """
-        return all(character.is_defeated() for character in self.party.active_members)
+        return all(character.is_defeated() for character in party_members)
         
     def apply_damage(self, target, amount, damage_type="physical", attacker=None, battle_system=None):
         """
@@ -112,7 +122,6 @@ class BattleMechanics:
         # Apply defense reduction for defending targets
         if target.defending and damage_type == "physical":
             # Defenders take 50% damage (rounded up)
-            import math
             amount = math.ceil(amount / 2)
         
         # Apply damage to target
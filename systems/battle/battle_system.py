@@ -6,21 +6,21 @@ import pygame
 
 from constants import (BLACK, WHITE, MAX_LOG_SIZE, 
                       ORIGINAL_WIDTH, ORIGINAL_HEIGHT)
-from systems.battle.battle_mechanics import BattleMechanics
+from systems.battle.battle_core import BattleCore
 from systems.battle.battle_actions import BattleActions
 from systems.battle.battle_ui import BattleUI
 from systems.battle.battle_animations import BattleAnimations
 from systems.battle.battle_formation import BattleFormation
-from systems.battle.battle_visualizer import draw_battle_background
-from systems.battle.turn_order import TurnOrder
+from systems.ui.render_target import get_render_size
 from entities.player import Player
+from utils.rng import get_stream, EFFECTS_STREAM
 
 class BattleSystem:
     """
     Manages turn-based battles between player party and enemies.
     Coordinates the various battle subsystems.
     """
-    def __init__(self, party, enemies, text_speed_setting):
+    def __init__(self, party, enemies, text_speed_setting, background_seed=None, rng=None):
         """
         Initialize the battle system.
         
@@ -28,22 +28,28 @@ class BattleSystem:
             party: The player's party
             enemies: A list of enemy entities or a single enemy
             text_speed_setting: The current text speed setting
+            background_seed: Seed for the background layout, random if not given
+            rng: Random generator for battle rolls (optional)
         """
         self.party = party
         
+        # Keep the same background for the whole battle
+        if background_seed is None:
+            background_seed = get_stream(EFFECTS_STREAM).getrandbits(32)
+        self.background_seed = background_seed
+        
         # Ensure enemies is a list
         if not isinstance(enemies, list):
             self.enemies = [enemies]
         else:
             self.enemies = enemies
         
-        # Initialize turn order
-        self.turn_order = TurnOrder(party.active_members, self.enemies)
+        # The display-free core owns turn order, mechanics and battle state
+        self.core = BattleCore(party.active_members, self.enemies, rng=rng)
+        self.turn_order = self.core.turn_order
+        self.mechanics = self.core.mechanics
         
-        # Battle state
-        self.battle_over = False
-        self.victory = False
-        self.fled = False
+        # Presentation state
         self.text_speed = 2  # Default, will be set by text_speed_setting
         
         # Starting message
@@ -57,13 +63,12 @@ class BattleSystem:
             self.turn = 1  # Enemy's turn
         
         # Initialize formation system and position combatants
-        current_width, current_height = pygame.display.get_surface().get_size()
+        current_width, current_height = get_render_size()
         self.formation = BattleFormation(current_width, current_height)
         self.formation.position_party_members(party)
         self.formation.position_enemies(self.enemies)
         
-        # Initialize subsystems
-        self.mechanics = BattleMechanics()
+        # Initialize presentation subsystems
         self.ui = BattleUI(self)
         self.animations = BattleAnimations(self)
         self.actions = BattleActions(self)
@@ -74,6 +79,69 @@ class BattleSystem:
         # Set text speed 
         self.set_text_speed(text_speed_setting)
     
+    @property
+    def rng(self):
+        """Random generator used for all battle rolls."""
+        return self.core.rng
+    
+    @property
+    def battle_over(self):
+        """
+        Whether the battle has ended and its last action has finished playing.
+        
+        The core ends the battle as soon as the deciding action is resolved,
+        before its animation and messages have been shown.
+        """
+        return self.core.battle_over and not self.actions.action_processing
+    
+    @battle_over.setter
+    def battle_over(self, value):
+        self.core.battle_over = value
+    
+    @property
+    def victory(self):
+        """Whether the party won the battle."""
+        return self.core.victory
+    
+    @victory.setter
+    def victory(self, value):
+        self.core.victory = value
+    
+    @property
+    def fled(self):
+        """Whether the party fled the battle."""
+        return self.core.fled
+    
+    @fled.setter
+    def fled(self, value):
+        self.core.fled = value
+    
+    def calculate_hit_chance(self, attacker, defender):
+        """
+        Calculate the chance for an attack to hit (used by passives).
+        
+        Args:
+            attacker: The attacking entity
+            defender: The defending entity
+            
+        Returns:
+            float: The chance to hit as a decimal between 0 and 1
+        """
+        return self.core.calculate_hit_chance(attacker, defender)
+    
+    def calculate_damage(self, attacker, defender):
+        """
+        Calculate physical damage for an attack (used by passives).
+        
+        Args:
+            attacker: The attacking entity
+            defender: The defending entity
+            
+        Returns:
+            int: The calculated damage amount
+        """
+        return self.core.calculate_damage(attacker, defender)
+    
     def get_current_character(self):
         """
         Get the character whose turn it currently is.
@@ -177,7 +245,8 @@ class BattleSystem:
             self.animations.update()
             
             # Process enemy turn if it's enemy's turn and no animation is active
-            if (not self.is_player_turn() and 
+            if (not self.core.battle_over and
+                not self.is_player_turn() and 
                 not self.animations.enemy_attacking and 
                 not self.actions.action_processing):
                 self.actions.process_enemy_turn()
@@ -188,7 +257,7 @@ class BattleSystem:
     def _check_battle_over(self):
         """Check if the battle is over and set appropriate state."""
         # Skip if battle is already marked as over
-        if self.battle_over:
+        if self.core.battle_over:
             return
             
         # Check if all enemies are defeated
@@ -210,10 +279,7 @@ class BattleSystem:
         Args:
             screen: The pygame surface to draw on
         """
-        # Draw background
-        draw_battle_background(screen)
-        
-        # Draw UI components
+        # Draw UI components (includes the background)
         self.ui.draw(screen)
         
         # Draw animation effects
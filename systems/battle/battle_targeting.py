@@ -5,6 +5,9 @@ Handles target selection for both enemies and allies.
 import pygame
 from constants import WHITE, YELLOW, RED, GREEN, BLUE
 from entities.player import Player
+from systems.ui.font_manager import font_manager
+from systems.ui import draw
+from systems.ui.text_cache import render_text
 
 class TargetingSystem:
     """
@@ -158,11 +161,11 @@ class TargetingSystem:
                 indicator_color = YELLOW
                 
             # Draw the triangle
-            pygame.draw.polygon(screen, indicator_color, triangle_points)
+            draw.polygon(screen, indicator_color, triangle_points)
             
         # Highlight the selected target
         border_color = GREEN if isinstance(selected_target, Player) else YELLOW
-        pygame.draw.rect(screen, border_color, selected_target.rect, 2)
+        draw.rect(screen, border_color, selected_target.rect, 2)
         
         # Create a small info panel showing target stats
         panel_width = 120
@@ -181,9 +184,9 @@ class TargetingSystem:
         screen.blit(panel_surface, (panel_x, panel_y))
         
         # Draw target info
-        font = pygame.font.SysFont('Arial', 12)
-        name_text = font.render(f"{selected_target.name} Lv{selected_target.level}", True, WHITE)
-        hp_text = font.render(f"HP: {selected_target.hp}/{selected_target.max_hp}", True, GREEN)
+        font = font_manager.get_font(12, scaled=False)
+        name_text = render_text(font, f"{selected_target.name} Lv{selected_target.level}", WHITE)
+        hp_text = render_text(font, f"HP: {selected_target.hp}/{selected_target.max_hp}", GREEN)
         
         screen.blit(name_text, (panel_x + 5, panel_y + 5))
         screen.blit(hp_text, (panel_x + 5, panel_y + 20))
@@ -192,20 +195,20 @@ class TargetingSystem:
         instr_surface = pygame.Surface((200, 30), pygame.SRCALPHA)
         instr_surface.fill((0, 0, 0, 150))  # Semi-transparent black
         
-        instr_font = pygame.font.SysFont('Arial', 14)
+        instr_font = font_manager.get_font(14, scaled=False)
         
         if self.target_group == self.ENEMIES:
-            instr_text = font.render("Targeting Enemies (TAB to switch)", True, YELLOW)
+            instr_text = render_text(font, "Targeting Enemies (TAB to switch)", YELLOW)
         elif self.target_group == self.ALLIES:
-            instr_text = font.render("Targeting Allies (TAB to switch)", True, GREEN)
+            instr_text = render_text(font, "Targeting Allies (TAB to switch)", GREEN)
         else:
-            instr_text = font.render("Select a target", True, WHITE)
+            instr_text = render_text(font, "Select a target", WHITE)
             
         instr_x = (screen_width - instr_text.get_width()) // 2
         instr_y = screen_height - 40
         
         # Draw instruction background
-        pygame.draw.rect(screen, (0, 0, 0, 150), 
+        draw.rect(screen, (0, 0, 0, 150), 
                          (instr_x - 5, instr_y - 5, 
                           instr_text.get_width() + 10, 
                           instr_text.get_height() + 10))
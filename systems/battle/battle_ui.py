@@ -8,8 +8,11 @@ from constants import (
     BATTLE_OPTIONS, MAX_LOG_SIZE, ORIGINAL_WIDTH, ORIGINAL_HEIGHT,
     ORANGE, BLUE, DARK_BLUE, PURPLE, YELLOW
 )
-from systems.battle.targeting_system import TargetingSystem
-from utils.utils import scale_position, scale_dimensions, scale_font_size
+from systems.battle.battle_targeting import TargetingSystem
+from utils.utils import scale_position, scale_dimensions
+from systems.ui.font_manager import font_manager
+from systems.ui import draw
+from systems.ui.text_cache import render_text
 from entities.player import Player
 
 class BattleUI:
@@ -137,7 +140,7 @@ class BattleUI:
             screen: The pygame surface to draw on
         """
         from systems.battle.battle_visualizer import draw_battle_background
-        draw_battle_background(screen)
+        draw_battle_background(screen, self.battle_system.background_seed)
     
     def draw_combatants(self, screen):
         """
@@ -163,7 +166,7 @@ class BattleUI:
                     # Move character toward enemy during attack
                     if animations.animation_timer < animations.animation_duration / 2:
                         # Move toward target
-                        if hasattr(animations.target, 'battle_pos_x'):
+                        if getattr(animations.target, 'battle_pos_x', None) is not None:
                             # Direction vector
                             dx = animations.target.battle_pos_x - character.battle_pos_x
                             move_dist = int(30 * (current_width / ORIGINAL_WIDTH))
@@ -172,7 +175,7 @@ class BattleUI:
                                         (animations.animation_timer / (animations.animation_duration / 2)))
                     else:
                         # Move back to position
-                        if hasattr(animations.target, 'battle_pos_x'):
+                        if getattr(animations.target, 'battle_pos_x', None) is not None:
                             dx = animations.target.battle_pos_x - character.battle_pos_x
                             move_dist = int(30 * (current_width / ORIGINAL_WIDTH))
                             # Return from the direction of the target
@@ -181,15 +184,15 @@ class BattleUI:
                                         (animations.animation_duration / 2)))
                 
                 # Draw character with offset
-                pygame.draw.rect(screen, character.color,
+                draw.rect(screen, character.color,
                                 (character.rect.x + offset_x,
                                 character.rect.y + offset_y,
                                 character.rect.width,
                                 character.rect.height))
                                 
                 # Draw character name above them
-                name_font = pygame.font.SysFont('Arial', 14)
-                name_text = name_font.render(character.name, True, WHITE)
+                name_font = font_manager.get_font(14, scaled=False)
+                name_text = render_text(name_font, character.name, WHITE)
                 name_x = character.rect.centerx - name_text.get_width() // 2
                 name_y = character.rect.top - name_text.get_height() - 5
                 screen.blit(name_text, (name_x, name_y))
@@ -205,7 +208,7 @@ class BattleUI:
                     # Move enemy toward character during attack
                     if animations.animation_timer < animations.animation_duration / 2:
                         # Move toward target
-                        if hasattr(animations.target, 'battle_pos_x'):
+                        if getattr(animations.target, 'battle_pos_x', None) is not None:
                             # Direction vector
                             dx = animations.target.battle_pos_x - enemy.battle_pos_x
                             move_dist = int(30 * (current_width / ORIGINAL_WIDTH))
@@ -214,7 +217,7 @@ class BattleUI:
                                         (animations.animation_timer / (animations.animation_duration / 2)))
                     else:
                         # Move back to position
-                        if hasattr(animations.target, 'battle_pos_x'):
+                        if getattr(animations.target, 'battle_pos_x', None) is not None:
                             dx = animations.target.battle_pos_x - enemy.battle_pos_x
                             move_dist = int(30 * (current_width / ORIGINAL_WIDTH))
                             # Return from the direction of the target
@@ -223,7 +226,7 @@ class BattleUI:
                                         (animations.animation_duration / 2)))
                 
                 # Draw enemy with offset
-                pygame.draw.rect(screen, enemy.color,
+                draw.rect(screen, enemy.color,
                                 (enemy.rect.x + offset_x,
                                 enemy.rect.y + offset_y,
                                 enemy.rect.width,
@@ -237,11 +240,9 @@ class BattleUI:
         # Draw turn order indicator
         from systems.battle.battle_ui_party import draw_party_status, draw_turn_order_indicator
         
-        # Create fonts for status display
-        font_size = scale_font_size(24, ORIGINAL_WIDTH, ORIGINAL_HEIGHT, current_width, current_height)
-        small_font_size = scale_font_size(16, ORIGINAL_WIDTH, ORIGINAL_HEIGHT, current_width, current_height)
-        font = pygame.font.SysFont('Arial', font_size)
-        small_font = pygame.font.SysFont('Arial', small_font_size)
+        # Get fonts for status display
+        font = font_manager.get_font(24, resolution=(current_width, current_height))
+        small_font = font_manager.get_font(16, resolution=(current_width, current_height))
         
         # Draw turn indicator and party status
         draw_turn_order_indicator(screen, self.battle_system)
@@ -257,13 +258,9 @@ class BattleUI:
         # Get current screen dimensions
         current_width, current_height = screen.get_size()
         
-        # Scale font sizes
-        font_size = scale_font_size(24, ORIGINAL_WIDTH, ORIGINAL_HEIGHT, current_width, current_height)
-        small_font_size = scale_font_size(18, ORIGINAL_WIDTH, ORIGINAL_HEIGHT, current_width, current_height)
-        
-        # Create the scaled fonts
-        font = pygame.font.SysFont('Arial', font_size)
-        small_font = pygame.font.SysFont('Arial', small_font_size)
+        # Get the scaled fonts
+        font = font_manager.get_font(24, resolution=(current_width, current_height))
+        small_font = font_manager.get_font(18, resolution=(current_width, current_height))
         
         # Draw battle message log
         self._draw_message_log(screen, font)
@@ -324,8 +321,8 @@ class BattleUI:
             message_box_width, 
             message_box_height
         )
-        pygame.draw.rect(screen, (0, 0, 0, 200), message_box_rect)
-        pygame.draw.rect(screen, WHITE, message_box_rect, max(1, int(2 * (current_width / ORIGINAL_WIDTH))))
+        draw.rect(screen, (0, 0, 0, 200), message_box_rect)
+        draw.rect(screen, WHITE, message_box_rect, max(1, int(2 * (current_width / ORIGINAL_WIDTH))))
         
         # Scale text positions
         message_x = message_box_x + int(10 * (current_width / ORIGINAL_WIDTH))
@@ -372,12 +369,12 @@ class BattleUI:
         )
         
         # Draw box background and border
-        pygame.draw.rect(screen, (0, 0, 0, 200), (options_box_x, options_box_y, options_box_width, options_box_height))
+        draw.rect(screen, (0, 0, 0, 200), (options_box_x, options_box_y, options_box_width, options_box_height))
         border_width = max(1, int(2 * (current_width / ORIGINAL_WIDTH)))
-        pygame.draw.rect(screen, WHITE, (options_box_x, options_box_y, options_box_width, options_box_height), border_width)
+        draw.rect(screen, WHITE, (options_box_x, options_box_y, options_box_width, options_box_height), border_width)
         
         # Draw character name
-        char_text = font.render(f"{character.name}'s Turn", True, GREEN)
+        char_text = render_text(font, f"{character.name}'s Turn", GREEN)
         header_x = options_box_x + (options_box_width // 2) - (char_text.get_width() // 2)
         header_y = options_box_y + int(10 * (current_height / ORIGINAL_HEIGHT))
         screen.blit(char_text, (header_x, header_y))
@@ -396,9 +393,9 @@ class BattleUI:
             
             if i == self.selected_option:
                 # Highlight selected option
-                option_text = font.render(f"> {option}", True, WHITE)
+                option_text = render_text(font, f"> {option}", WHITE)
             else:
-                option_text = font.render(f"  {option}", True, GRAY)
+                option_text = render_text(font, f"  {option}", GRAY)
             screen.blit(option_text, (left_column_x, option_y))
         
         # Right column (next 4 options)
@@ -408,9 +405,9 @@ class BattleUI:
             
             if i == self.selected_option:
                 # Highlight selected option
-                option_text = font.render(f"> {option}", True, WHITE)
+                option_text = render_text(font, f"> {option}", WHITE)
             else:
-                option_text = font.render(f"  {option}", True, GRAY)
+                option_text = render_text(font, f"  {option}", GRAY)
             screen.blit(option_text, (right_column_x, option_y))
     
     def _draw_spell_menu(self, screen, font, small_font, character):
@@ -435,12 +432,12 @@ class BattleUI:
         )
         
         # Draw box background and border
-        pygame.draw.rect(screen, (0, 0, 0, 200), (spell_box_x, spell_box_y, spell_box_width, spell_box_height))
+        draw.rect(screen, (0, 0, 0, 200), (spell_box_x, spell_box_y, spell_box_width, spell_box_height))
         border_width = max(1, int(2 * (current_width / ORIGINAL_WIDTH)))
-        pygame.draw.rect(screen, PURPLE, (spell_box_x, spell_box_y, spell_box_width, spell_box_height), border_width)
+        draw.rect(screen, PURPLE, (spell_box_x, spell_box_y, spell_box_width, spell_box_height), border_width)
         
         # Draw "Magic" header
-        magic_text = font.render(f"{character.name}'s Magic", True, PURPLE)
+        magic_text = render_text(font, f"{character.name}'s Magic", PURPLE)
         header_x = spell_box_x + (spell_box_width // 2) - (magic_text.get_width() // 2)
         header_y = spell_box_y + int(10 * (current_height / ORIGINAL_HEIGHT))
         screen.blit(magic_text, (header_x, header_y))
@@ -463,9 +460,9 @@ class BattleUI:
             if spell_name == "BACK":
                 # Draw BACK option
                 if i == self.selected_spell_option:
-                    option_text = font.render(f"> {spell_name}", True, WHITE)
+                    option_text = render_text(font, f"> {spell_name}", WHITE)
                 else:
-                    option_text = font.render(f"  {spell_name}", True, GRAY)
+                    option_text = render_text(font, f"  {spell_name}", GRAY)
                 screen.blit(option_text, (option_x, option_y))
             else:
                 # Get the spell data
@@ -480,20 +477,20 @@ class BattleUI:
                         name_color = WHITE  # Can cast
                     else:
                         name_color = RED    # Can't cast (not enough SP)
-                    option_text = font.render(f"> {spell_name}", True, name_color)
+                    option_text = render_text(font, f"> {spell_name}", name_color)
                 else:
                     # Unselected spell
                     if has_sp:
                         name_color = GRAY   # Can cast
                     else:
                         name_color = RED    # Can't cast (not enough SP)
-                    option_text = font.render(f"  {spell_name}", True, name_color)
+                    option_text = render_text(font, f"  {spell_name}", name_color)
                 
                 # Draw spell name
                 screen.blit(option_text, (option_x, option_y))
                 
                 # Draw SP cost
-                sp_text = small_font.render(f"{spell.sp_cost} SP", True, BLUE)
+                sp_text = render_text(small_font, f"{spell.sp_cost} SP", BLUE)
                 screen.blit(sp_text, (sp_cost_x, option_y))
         
         # Draw spell description for selected spell
@@ -501,7 +498,7 @@ class BattleUI:
             spell = character.spellbook.get_spell(options[self.selected_spell_option])
             if spell:
                 desc_y = option_y_base + len(options) * option_line_height + int(10 * (current_height / ORIGINAL_HEIGHT))
-                desc_text = small_font.render(spell.description, True, WHITE)
+                desc_text = render_text(small_font, spell.description, WHITE)
                 screen.blit(desc_text, (option_x, desc_y))
     
     def _draw_skill_menu(self, screen, font, small_font, character):
@@ -526,12 +523,12 @@ class BattleUI:
         )
         
         # Draw box background and border
-        pygame.draw.rect(screen, (0, 0, 0, 200), (skill_box_x, skill_box_y, skill_box_width, skill_box_height))
+        draw.rect(screen, (0, 0, 0, 200), (skill_box_x, skill_box_y, skill_box_width, skill_box_height))
         border_width = max(1, int(2 * (current_width / ORIGINAL_WIDTH)))
-        pygame.draw.rect(screen, YELLOW, (skill_box_x, skill_box_y, skill_box_width, skill_box_height), border_width)
+        draw.rect(screen, YELLOW, (skill_box_x, skill_box_y, skill_box_width, skill_box_height), border_width)
         
         # Draw "Skills" header
-        skills_text = font.render(f"{character.name}'s Skills", True, YELLOW)
+        skills_text = render_text(font, f"{character.name}'s Skills", YELLOW)
         header_x = skill_box_x + (skill_box_width // 2) - (skills_text.get_width() // 2)
         header_y = skill_box_y + int(10 * (current_height / ORIGINAL_HEIGHT))
         screen.blit(skills_text, (header_x, header_y))
@@ -554,9 +551,9 @@ class BattleUI:
             if skill_name == "BACK":
                 # Draw BACK option
                 if i == self.selected_skill_option:
-                    option_text = font.render(f"> {skill_name}", True, WHITE)
+                    option_text = render_text(font, f"> {skill_name}", WHITE)
                 else:
-                    option_text = font.render(f"  {skill_name}", True, GRAY)
+                    option_text = render_text(font, f"  {skill_name}", GRAY)
                 screen.blit(option_text, (option_x, option_y))
             else:
                 # Get the skill data
@@ -577,14 +574,14 @@ class BattleUI:
                         name_color = WHITE  # Can use
                     else:
                         name_color = RED    # Can't use (not enough resources)
-                    option_text = font.render(f"> {skill_name}", True, name_color)
+                    option_text = render_text(font, f"> {skill_name}", name_color)
                 else:
                     # Unselected skill
                     if has_resources:
                         name_color = GRAY   # Can use
                     else:
                         name_color = RED    # Can't use (not enough resources)
-                    option_text = font.render(f"  {skill_name}", True, name_color)
+                    option_text = render_text(font, f"  {skill_name}", name_color)
                 
                 # Draw skill name
                 screen.blit(option_text, (option_x, option_y))
@@ -592,11 +589,11 @@ class BattleUI:
                 # Draw cost if applicable
                 if skill.cost_type != "none":
                     if skill.cost_type == "sp":
-                        cost_text = small_font.render(f"{skill.sp_cost} SP", True, BLUE)
+                        cost_text = render_text(small_font, f"{skill.sp_cost} SP", BLUE)
                     elif skill.cost_type == "hp":
-                        cost_text = small_font.render(f"{skill.hp_cost} HP", True, ORANGE)
+                        cost_text = render_text(small_font, f"{skill.hp_cost} HP", ORANGE)
                     elif skill.cost_type == "both":
-                        cost_text = small_font.render(f"{skill.hp_cost}HP/{skill.sp_cost}SP", True, PURPLE)
+                        cost_text = render_text(small_font, f"{skill.hp_cost}HP/{skill.sp_cost}SP", PURPLE)
                     screen.blit(cost_text, (cost_x, option_y))
         
         # Draw skill description for selected skill
@@ -604,7 +601,7 @@ class BattleUI:
             skill = character.skillset.get_skill(options[self.selected_skill_option])
             if skill:
                 desc_y = option_y_base + len(options) * option_line_height + int(10 * (current_height / ORIGINAL_HEIGHT))
-                desc_text = small_font.render(skill.description, True, WHITE)
+                desc_text = render_text(small_font, skill.description, WHITE)
                 screen.blit(desc_text, (option_x, desc_y))
 
     def _draw_ultimate_menu(self, screen, font, small_font, character):
@@ -629,12 +626,12 @@ class BattleUI:
         )
         
         # Draw box background and border
-        pygame.draw.rect(screen, (0, 0, 0, 200), (ultimate_box_x, ultimate_box_y, ultimate_box_width, ultimate_box_height))
+        draw.rect(screen, (0, 0, 0, 200), (ultimate_box_x, ultimate_box_y, ultimate_box_width, ultimate_box_height))
         border_width = max(1, int(2 * (current_width / ORIGINAL_WIDTH)))
-        pygame.draw.rect(screen, RED, (ultimate_box_x, ultimate_box_y, ultimate_box_width, ultimate_box_height), border_width)
+        draw.rect(screen, RED, (ultimate_box_x, ultimate_box_y, ultimate_box_width, ultimate_box_height), border_width)
         
         # Draw "Ultimate" header
-        ultimate_text = font.render(f"{character.name}'s Ultimates", True, RED)
+        ultimate_text = render_text(font, f"{character.name}'s Ultimates", RED)
         header_x = ultimate_box_x + (ultimate_box_width // 2) - (ultimate_text.get_width() // 2)
         header_y = ultimate_box_y + int(10 * (current_height / ORIGINAL_HEIGHT))
         screen.blit(ultimate_text, (header_x, header_y))
@@ -657,9 +654,9 @@ class BattleUI:
             if ultimate_name == "BACK":
                 # Draw BACK option
                 if i == self.selected_ultimate_option:
-                    option_text = font.render(f"> {ultimate_name}", True, WHITE)
+                    option_text = render_text(font, f"> {ultimate_name}", WHITE)
                 else:
-                    option_text = font.render(f"  {ultimate_name}", True, GRAY)
+                    option_text = render_text(font, f"  {ultimate_name}", GRAY)
                 screen.blit(option_text, (option_x, option_y))
             else:
                 # Get the ultimate data
@@ -674,21 +671,21 @@ class BattleUI:
                         name_color = WHITE  # Can use
                     else:
                         name_color = RED    # Can't use (already used)
-                    option_text = font.render(f"> {ultimate_name}", True, name_color)
+                    option_text = render_text(font, f"> {ultimate_name}", name_color)
                 else:
                     # Unselected ultimate
                     if is_available:
                         name_color = GRAY   # Can use
                     else:
                         name_color = RED    # Can't use (already used)
-                    option_text = font.render(f"  {ultimate_name}", True, name_color)
+                    option_text = render_text(font, f"  {ultimate_name}", name_color)
                 
                 # Draw ultimate name
                 screen.blit(option_text, (option_x, option_y))
                 
                 # Draw availability status
-                status_text = small_font.render("READY" if is_available else "USED", True, 
-                                            GREEN if is_available else RED)
+                status_text = render_text(small_font, "READY" if is_available else "USED",
+                                          GREEN if is_available else RED)
                 screen.blit(status_text, (status_x, option_y))
         
         # Draw ultimate description for selected ultimate
@@ -696,7 +693,7 @@ class BattleUI:
             ultimate = character.ultimates.get_ultimate(options[self.selected_ultimate_option])
             if ultimate:
                 desc_y = option_y_base + len(options) * option_line_height + int(10 * (current_height / ORIGINAL_HEIGHT))
-                desc_text = small_font.render(ultimate.description, True, WHITE)
+                desc_text = render_text(small_font, ultimate.description, WHITE)
                 screen.blit(desc_text, (option_x, desc_y))
 
     def handle_targeting_input(self, event):
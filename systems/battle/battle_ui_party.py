@@ -6,8 +6,11 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from constants import (WHITE, GREEN, RED, GRAY, BLUE, DARK_BLUE, SCREEN_WIDTH, SCREEN_HEIGHT, 
-                      ORIGINAL_WIDTH, ORIGINAL_HEIGHT, ORANGE, YELLOW)
-from utils.utils import scale_position, scale_dimensions, scale_font_size
+                      ORIGINAL_WIDTH, ORIGINAL_HEIGHT, ORANGE, YELLOW, TURN_FORECAST_LENGTH)
+from utils.utils import scale_position, scale_dimensions
+from systems.ui.font_manager import font_manager
+from systems.ui import draw
+from systems.ui.text_cache import render_text
 
 def draw_party_status(screen, party, turn_order, font, small_font):
     """
@@ -34,19 +37,19 @@ def draw_party_status(screen, party, turn_order, font, small_font):
     )
     
     # Draw window background and border
-    pygame.draw.rect(screen, (0, 0, 0, 200), (window_x, window_y, window_width, window_height))
+    draw.rect(screen, (0, 0, 0, 200), (window_x, window_y, window_width, window_height))
     border_width = max(1, int(2 * (current_width / ORIGINAL_WIDTH)))
-    pygame.draw.rect(screen, WHITE, (window_x, window_y, window_width, window_height), border_width)
+    draw.rect(screen, WHITE, (window_x, window_y, window_width, window_height), border_width)
     
     # Draw party header
-    party_text = font.render("Party", True, WHITE)
+    party_text = render_text(font, "Party", WHITE)
     header_x = window_x + int(10 * (current_width / ORIGINAL_WIDTH))
     header_y = window_y + int(5 * (current_height / ORIGINAL_HEIGHT))
     screen.blit(party_text, (header_x, header_y))
     
     # Draw divider line
     divider_y = header_y + int(25 * (current_height / ORIGINAL_HEIGHT))
-    pygame.draw.line(
+    draw.line(
         screen, WHITE, 
         (window_x + border_width, divider_y), 
         (window_x + window_width - border_width, divider_y),
@@ -71,7 +74,7 @@ def draw_party_status(screen, party, turn_order, font, small_font):
         # Draw character name and level
         name_color = YELLOW if is_current else WHITE
         name_text = f"{character.name} Lv{character.level}"
-        name_surface = small_font.render(name_text, True, name_color)
+        name_surface = render_text(small_font, name_text, name_color)
         screen.blit(name_surface, (header_x, char_y))
         
         # Draw HP bar
@@ -79,15 +82,15 @@ def draw_party_status(screen, party, turn_order, font, small_font):
         bar_x = header_x + int(100 * (current_width / ORIGINAL_WIDTH))
         
         # Background (gray)
-        pygame.draw.rect(screen, GRAY, (bar_x, hp_bar_y, bar_width, bar_height))
+        draw.rect(screen, GRAY, (bar_x, hp_bar_y, bar_width, bar_height))
         
         # Fill with current HP (orange)
         if character.max_hp > 0:
             hp_fill_width = int((character.hp / character.max_hp) * bar_width)
-            pygame.draw.rect(screen, ORANGE, (bar_x, hp_bar_y, hp_fill_width, bar_height))
+            draw.rect(screen, ORANGE, (bar_x, hp_bar_y, hp_fill_width, bar_height))
         
         # HP text
-        hp_text = small_font.render(f"HP: {character.hp}/{character.max_hp}", True, WHITE)
+        hp_text = render_text(small_font, f"HP: {character.hp}/{character.max_hp}", WHITE)
         hp_text_x = header_x
         hp_text_y = hp_bar_y - int(2 * (current_height / ORIGINAL_HEIGHT))
         screen.blit(hp_text, (hp_text_x, hp_text_y))
@@ -96,15 +99,15 @@ def draw_party_status(screen, party, turn_order, font, small_font):
         sp_bar_y = hp_bar_y + bar_height + int(5 * (current_height / ORIGINAL_HEIGHT))
         
         # Background (gray)
-        pygame.draw.rect(screen, GRAY, (bar_x, sp_bar_y, bar_width, bar_height))
+        draw.rect(screen, GRAY, (bar_x, sp_bar_y, bar_width, bar_height))
         
         # Fill with current SP (blue)
         if character.max_sp > 0:
             sp_fill_width = int((character.sp / character.max_sp) * bar_width)
-            pygame.draw.rect(screen, BLUE, (bar_x, sp_bar_y, sp_fill_width, bar_height))
+            draw.rect(screen, BLUE, (bar_x, sp_bar_y, sp_fill_width, bar_height))
         
         # SP text
-        sp_text = small_font.render(f"SP: {character.sp}/{character.max_sp}", True, WHITE)
+        sp_text = render_text(small_font, f"SP: {character.sp}/{character.max_sp}", WHITE)
         sp_text_x = header_x
         sp_text_y = sp_bar_y - int(2 * (current_height / ORIGINAL_HEIGHT))
         screen.blit(sp_text, (sp_text_x, sp_text_y))
@@ -120,18 +123,19 @@ def draw_turn_order_indicator(screen, battle_system):
     # Get current screen dimensions
     current_width, current_height = screen.get_size()
     
-    # Get the current combatant
-    current_combatant = battle_system.turn_order.get_current()
-    if not current_combatant:
+    # Read the cached forecast; the current combatant comes first
+    forecast = battle_system.turn_order.forecast(TURN_FORECAST_LENGTH)
+    if not forecast:
         return
+    current_combatant = forecast[0]
     
     # Create the indicator text
-    font = pygame.font.SysFont('Arial', scale_font_size(18, ORIGINAL_WIDTH, ORIGINAL_HEIGHT, current_width, current_height))
+    font = font_manager.get_font(18, resolution=(current_width, current_height))
     
     if current_combatant in battle_system.party.active_members:
-        turn_text = font.render(f"{current_combatant.name}'s Turn", True, GREEN)
+        turn_text = render_text(font, f"{current_combatant.name}'s Turn", GREEN)
     else:
-        turn_text = font.render(f"{current_combatant.name}'s Turn", True, RED)
+        turn_text = render_text(font, f"{current_combatant.name}'s Turn", RED)
     
     # Position at top center of screen
     indicator_x = (current_width // 2) - (turn_text.get_width() // 2)
@@ -141,8 +145,16 @@ def draw_turn_order_indicator(screen, battle_system):
     bg_rect = pygame.Rect(indicator_x - 5, indicator_y - 5, 
                           turn_text.get_width() + 10, 
                           turn_text.get_height() + 10)
-    pygame.draw.rect(screen, (0, 0, 0), bg_rect)
-    pygame.draw.rect(screen, WHITE, bg_rect, 1)
+    draw.rect(screen, (0, 0, 0), bg_rect)
+    draw.rect(screen, WHITE, bg_rect, 1)
     
     # Draw the text
-    screen.blit(turn_text, (indicator_x, indicator_y))
\ No newline at end of file
+    screen.blit(turn_text, (indicator_x, indicator_y))
+    
+    # Show who acts after the current combatant
+    if len(forecast) > 1:
+        small_font = font_manager.get_font(14, resolution=(current_width, current_height))
+        names = " > ".join(c.name for c in forecast[1:])
+        next_text = render_text(small_font, f"Next: {names}", WHITE)
+        next_x = (current_width // 2) - (next_text.get_width() // 2)
+        screen.blit(next_text, (next_x, bg_rect.bottom + 4))
\ No newline at end of file
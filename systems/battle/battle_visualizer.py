@@ -6,21 +6,58 @@ import pygame
 import random
 import sys
 import os
+from math import sin, cos, radians
 from constants import (BLACK, WHITE, GREEN, RED, BLUE, PURPLE, YELLOW, 
                      ORIGINAL_WIDTH, ORIGINAL_HEIGHT)
+from systems.battle.effect_atlas import effect_atlas
 
-def draw_battle_background(screen):
+# Rendered backgrounds keyed by (width, height, seed)
+_background_cache = {}
+MAX_CACHED_BACKGROUNDS = 4
+
+def draw_battle_background(screen, seed=None):
     """
     Draw the battle background.
     
+    The background is rendered once per resolution and seed, then blitted
+    from the cache on later frames.
+    
     Args:
         screen: The pygame surface to draw on
+        seed: Seed for the hill layout, so a battle keeps the same background
     """
     # Get current screen dimensions
     current_width, current_height = screen.get_size()
     
+    key = (current_width, current_height, seed)
+    background = _background_cache.get(key)
+    if background is None:
+        background = _render_battle_background(current_width, current_height, seed)
+        
+        # Drop the oldest background if the cache is full
+        if len(_background_cache) >= MAX_CACHED_BACKGROUNDS:
+            del _background_cache[next(iter(_background_cache))]
+        _background_cache[key] = background
+    
+    screen.blit(background, (0, 0))
+
+def _render_battle_background(current_width, current_height, seed):
+    """
+    Render the battle background onto a new surface.
+    
+    Args:
+        current_width: Width of the background
+        current_height: Height of the background
+        seed: Seed for the hill layout
+        
+    Returns:
+        pygame.Surface: The rendered background
+    """
+    surface = pygame.Surface((current_width, current_height))
+    rng = random.Random(seed)
+    
     # Fill with dark blue-gray gradient
-    screen.fill((20, 20, 30))
+    surface.fill((20, 20, 30))
     
     # Draw some simple ground
     ground_height = current_height // 4
@@ -31,7 +68,7 @@ def draw_battle_background(screen):
         # Gradient from dark green to lighter brown-green
         color_value = 40 + int(y * 0.6)
         ground_color = (color_value, color_value + 20, color_value // 2)
-        pygame.draw.line(screen, ground_color, 
+        pygame.draw.line(surface, ground_color, 
                        (0, ground_y + y), 
                        (current_width, ground_y + y))
     
@@ -39,16 +76,16 @@ def draw_battle_background(screen):
     # Draw a few random distant mountains/hills
     for i in range(5):
         # Calculate hill parameters
-        hill_width = random.randint(int(current_width // 3), int(current_width // 1.5))
-        hill_height = random.randint(int(current_height // 10), int(current_height // 6))
-        hill_x = random.randint(-hill_width // 2, current_width - hill_width // 2)
+        hill_width = rng.randint(int(current_width // 3), int(current_width // 1.5))
+        hill_height = rng.randint(int(current_height // 10), int(current_height // 6))
+        hill_x = rng.randint(-hill_width // 2, current_width - hill_width // 2)
         hill_y = ground_y
         
         # Random dark color for the hill
         hill_color = (
-            random.randint(30, 50),
-            random.randint(40, 60),
-            random.randint(50, 70)
+            rng.randint(30, 50),
+            rng.randint(40, 60),
+            rng.randint(50, 70)
         )
         
         # Draw hill as a simple arc
@@ -64,7 +101,9 @@ def draw_battle_background(screen):
         
         # Draw the hill
         if len(points) >= 3:  # Need at least 3 points for a polygon
-            pygame.draw.polygon(screen, hill_color, points)
+            pygame.draw.polygon(surface, hill_color, points)
+    
+    return surface
 
 class BattleVisualizer:
     """
@@ -136,25 +175,54 @@ class BattleVisualizer:
         Args:
             screen: The pygame surface to draw on
         """
-        # Draw each effect
+        resolution = screen.get_size()
+        
+        # Draw each effect from its pre-rendered frames
         for effect in self.effects:
-            if effect["type"] == "hit":
-                self._draw_hit_effect(screen, effect)
-            elif effect["type"] == "fire":
-                self._draw_fire_effect(screen, effect)
-            elif effect["type"] == "heal":
-                self._draw_heal_effect(screen, effect)
+            effect_key = ("visualizer", effect["type"], effect["size"], resolution)
+            frames = effect_atlas.get_frames(
+                effect_key, effect["duration"],
+                lambda frame, effect=effect: self._render_effect_frame(effect, frame)
+            )
+            effect_surface = frames[effect["current_frame"]]
+            
+            # Draw the effect at the target position
+            size = effect_surface.get_width() // 2
+            screen.blit(effect_surface, 
+                      (effect["position"][0] - size, 
+                       effect["position"][1] - size))
     
-    def _draw_hit_effect(self, screen, effect):
+    def _render_effect_frame(self, effect, frame):
         """
-        Draw a hit effect.
+        Render a single animation frame of an effect.
         
         Args:
-            screen: The pygame surface to draw on
             effect: The effect data
+            frame: Index of the frame to render
+            
+        Returns:
+            pygame.Surface: The rendered frame
+        """
+        if effect["type"] == "hit":
+            return self._draw_hit_effect(effect, frame)
+        elif effect["type"] == "fire":
+            return self._draw_fire_effect(effect, frame)
+        elif effect["type"] == "heal":
+            return self._draw_heal_effect(effect, frame)
+    
+    def _draw_hit_effect(self, effect, frame):
+        """
+        Render one frame of a hit effect.
+        
+        Args:
+            effect: The effect data
+            frame: Index of the frame to render
+            
+        Returns:
+            pygame.Surface: The rendered frame
         """
         # Calculate effect parameters
-        progress = effect["current_frame"] / effect["duration"]
+        progress = frame / effect["duration"]
         size = int(effect["size"] * (1 - progress))
         alpha = int(255 * (1 - progress))
         
@@ -166,27 +234,26 @@ class BattleVisualizer:
         
         # Draw some radiating lines
         for angle in range(0, 360, 45):
-            from math import sin, cos, radians
             end_x = size + int(size * 0.8 * cos(radians(angle)))
             end_y = size + int(size * 0.8 * sin(radians(angle)))
             pygame.draw.line(effect_surface, (*WHITE, alpha), 
                            (size, size), (end_x, end_y), 2)
         
-        # Draw the effect at the target position
-        screen.blit(effect_surface, 
-                  (effect["position"][0] - size, 
-                   effect["position"][1] - size))
+        return effect_surface
     
-    def _draw_fire_effect(self, screen, effect):
+    def _draw_fire_effect(self, effect, frame):
         """
-        Draw a fire spell effect.
+        Render one frame of a fire spell effect.
         
         Args:
-            screen: The pygame surface to draw on
             effect: The effect data
+            frame: Index of the frame to render
+            
+        Returns:
+            pygame.Surface: The rendered frame
         """
         # Calculate effect parameters
-        progress = effect["current_frame"] / effect["duration"]
+        progress = frame / effect["duration"]
         size = int(effect["size"] * (1 - progress * 0.5))  # Maintain size longer
         alpha = int(255 * (1 - progress))
         
@@ -207,29 +274,30 @@ class BattleVisualizer:
                              (size, size - offset_y), 
                              int(circle_size))
         
-        # Add some random sparks
+        # Add some random sparks, seeded per frame so the atlas is stable
+        rng = random.Random(frame)
         for _ in range(5):
-            spark_x = random.randint(size // 2, size + size // 2)
-            spark_y = random.randint(size // 2, size + size // 2)
-            spark_size = random.randint(1, 3)
+            spark_x = rng.randint(size // 2, size + size // 2)
+            spark_y = rng.randint(size // 2, size + size // 2)
+            spark_size = rng.randint(1, 3)
             pygame.draw.circle(effect_surface, (255, 255, 200, alpha),
                              (spark_x, spark_y), spark_size)
         
-        # Draw the effect at the target position
-        screen.blit(effect_surface, 
-                  (effect["position"][0] - size, 
-                   effect["position"][1] - size))
+        return effect_surface
     
-    def _draw_heal_effect(self, screen, effect):
+    def _draw_heal_effect(self, effect, frame):
         """
-        Draw a healing spell effect.
+        Render one frame of a healing spell effect.
         
         Args:
-            screen: The pygame surface to draw on
             effect: The effect data
+            frame: Index of the frame to render
+            
+        Returns:
+            pygame.Surface: The rendered frame
         """
         # Calculate effect parameters
-        progress = effect["current_frame"] / effect["duration"]
+        progress = frame / effect["duration"]
         size = int(effect["size"] * (1 - progress * 0.3))  # Maintain size longer
         alpha = int(255 * (1 - progress))
         
@@ -240,7 +308,6 @@ class BattleVisualizer:
         num_particles = 12
         for i in range(num_particles):
             angle = (i / num_particles) * 360
-            from math import sin, cos, radians
             
             # Particle position (moves upward over time)
             radius = size * 0.7 * (1 - progress * 0.5)
@@ -271,7 +338,4 @@ class BattleVisualizer:
                        (size, size + plus_size),
                        plus_thickness)
         
-        # Draw the effect at the target position
-        screen.blit(effect_surface, 
-                  (effect["position"][0] - size, 
-                   effect["position"][1] - size))
\ No newline at end of file
+        return effect_surface
\ No newline at end of file
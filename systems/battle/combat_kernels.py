@@ -0,0 +1,125 @@
+"""
+Vectorized combat formulas for the RPG game.
+Array versions of the BattleMechanics formulas that evaluate many
+attacker/defender pairs at once (for AI lookahead, area abilities and batch
+simulation). Results match the scalar formulas exactly.
+"""
+import numpy as np
+
+# Stats gathered by combatant_arrays
+STAT_NAMES = ("attack", "defense", "intelligence", "resilience", "acc", "spd")
+
+def combatant_arrays(combatants):
+    """
+    Gather the combat stats of a list of entities into arrays.
+
+    Args:
+        combatants: List of entities
+
+    Returns:
+        dict: Stat name -> int64 array, plus "defending" -> bool array
+    """
+    arrays = {
+        stat: np.array([getattr(c, stat) for c in combatants], dtype=np.int64)
+        for stat in STAT_NAMES
+    }
+    arrays["defending"] = np.array([bool(c.defending) for c in combatants], dtype=bool)
+    return arrays
+
+def hit_chance(acc, spd, defending):
+    """
+    Calculate hit chances from attacker ACC and defender SPD.
+
+    Arguments broadcast against each other, so attacker arrays shaped (A, 1)
+    and defender arrays shaped (D,) give an (A, D) matrix.
+
+    Args:
+        acc: Attacker accuracy
+        spd: Defender speed
+        defending: Whether each defender is defending
+
+    Returns:
+        np.ndarray: Chances to hit between 0 and 1
+    """
+    acc = np.asarray(acc)
+    spd = np.asarray(spd)
+
+    # 90% when ACC equals SPD, +5% per point above (capped at 99%),
+    # -20% per point below (at least 10%)
+    above = np.minimum(0.99, 0.9 + (acc - spd) * 0.05)
+    below = np.maximum(0.1, 0.9 - (spd - acc) * 0.2)
+    chance = np.where(acc >= spd, above, below)
+
+    # Defending lowers the hit chance by 25%
+    return np.where(defending, np.maximum(0, chance - 0.25), chance)
+
+def _halve_if_defending(damage, defending):
+    """
+    Halve damage (rounded up) against defending targets.
+
+    Args:
+        damage: Integer damage array
+        defending: Whether each target is defending
+
+    Returns:
+        np.ndarray: Adjusted damage
+    """
+    # Integer ceil(damage / 2), same as math.ceil for ints
+    return np.where(defending, -(-damage // 2), damage)
+
+def physical_damage(attack, defense, defending):
+    """
+    Calculate physical damage from attacker ATK and defender DEF.
+
+    Args:
+        attack: Attacker attack
+        defense: Defender defense
+        defending: Whether each defender is defending
+
+    Returns:
+        np.ndarray: Integer damage amounts
+    """
+    damage = np.maximum(1, np.asarray(attack) - np.asarray(defense))
+    return _halve_if_defending(damage, defending)
+
+def magic_damage(intelligence, resilience, base_power, defending):
+    """
+    Calculate magic damage from caster INT, spell power and target RES.
+
+    Args:
+        intelligence: Caster intelligence
+        resilience: Target resilience
+        base_power: Base power of the spell (scalar or array)
+        defending: Whether each target is defending
+
+    Returns:
+        np.ndarray: Integer damage amounts
+    """
+    damage = np.maximum(1, (np.asarray(intelligence) + base_power) - np.asarray(resilience))
+    return _halve_if_defending(damage, defending)
+
+def pair_matrices(attackers, defenders, base_power=None):
+    """
+    Evaluate every attacker/defender pair.
+
+    Args:
+        attackers: List of attacking entities
+        defenders: List of defending entities
+        base_power: Spell base power to also compute magic damage (optional)
+
+    Returns:
+        dict: "hit_chance" and "damage" (A x D arrays), plus "magic_damage" if
+            base_power is given
+    """
+    a = combatant_arrays(attackers)
+    d = combatant_arrays(defenders)
+
+    # Attackers along rows, defenders along columns
+    result = {
+        "hit_chance": hit_chance(a["acc"][:, None], d["spd"], d["defending"]),
+        "damage": physical_damage(a["attack"][:, None], d["defense"], d["defending"]),
+    }
+    if base_power is not None:
+        result["magic_damage"] = magic_damage(a["intelligence"][:, None], d["resilience"],
+                                              base_power, d["defending"])
+    return result
@@ -0,0 +1,44 @@
+"""
+Effect atlas for the RPG game.
+Pre-renders the frames of battle effects so animations only need to blit.
+"""
+
+class EffectAtlas:
+    """
+    Cache of pre-rendered effect animation frames.
+    Frames are keyed by (effect type, size, duration, resolution) and rendered
+    the first time that combination is needed.
+    """
+    def __init__(self):
+        """Initialize an empty effect atlas."""
+        self._frames = {}
+
+    def get_frames(self, effect_key, duration, render_frame):
+        """
+        Get the frames for an effect, rendering them on first use.
+
+        Args:
+            effect_key (tuple): Key identifying the effect type, size and resolution
+            duration (int): Number of frames in the animation
+            render_frame (callable): Called as render_frame(frame_index) to render
+                one frame, returns a pygame.Surface
+
+        Returns:
+            list: The rendered frames, one surface per animation frame
+        """
+        key = (effect_key, duration)
+        frames = self._frames.get(key)
+        if frames is None:
+            frames = [render_frame(frame) for frame in range(duration)]
+            self._frames[key] = frames
+        return frames
+
+    def clear(self):
+        """Drop all pre-rendered frames."""
+        self._frames.clear()
+
+    def __len__(self):
+        return len(self._frames)
+
+# Shared instance used by battle animations and the visualizer
+effect_atlas = EffectAtlas()
@@ -0,0 +1,169 @@
+"""
+Particle system for the RPG game.
+Keeps battle particles in NumPy arrays so they update and rasterize in bulk.
+"""
+import numpy as np
+import pygame
+
+MAX_PARTICLES = 4096
+
+class ParticleSystem:
+    """
+    Vectorized particle engine.
+    Position, velocity, life, color and size are stored in parallel arrays with
+    the live particles packed at the front.
+    """
+    def __init__(self, capacity=MAX_PARTICLES, seed=None):
+        """
+        Initialize the particle system.
+
+        Args:
+            capacity (int): Maximum number of live particles
+            seed (int): Seed for the particle random generator (optional)
+        """
+        self.capacity = capacity
+        self.count = 0
+
+        # Particle state arrays
+        self.position = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float32)
+        self.gravity = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.size = np.ones(capacity, dtype=np.int32)
+
+        self.rng = np.random.default_rng(seed)
+
+        # Persistent alpha layer the particles are rasterized onto
+        self.layer = None
+        self.drawn_rect = None  # Area of the layer drawn on last frame
+
+    def emit(self, x, y, count, color, speed=(0.5, 2.0), life=(15, 30),
+             angle=(0.0, 2 * np.pi), spread=0.0, gravity=0.0, size=(1, 3)):
+        """
+        Spawn a burst of particles.
+
+        Args:
+            x (float): Emitter x position
+            y (float): Emitter y position
+            count (int): Number of particles to spawn
+            color (tuple): RGB color of the particles
+            speed (tuple): (min, max) initial speed in pixels per frame
+            life (tuple): (min, max) lifetime in frames
+            angle (tuple): (min, max) emission angle in radians
+            spread (float): Radius of the area particles start in
+            gravity (float): Downward acceleration per frame (negative rises)
+            size (tuple): (min, max) particle size in pixels, inclusive
+        """
+        # Drop whatever doesn't fit
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+
+        start, end = self.count, self.count + count
+        rng = self.rng
+
+        # Random starting offset within the spread radius
+        offset_angle = rng.uniform(0.0, 2 * np.pi, count)
+        offset_radius = rng.uniform(0.0, spread, count)
+        self.position[start:end, 0] = x + np.cos(offset_angle) * offset_radius
+        self.position[start:end, 1] = y + np.sin(offset_angle) * offset_radius
+
+        # Random velocity within the emission cone
+        theta = rng.uniform(angle[0], angle[1], count)
+        magnitude = rng.uniform(speed[0], speed[1], count)
+        self.velocity[start:end, 0] = np.cos(theta) * magnitude
+        self.velocity[start:end, 1] = np.sin(theta) * magnitude
+
+        self.gravity[start:end] = gravity
+        self.life[start:end] = rng.uniform(life[0], life[1], count)
+        self.max_life[start:end] = self.life[start:end]
+        self.color[start:end] = color
+        self.size[start:end] = rng.integers(size[0], size[1] + 1, count)
+
+        self.count = end
+
+    def update(self):
+        """Advance all particles by one frame and drop the dead ones."""
+        n = self.count
+        if n == 0:
+            return
+
+        # Integrate motion for all live particles at once
+        self.velocity[:n, 1] += self.gravity[:n]
+        self.position[:n] += self.velocity[:n]
+        self.life[:n] -= 1
+
+        # Pack the survivors to the front of the arrays
+        alive = np.flatnonzero(self.life[:n] > 0)
+        if len(alive) < n:
+            for array in (self.position, self.velocity, self.gravity,
+                          self.life, self.max_life, self.color, self.size):
+                array[:len(alive)] = array[alive]
+            self.count = len(alive)
+
+    def clear(self):
+        """Remove all particles."""
+        self.count = 0
+
+    def draw(self, screen):
+        """
+        Rasterize all live particles and blit them onto the screen.
+
+        Args:
+            screen: The pygame surface to draw on
+        """
+        width, height = screen.get_size()
+        if self.layer is None or self.layer.get_size() != (width, height):
+            self.layer = pygame.Surface((width, height), pygame.SRCALPHA)
+            self.drawn_rect = None
+
+        alpha = pygame.surfarray.pixels_alpha(self.layer)
+
+        # Clear only the area drawn on last frame
+        if self.drawn_rect is not None:
+            x0, y0, x1, y1 = self.drawn_rect
+            alpha[x0:x1, y0:y1] = 0
+            self.drawn_rect = None
+
+        n = self.count
+        if n == 0:
+            del alpha
+            return
+
+        rgb = pygame.surfarray.pixels3d(self.layer)
+
+        # Particles fade out over their lifetime
+        fade = (self.life[:n] / self.max_life[:n] * 255).astype(np.uint8)
+        xs = self.position[:n, 0].astype(np.int32)
+        ys = self.position[:n, 1].astype(np.int32)
+        sizes = self.size[:n]
+        colors = self.color[:n]
+
+        # Stamp each particle as a small square, one offset at a time
+        for dx in range(int(sizes.max())):
+            for dy in range(int(sizes.max())):
+                px = xs + dx
+                py = ys + dy
+                mask = ((sizes > max(dx, dy)) & (px >= 0) & (px < width) &
+                        (py >= 0) & (py < height))
+                if not mask.any():
+                    continue
+                rgb[px[mask], py[mask]] = colors[mask]
+                alpha[px[mask], py[mask]] = fade[mask]
+
+        # Release the pixel locks before blitting
+        del rgb
+        del alpha
+
+        # Bounding box of everything drawn this frame, clipped to the screen
+        x0 = max(0, int(xs.min()))
+        y0 = max(0, int(ys.min()))
+        x1 = min(width, int(xs.max()) + int(sizes.max()))
+        y1 = min(height, int(ys.max()) + int(sizes.max()))
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        self.drawn_rect = (x0, y0, x1, y1)
+        screen.blit(self.layer, (x0, y0), pygame.Rect(x0, y0, x1 - x0, y1 - y0))
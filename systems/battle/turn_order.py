@@ -1,85 +1,136 @@
 """
 Battle turn order system for multiple characters.
 """
-import random
+import heapq
+import itertools
+from collections import deque
 from entities.player import Player
+from utils.rng import get_stream, TURN_ORDER_STREAM
 
 class TurnOrder:
     """
     Manages battle turn order for all combatants.
+    
+    Each round is a priority queue keyed on SPD (descending), level
+    (descending) and a random tiebreak drawn when the order is generated.
+    Combatants who have acted wait for the next round, and removed or
+    defeated combatants are dropped lazily when they reach the front.
+    SPD and level changes are picked up when the next round starts.
     """
-    def __init__(self, party_members, enemies):
+    def __init__(self, party_members, enemies, rng=None):
         """
         Initialize the turn order system.
         
         Args:
             party_members: List of active party members
             enemies: List of enemies in battle
+            rng: Random generator used to break ties (defaults to the turn order stream)
         """
-        self.combatants = party_members + enemies
-        self.turn_queue = []
-        self.current_turn_index = 0
+        self.rng = rng if rng is not None else get_stream(TURN_ORDER_STREAM)
+        
+        # Combatant -> heap entry, in the order they joined the battle
+        self.combatants = {c: None for c in party_members + enemies}
+        
+        self.current_round = []  # Heap of entries still to act this round
+        self.next_round = []     # Entries that have acted (or were skipped)
+        self.acted = set()       # Combatants whose entries are in next_round
+        self._sequence = itertools.count()
+        
+        # Cached forecast of upcoming turns, rebuilt only when invalidated
+        self._forecast = deque()
+        self._forecast_valid = False
+        self._cycle = []         # Turn order of a full round after this one
+        self._cycle_position = 0 # Next cycle entry to append to the forecast
         
         # Generate initial turn order
         self.generate_turn_order()
         
+    def _make_entry(self, combatant, tiebreak=None):
+        """
+        Build the heap entry for a combatant.
+        
+        Args:
+            combatant: The combatant to schedule
+            tiebreak: Random tiebreak to keep (a new one is drawn if not given)
+            
+        Returns:
+            list: [-spd, -level, tiebreak, sequence, combatant]
+        """
+        if tiebreak is None:
+            tiebreak = self.rng.random()
+        # Faster first, then higher level, then random; the sequence number
+        # keeps combatants themselves from ever being compared
+        return [-combatant.spd, -combatant.level, tiebreak,
+                next(self._sequence), combatant]
+        
     def generate_turn_order(self):
         """
         Generate the turn order based on SPD and additional factors.
         """
-        # Copy list to avoid modifying the original
-        combatants = self.combatants.copy()
-        
-        # Filter out defeated entities
-        combatants = [c for c in combatants if not c.is_defeated()]
-        
-        # Sort by speed in descending order (faster goes first)
-        combatants.sort(key=lambda c: c.spd, reverse=True)
-        
-        # Resolve ties using additional factors
-        # Group combatants by speed
-        speed_groups = {}
-        for c in combatants:
-            if c.spd not in speed_groups:
-                speed_groups[c.spd] = []
-            speed_groups[c.spd].append(c)
-        
-        # Sort each group by level (higher level goes first)
-        for spd, group in speed_groups.items():
-            if len(group) > 1:
-                # First sort by level
-                group.sort(key=lambda c: c.level, reverse=True)
-                
-                # For same level, use RNG to break ties
-                current_level = None
-                level_group = []
-                
-                for i, c in enumerate(list(group)):
-                    if current_level != c.level:
-                        # Randomize the previous level group
-                        if level_group:
-                            random.shuffle(level_group)
-                            # Replace the original entries with randomized ones
-                            for j, entity in enumerate(level_group):
-                                group[i - len(level_group) + j] = entity
-                            level_group = []
-                        current_level = c.level
-                    
-                    level_group.append(c)
-                
-                # Don't forget to randomize the last group
-                if level_group:
-                    random.shuffle(level_group)
-                    for j, entity in enumerate(level_group):
-                        group[len(group) - len(level_group) + j] = entity
-        
-        # Flatten the sorted groups back into a list
-        self.turn_queue = []
-        for spd in sorted(speed_groups.keys(), reverse=True):
-            self.turn_queue.extend(speed_groups[spd])
-        
-        # Reset turn index
-        self.current_turn_index = 0
+        self.current_round = []
+        self.next_round = []
+        self.acted = set()
+        
+        for c in self.combatants:
+            entry = self._make_entry(c)
+            self.combatants[c] = entry
+            # Defeated entities sit out until they are back on their feet
+            if c.is_defeated():
+                self.next_round.append(entry)
+                self.acted.add(c)
+            else:
+                self.current_round.append(entry)
+        
+        heapq.heapify(self.current_round)
+        self.invalidate_forecast()
+        
+    def _start_next_round(self):
+        """
+        Move everyone who has acted into a new round.
+        
+        Returns:
+            bool: True if the new round has someone able to act
+        """
+        entries = []
+        for entry in self.next_round:
+            combatant = entry[-1]
+            if combatant is None:
+                continue
+            # Pick up any SPD or level changes from the last round
+            entry[0] = -combatant.spd
+            entry[1] = -combatant.level
+            entries.append(entry)
+        self.next_round = entries
+        
+        # Avoid an endless loop if every combatant is defeated
+        if not any(not entry[-1].is_defeated() for entry in entries):
+            return False
+        
+        heapq.heapify(entries)
+        self.current_round = entries
+        self.next_round = []
+        self.acted = set()
+        return True
+        
+    def _settle(self):
+        """
+        Drop removed and defeated combatants from the front of the queue,
+        starting a new round when this one runs out.
+        """
+        while True:
+            while self.current_round:
+                combatant = self.current_round[0][-1]
+                if combatant is None:
+                    heapq.heappop(self.current_round)
+                elif combatant.is_defeated():
+                    self.next_round.append(heapq.heappop(self.current_round))
+                    self.acted.add(combatant)
+                else:
+                    return
+            
+            # Everyone has acted, so the next round begins
+            if not self._start_next_round():
+                return
         
     def get_current(self):
         """
@@ -88,9 +139,10 @@ class TurnOrder:
         Returns:
             The current combatant or None if queue is empty
         """
-        if not self.turn_queue:
+        self._settle()
+        if not self.current_round:
             return None
-        return self.turn_queue[self.current_turn_index]
+        return self.current_round[0][-1]
     
     def advance(self):
         """
@@ -99,47 +151,144 @@ class TurnOrder:
         Returns:
             The new current combatant or None if queue is empty
         """
-        if not self.turn_queue:
+        self._settle()
+        if not self.current_round:
             return None
-            
-        self.current_turn_index = (self.current_turn_index + 1) % len(self.turn_queue)
         
-        # Skip defeated combatants
-        while self.current_turn_index < len(self.turn_queue) and self.turn_queue[self.current_turn_index].is_defeated():
-            self.current_turn_index = (self.current_turn_index + 1) % len(self.turn_queue)
-            
-            # Avoid infinite loop if all combatants are defeated
-            if self.current_turn_index == 0:
-                # Regenerate the turn queue to remove defeated entities
-                self.generate_turn_order()
-                if not self.turn_queue:
-                    return None
-                
+        # The current combatant waits for the next round
+        entry = heapq.heappop(self.current_round)
+        self.next_round.append(entry)
+        self.acted.add(entry[-1])
+        
+        # Slide the forecast along instead of rebuilding it
+        if self._forecast_valid and self._forecast:
+            self._forecast.popleft()
+            self._extend_forecast(len(self._forecast) + 1)
+        
         return self.get_current()
     
+    def add_combatant(self, combatant):
+        """
+        Add a combatant to the battle. It first acts in the next round.
+        
+        Args:
+            combatant: The combatant joining the battle
+        """
+        if combatant in self.combatants:
+            return
+        entry = self._make_entry(combatant)
+        self.combatants[combatant] = entry
+        self.next_round.append(entry)
+        self.acted.add(combatant)
+        self.invalidate_forecast()
+    
     def remove_combatant(self, combatant):
         """
         Remove a combatant from the turn order (e.g., when defeated).
         
+        If it was the current combatant, the next one becomes current.
+        
         Args:
             combatant: The combatant to remove
         """
-        if combatant in self.turn_queue:
-            index = self.turn_queue.index(combatant)
-            self.turn_queue.remove(combatant)
-            
-            # Adjust current index if needed
-            if index < self.current_turn_index:
-                self.current_turn_index -= 1
-            elif index == self.current_turn_index:
-                # If we removed the current combatant, 
-                # current_turn_index now points to the next one
-                if self.current_turn_index >= len(self.turn_queue):
-                    self.current_turn_index = 0
-                    
-        # Also remove from the combatants list
         if combatant in self.combatants:
-            self.combatants.remove(combatant)
+            entry = self.combatants.pop(combatant)
+            # Leave a tombstone that is skipped when it reaches the front
+            entry[-1] = None
+            self.acted.discard(combatant)
+            self.invalidate_forecast()
+    
+    def notify_speed_changed(self, combatant):
+        """
+        Reschedule a combatant whose SPD or level changed (e.g. a level up).
+        
+        A combatant still waiting this round moves to its new place; one that
+        has already acted (or is acting now) is reordered next round.
+        
+        Args:
+            combatant: The combatant whose stats changed
+        """
+        entry = self.combatants.get(combatant)
+        if entry is None:
+            return
+        
+        waiting = (combatant not in self.acted and
+                   not (self.current_round and self.current_round[0] is entry))
+        if waiting:
+            new_entry = self._make_entry(combatant, tiebreak=entry[2])
+            entry[-1] = None
+            self.combatants[combatant] = new_entry
+            heapq.heappush(self.current_round, new_entry)
+        self.invalidate_forecast()
+    
+    def invalidate_forecast(self):
+        """Mark the cached forecast as stale."""
+        self._forecast_valid = False
+    
+    def _rebuild_forecast(self, count):
+        """
+        Rebuild the forecast from the current round and the next one.
+        
+        Args:
+            count (int): Number of upcoming turns to forecast
+        """
+        self._settle()
+        
+        def living(entries):
+            return [e for e in entries if e[-1] is not None and not e[-1].is_defeated()]
+        
+        # What's left of this round, in heap order
+        upcoming = sorted(living(self.current_round))
+        
+        # Later rounds use everyone's current SPD and level
+        everyone = living(self.current_round) + living(self.next_round)
+        everyone.sort(key=lambda e: (-e[-1].spd, -e[-1].level, e[2], e[3]))
+        self._cycle = [e[-1] for e in everyone]
+        self._cycle_position = 0
+        
+        self._forecast = deque(e[-1] for e in upcoming)
+        self._forecast_valid = True
+        self._extend_forecast(count)
+    
+    def _extend_forecast(self, count):
+        """
+        Append turns from later rounds until the forecast is long enough.
+        
+        Args:
+            count (int): Number of upcoming turns wanted
+        """
+        if not self._cycle:
+            return
+        while len(self._forecast) < count:
+            self._forecast.append(self._cycle[self._cycle_position])
+            self._cycle_position = (self._cycle_position + 1) % len(self._cycle)
+    
+    def forecast(self, count):
+        """
+        Get the combatants taking the next turns, starting with the current one.
+        
+        The forecast is cached and only rebuilt after a death, a SPD change
+        or a combatant joining.
+        
+        Args:
+            count (int): Number of turns to forecast
+            
+        Returns:
+            list: The next `count` combatants (fewer if nobody can act)
+        """
+        current = self.get_current()
+        
+        # Someone felled without being removed also makes the forecast stale
+        stale = (not self._forecast_valid or not self._forecast or
+                 self._forecast[0] is not current)
+        if not stale:
+            stale = any(c.is_defeated() for c in itertools.islice(self._forecast, count))
+        
+        if stale:
+            self._rebuild_forecast(count)
+        else:
+            self._extend_forecast(count)
+        return list(itertools.islice(self._forecast, count))
     
     def is_player_turn(self):
         """
@@ -155,19 +304,19 @@ class TurnOrder:
         
     def any_enemies_alive(self):
         """
-        Check if any enemies are still alive in the turn queue.
+        Check if any enemies are still alive in the turn order.
         
         Returns:
             bool: True if at least one enemy is alive
         """
         from entities.enemy import Enemy
-        return any(isinstance(c, Enemy) and not c.is_defeated() for c in self.turn_queue)
+        return any(isinstance(c, Enemy) and not c.is_defeated() for c in self.combatants)
         
     def any_players_alive(self):
         """
-        Check if any player characters are still alive in the turn queue.
+        Check if any player characters are still alive in the turn order.
         
         Returns:
             bool: True if at least one player is alive
         """
-        return any(isinstance(c, Player) and not c.is_defeated() for c in self.turn_queue)
\ No newline at end of file
+        return any(isinstance(c, Player) and not c.is_defeated() for c in self.combatants)
@@ -2,9 +2,10 @@
 Encounter system for the RPG game.
 Handles the generation of enemy groups based on encounter pools.
 """
-import random
+import numpy as np
 from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional
+from utils.rng import get_stream, ENCOUNTER_STREAM
 
 @dataclass
 class EnemySpec:
@@ -35,6 +36,9 @@ class EncounterPool:
         self.encounters: List[EncounterDefinition] = []
         self._total_weight = 0
         
+        # Walker alias table, rebuilt on the next draw after a change
+        self._alias_table: Optional[Tuple[List[int], List[int]]] = None
+        
     def add_encounter(self, weight: int, enemies: List[EnemySpec]) -> None:
         """
         Add a possible encounter to this pool.
@@ -45,29 +49,100 @@ class EncounterPool:
         """
         self.encounters.append(EncounterDefinition(weight, enemies))
         self._total_weight += weight
+        self._alias_table = None
+        
+    def _build_alias_table(self) -> Tuple[List[int], List[int]]:
+        """
+        Build the Walker alias table for the current weights (Vose's method).
+        
+        Probabilities are kept as integers out of the total weight, so draws
+        match the weights exactly.
+        
+        Returns:
+            tuple: (thresholds, aliases) - slot i keeps encounter i when a roll
+                in [0, total weight) is below thresholds[i], else aliases[i]
+        """
+        count = len(self.encounters)
+        # Scale each weight by the slot count so a full slot is worth the total weight
+        scaled = [encounter.weight * count for encounter in self.encounters]
+        thresholds = [self._total_weight] * count
+        aliases = list(range(count))
+        
+        small = [i for i, value in enumerate(scaled) if value < self._total_weight]
+        large = [i for i, value in enumerate(scaled) if value >= self._total_weight]
+        
+        # Fill each underfull slot from an overfull one
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            thresholds[less] = scaled[less]
+            aliases[less] = more
+            scaled[more] -= self._total_weight - scaled[less]
+            if scaled[more] < self._total_weight:
+                small.append(more)
+            else:
+                large.append(more)
+        
+        # Whatever is left is exactly full
+        return thresholds, aliases
+        
+    def _get_alias_table(self) -> Tuple[List[int], List[int]]:
+        """
+        Get the alias table, building it if the pool changed.
+        
+        Returns:
+            tuple: (thresholds, aliases)
+        """
+        if self._alias_table is None:
+            self._alias_table = self._build_alias_table()
+        return self._alias_table
         
-    def generate_encounter(self) -> Optional[List[EnemySpec]]:
+    def generate_encounter(self, rng=None) -> Optional[List[EnemySpec]]:
         """
         Generate a random encounter based on the defined weights.
         
+        Args:
+            rng: Random generator to roll with (defaults to the encounter stream)
+        
         Returns:
             List of enemy specifications, or None if pool is empty
         """
         if not self.encounters:
             return None
+        
+        if rng is None:
+            rng = get_stream(ENCOUNTER_STREAM)
+        
+        # Pick a slot, then keep it or take its alias
+        thresholds, aliases = self._get_alias_table()
+        slot = rng.randrange(len(self.encounters))
+        if rng.randrange(self._total_weight) < thresholds[slot]:
+            return self.encounters[slot].enemies
+        return self.encounters[aliases[slot]].enemies
+        
+    def generate_batch(self, count: int, rng=None) -> List[List[EnemySpec]]:
+        """
+        Generate many encounters with one vectorized draw.
+        
+        Args:
+            count: Number of encounters to generate
+            rng: NumPy Generator to draw with (seeded from the encounter stream if not given)
             
-        # Generate a random number between 0 and total weight
-        roll = random.randint(1, self._total_weight)
-        
-        # Find the selected encounter
-        current_weight = 0
-        for encounter in self.encounters:
-            current_weight += encounter.weight
-            if roll <= current_weight:
-                return encounter.enemies
-                
-        # Fallback (shouldn't happen with proper weights)
-        return self.encounters[0].enemies
+        Returns:
+            List of enemy specification lists, empty if the pool is empty
+        """
+        if not self.encounters or count <= 0:
+            return []
+        
+        if rng is None:
+            rng = np.random.default_rng(get_stream(ENCOUNTER_STREAM).getrandbits(64))
+        
+        thresholds, aliases = self._get_alias_table()
+        slots = rng.integers(0, len(self.encounters), size=count)
+        rolls = rng.integers(0, self._total_weight, size=count)
+        picks = np.where(rolls < np.asarray(thresholds)[slots], slots, np.asarray(aliases)[slots])
+        
+        return [self.encounters[i].enemies for i in picks.tolist()]
 
 
 class EncounterManager:
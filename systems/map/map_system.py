@@ -2,11 +2,68 @@
 Map system for RPG game.
 """
 import pygame
-import random
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT, ORIGINAL_WIDTH, ORIGINAL_HEIGHT, WHITE
-from utils.utils import scale_position, scale_dimensions, scale_font_size
+import math
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from constants import (SCREEN_WIDTH, SCREEN_HEIGHT, ORIGINAL_WIDTH, ORIGINAL_HEIGHT, WHITE,
+                       MAX_RESIDENT_MAPS, PREFETCH_EDGE_DISTANCE)
+from utils.utils import scale_position, scale_dimensions, get_display_epoch
+from systems.ui.font_manager import font_manager
+from systems.ui import draw
+from systems.ui.render_target import get_render_size
+from entities.entity import EntityGroup
 from entities.enemy import Enemy
 from systems.map.encounter_system import EncounterManager
+from systems.map.spatial_hash import SpatialHash
+from systems.map.tile_map import TileMap, LAYER_TILES
+from systems.map.pathfinding import Pathfinder
+from systems.map.update_scheduler import UpdateScheduler
+from utils.rng import get_stream, ENCOUNTER_STREAM
+
+# Flat colors used to draw tile IDs until the game has tile art
+TILE_PALETTE = [
+    (60, 120, 60),    # Grass
+    (120, 100, 70),   # Dirt
+    (60, 90, 160),    # Water
+    (110, 110, 110),  # Stone
+    (200, 190, 140),  # Sand
+    (40, 80, 40),     # Forest
+]
+
+# Side of the destination map a connection enters from
+REVERSE_DIRECTIONS = {
+    "north": "south",
+    "south": "north",
+    "east": "west",
+    "west": "east"
+}
+
+def tile_color(tile_id):
+    """
+    Get the color used to draw a tile.
+    
+    Args:
+        tile_id (int): Tile ID (non-zero)
+        
+    Returns:
+        tuple: RGB color
+    """
+    return TILE_PALETTE[(tile_id - 1) % len(TILE_PALETTE)]
+
+def _close_prepared_map(future):
+    """
+    Close the tile map of a map area built by a discarded prefetch.
+    
+    Args:
+        future (Future): The finished or cancelled build
+    """
+    if future.cancelled() or future.exception() is not None:
+        return
+    tile_map = future.result().tile_map
+    if tile_map:
+        tile_map.close()
 
 class MapArea:
     """
@@ -24,14 +81,21 @@ class MapArea:
         self.name = name
         self.background_color = background_color
         self.map_id = map_id if map_id else name.lower().replace(" ", "_")
-        self.entities = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
-        self.npcs = pygame.sprite.Group()
+        self.entities = EntityGroup()
+        self.enemies = EntityGroup()
+        self.npcs = EntityGroup()
+        self.spatial_index = SpatialHash()  # Grid of NPC rects for collision and interaction
+        self.tile_map = None      # Optional memory-mapped tile layers
+        self.chunk_surfaces = {}  # (cx, cy, tile px) -> rendered tile chunk
+        self.collision_version = 0  # Bumped whenever the collision data changes
+        self.pathfinder = Pathfinder(self)  # Paths and distance fields for moving NPCs
         self.step_timer = 0       # Counts the amount of time moved to add a step for encounter calculation
         self.step_interval = 0.5  # Time in seconds between step counts
         self.was_moving = False   # Track if player was moving last frame
+        self.scaled_for = None    # (display epoch, resolution) entities were last scaled for
+        self.on_edge_approach = None  # Called with a neighbor's map ID when the player nears its edge
         
-        # Connections to other maps (None if no connection)
+        # IDs of the maps connected on each side (None if no connection)
         self.connections = {
             "north": None,
             "east": None,
@@ -40,9 +104,50 @@ class MapArea:
         }
         
         # Enemy encounter settings
-        self.encounter_chance = 0.1  # Default 10% chance per step
-        self.steps_since_last_encounter = 0
         self.min_steps_between_encounters = 10  # Minimum steps before another encounter
+        self.steps_until_encounter = None       # Drawn when the next encounter is scheduled
+        self.encounter_chance = 0.1  # Default 10% chance per step
+    
+    @property
+    def encounter_chance(self):
+        """Chance of an encounter on each step once the minimum steps have passed."""
+        return self._encounter_chance
+    
+    @encounter_chance.setter
+    def encounter_chance(self, value):
+        self._encounter_chance = value
+        # Redraw the schedule with the new rate
+        self.steps_until_encounter = None
+    
+    def schedule_next_encounter(self, minimum_steps=None):
+        """
+        Draw the number of steps until the next encounter.
+        
+        Rolling encounter_chance on every step past the minimum gives a
+        geometric number of extra steps, so it is drawn once up front.
+        
+        Args:
+            minimum_steps (int): Steps that must pass first (defaults to
+                min_steps_between_encounters)
+        """
+        if minimum_steps is None:
+            minimum_steps = self.min_steps_between_encounters
+        
+        chance = self._encounter_chance
+        if chance <= 0:
+            # Never
+            self.steps_until_encounter = -1
+            return
+        
+        # Steps until the first successful roll, counting that step (at least 1)
+        if chance >= 1:
+            rolls = 1
+        else:
+            u = get_stream(ENCOUNTER_STREAM).random()
+            rolls = max(1, math.ceil(math.log(1 - u) / math.log(1 - chance)))
+        
+        # The first roll happens on the minimum step
+        self.steps_until_encounter = max(1, minimum_steps) + rolls - 1
         
     def add_entity(self, entity):
         """
@@ -53,10 +158,109 @@ class MapArea:
         """
         self.entities.add(entity)
         
+        # Make sure the new entity gets scaled on the next draw
+        self.scaled_for = None
+        
         # If it's an NPC, add to the NPCs group
         from entities.npc import NPC
         if isinstance(entity, NPC):
             self.npcs.add(entity)
+            self.spatial_index.insert(entity)
+    
+    def load_tile_map(self, path):
+        """
+        Use a tile map file for this area's tiles, collision and encounter zones.
+        
+        Args:
+            path (str): Path to the tile map file
+        """
+        if self.tile_map:
+            self.tile_map.close()
+        self.tile_map = TileMap(path)
+        self.chunk_surfaces = {}
+        self.collision_version += 1
+    
+    def _to_design_rect(self, rect):
+        """
+        Convert a rect in render pixels to design pixels.
+        
+        Args:
+            rect (pygame.Rect): Rect at the current resolution
+            
+        Returns:
+            tuple: (x, y, width, height) at the original resolution
+        """
+        current_width, current_height = get_render_size()
+        scale_x = ORIGINAL_WIDTH / current_width
+        scale_y = ORIGINAL_HEIGHT / current_height
+        return (rect.x * scale_x, rect.y * scale_y, rect.width * scale_x, rect.height * scale_y)
+    
+    def is_blocked(self, rect):
+        """
+        Check whether the tile map blocks a rect.
+        
+        Args:
+            rect (pygame.Rect): Rect at the current resolution
+            
+        Returns:
+            bool: True if a collision tile overlaps the rect
+        """
+        if not self.tile_map:
+            return False
+        return self.tile_map.is_blocked(*self._to_design_rect(rect))
+    
+    def in_encounter_zone(self, rect):
+        """
+        Check whether encounters can happen where a rect stands.
+        
+        Args:
+            rect (pygame.Rect): Rect at the current resolution
+            
+        Returns:
+            bool: True without a tile map, otherwise whether the rect's center is in a zone
+        """
+        if not self.tile_map:
+            return True
+        x, y, width, height = self._to_design_rect(rect)
+        return self.tile_map.encounter_zone_at(x + width / 2, y + height / 2) != 0
+    
+    def entity_moved(self, entity):
+        """
+        Update the spatial index after an NPC moves.
+        
+        Args:
+            entity: The entity that moved
+        """
+        if entity in self.npcs:
+            self.spatial_index.update(entity)
+    
+    def colliding_npc(self, rect):
+        """
+        Find an NPC blocking a rect.
+        
+        Args:
+            rect (pygame.Rect): The area to test
+            
+        Returns:
+            NPC: An NPC overlapping the rect, or None
+        """
+        return self.spatial_index.first_colliding(rect)
+    
+    def find_interactable(self, player):
+        """
+        Find the nearest NPC the player can interact with.
+        
+        Args:
+            player: The player entity
+            
+        Returns:
+            NPC: The closest NPC in range that the player is facing, or None
+        """
+        from entities.npc import NPC
+        return self.spatial_index.nearest(
+            player.rect.centerx, player.rect.centery, NPC.INTERACTION_DISTANCE,
+            predicate=lambda npc: npc.can_interact(player)
+        )
         
     def connect(self, direction, target_map):
         """
@@ -64,28 +268,36 @@ class MapArea:
         
         Args:
             direction (str): The direction ("north", "east", "south", "west")
-            target_map (MapArea): The map area to connect to
+            target_map: The map area to connect to, or its map ID
         """
         if direction in self.connections:
-            self.connections[direction] = target_map
-            
-            # Set up the reverse connection automatically
-            reverse_directions = {
-                "north": "south",
-                "south": "north",
-                "east": "west",
-                "west": "east"
-            }
-            
-            # Only set the reverse if it's not already set
-            reverse_dir = reverse_directions[direction]
-            if target_map.connections[reverse_dir] is None:
-                target_map.connections[reverse_dir] = self
+            # Connections are kept by ID so the target doesn't have to be loaded
+            if isinstance(target_map, MapArea):
+                self.connections[direction] = target_map.map_id
+                
+                # Set up the reverse connection automatically,
+                # only if it's not already set
+                reverse_dir = REVERSE_DIRECTIONS[direction]
+                if target_map.connections[reverse_dir] is None:
+                    target_map.connections[reverse_dir] = self.map_id
+            else:
+                self.connections[direction] = target_map
         
     def draw(self, screen):
         """
         Draw this map area, including boundaries and entities.
         
+        Args:
+            screen: The pygame surface to draw on
+        """
+        self.draw_static(screen)
+        self.draw_entities(screen)
+        
+    def draw_static(self, screen):
+        """
+        Draw the parts of this map area that don't change between frames
+        (background, boundaries and map name).
+        
         Args:
             screen: The pygame surface to draw on
         """
@@ -95,66 +307,156 @@ class MapArea:
         # Fill the background
         screen.fill(self.background_color)
         
+        # Draw the tile chunks that cover the screen
+        if self.tile_map:
+            self.draw_tiles(screen)
+        
         # Scale border thickness based on current resolution
         line_thickness = max(1, int(5 * (current_width / ORIGINAL_WIDTH)))
         
         # Draw boundary walls for edges that don't have connections
         if not self.connections["north"]:
             # Draw top boundary
-            pygame.draw.line(screen, WHITE, (0, 0), (current_width, 0), line_thickness)
+            draw.line(screen, WHITE, (0, 0), (current_width, 0), line_thickness)
             
         if not self.connections["east"]:
             # Draw right boundary
-            pygame.draw.line(screen, WHITE, (current_width - line_thickness, 0), 
+            draw.line(screen, WHITE, (current_width - line_thickness, 0), 
                             (current_width - line_thickness, current_height), line_thickness)
             
         if not self.connections["south"]:
             # Draw bottom boundary
-            pygame.draw.line(screen, WHITE, (0, current_height - line_thickness), 
+            draw.line(screen, WHITE, (0, current_height - line_thickness), 
                             (current_width, current_height - line_thickness), line_thickness)
             
         if not self.connections["west"]:
             # Draw left boundary
-            pygame.draw.line(screen, WHITE, (0, 0), (0, current_height), line_thickness)
+            draw.line(screen, WHITE, (0, 0), (0, current_height), line_thickness)
         
         # Scale and draw the map name
-        font_size = scale_font_size(24, ORIGINAL_WIDTH, ORIGINAL_HEIGHT, current_width, current_height)
-        font = pygame.font.SysFont('Arial', font_size)
+        font = font_manager.get_font(24, resolution=(current_width, current_height))
         name_text = font.render(self.name, True, WHITE)
         name_x = current_width // 2 - name_text.get_width() // 2
         name_y = int(10 * (current_height / ORIGINAL_HEIGHT))
         screen.blit(name_text, (name_x, name_y))
         
-        # Update scaling for all entities 
-        for entity in self.entities:
-            if hasattr(entity, 'update_scale'):
-                entity.update_scale(current_width, current_height)
+    def draw_tiles(self, screen):
+        """
+        Draw the tile map chunks visible on screen.
+        
+        Args:
+            screen: The pygame surface to draw on
+        """
+        current_width, current_height = screen.get_size()
+        design_span = self.tile_map.chunk_size * self.tile_map.tile_size
+        
+        for cx, cy, surface in self.visible_chunks(current_width):
+            x, y = scale_position(cx * design_span, cy * design_span,
+                                  ORIGINAL_WIDTH, ORIGINAL_HEIGHT, current_width, current_height)
+            screen.blit(surface, (x, y))
+    
+    def visible_chunks(self, current_width):
+        """
+        Get the rendered tile chunks that cover the screen, rendering any missing ones.
+        
+        Args:
+            current_width (int): Current screen width
+            
+        Returns:
+            list: (cx, cy, surface) for each visible chunk
+        """
+        tile_map = self.tile_map
+        
+        # Tile size at the current resolution
+        tile_px = max(1, int(tile_map.tile_size * current_width / ORIGINAL_WIDTH))
+        
+        chunks = []
+        for cx, cy in tile_map.chunks_in_rect(0, 0, ORIGINAL_WIDTH, ORIGINAL_HEIGHT):
+            key = (cx, cy, tile_px)
+            surface = self.chunk_surfaces.get(key)
+            if surface is None:
+                surface = self._render_chunk(cx, cy, tile_px)
+                self.chunk_surfaces[key] = surface
+            chunks.append((cx, cy, surface))
+        return chunks
+    
+    def _render_chunk(self, cx, cy, tile_px):
+        """
+        Render one chunk of tiles to a surface.
+        
+        Args:
+            cx (int): Chunk column
+            cy (int): Chunk row
+            tile_px (int): Tile size in pixels at the current resolution
+            
+        Returns:
+            pygame.Surface: The chunk with transparent empty tiles
+        """
+        tiles = self.tile_map.chunk(LAYER_TILES, cx, cy)
+        size = self.tile_map.chunk_size
+        surface = pygame.Surface((size * tile_px, size * tile_px), pygame.SRCALPHA)
+        for row in range(size):
+            for col in range(size):
+                tile_id = int(tiles[row, col])
+                if tile_id:
+                    surface.fill(tile_color(tile_id),
+                                 (col * tile_px, row * tile_px, tile_px, tile_px))
+        return surface
+    
+    def draw_entities(self, screen):
+        """
+        Draw all entities in this map area.
+        
+        Args:
+            screen: The pygame surface to draw on
+        """
+        self.scale_entities(*screen.get_size())
         
         # Draw all entities in this map
         self.entities.draw(screen)
         
-    def update(self, player=None, encounter_manager=None):
+    def scale_entities(self, current_width, current_height):
+        """
+        Rescale entities for the given resolution if the display has changed.
+        
+        Args:
+            current_width (int): Current screen width
+            current_height (int): Current screen height
+        """
+        # Update scaling for all entities, only when the display has changed
+        scale_key = (get_display_epoch(), (current_width, current_height))
+        if self.scaled_for != scale_key:
+            for entity in self.entities:
+                if hasattr(entity, 'update_scale'):
+                    entity.update_scale(current_width, current_height)
+            self.scaled_for = scale_key
+            
+            # Rescaling replaces the rects, so re-index the NPCs
+            self.spatial_index.rebuild(self.npcs)
+        
+    def update(self, player=None, encounter_manager=None, dt=None):
         """
         Update all entities in this map area and check for map transitions and encounters.
         
         Args:
             player: The player entity (optional)
             encounter_manager: The encounter manager for generating random encounters
+            dt (float): Seconds since the last frame (one 60 FPS frame if not given)
         
         Returns:
-            tuple or None: (new_map, position) if transition should occur, or 
+            tuple or None: (new map ID, position) if transition should occur, or 
                         [Enemy] if encounter triggered, None otherwise
         """
         # Get current screen dimensions
         if player:
-            current_width, current_height = pygame.display.get_surface().get_size()
+            current_width, current_height = get_render_size()
         
         # If player is provided and in this map, check for map transitions and encounters
         if player and player in self.entities:
             # Check if player has moved since last frame
-            player_moved = (
-                player.rect.x != getattr(player, 'last_x', player.rect.x) or
-                player.rect.y != getattr(player, 'last_y', player.rect.y)
+            player_moved = player.last_x is not None and (
+                player.rect.x != player.last_x or
+                player.rect.y != player.last_y
             )
             
             # Store current position for next frame
@@ -163,23 +465,33 @@ class MapArea:
             
             # If player is moving, update step timer
             if player_moved:
-                self.step_timer += 1/60  # Assuming 60 FPS
+                if dt is None:
+                    dt = 1/60
+                # At most one step per frame, even after a long stall
+                self.step_timer += min(dt, self.step_interval)
                 self.was_moving = True
                 
                 # Count a step every step_interval seconds of movement
                 if self.step_timer >= self.step_interval:
-                    self.steps_since_last_encounter += 1
-                    self.step_timer = 0  # Reset timer only after a step is counted
+                    self.step_timer -= self.step_interval  # Keep the leftover time
+                    
+                    if self.steps_until_encounter is None:
+                        self.schedule_next_encounter()
                     
-                    # Check for encounters
-                    if (self.steps_since_last_encounter >= self.min_steps_between_encounters and 
-                        encounter_manager and random.random() < self.encounter_chance):
+                    # Check for encounters (a negative count means none on this map),
+                    # counting only steps taken inside an encounter zone
+                    if self.steps_until_encounter > 0 and self.in_encounter_zone(player.rect):
+                        self.steps_until_encounter -= 1
+                    if self.steps_until_encounter == 0 and encounter_manager:
                         
                         # Generate an encounter for this map
                         enemy_specs = encounter_manager.generate_encounter_for_map(self.map_id)
-                        if enemy_specs:
-                            # Reset step counter
-                            self.steps_since_last_encounter = 0
+                        if not enemy_specs:
+                            # Nothing to fight here, so roll on as if this step missed
+                            self.schedule_next_encounter(minimum_steps=1)
+                        else:
+                            # Schedule the next encounter
+                            self.schedule_next_encounter()
                             
                             # Create enemies from specs
                             encounter_enemies = []
@@ -238,8 +550,12 @@ class MapArea:
             screen_height: Current screen height
             
         Returns:
-            tuple: (new_map, position) if transition should occur, None otherwise
+            tuple: (new map ID, position) if transition should occur, None otherwise
         """
+        # Let the map system start loading a neighbor the player is heading for
+        if self.on_edge_approach:
+            self.check_edge_approach(player, screen_width, screen_height)
+        
         # Check for north edge transition
         if player.rect.top <= 0 and self.connections["north"]:
             return (self.connections["north"], "south")
@@ -257,26 +573,87 @@ class MapArea:
             return (self.connections["west"], "east")
             
         return None
+        
+    def check_edge_approach(self, player, screen_width, screen_height):
+        """
+        Report connected edges the player is close to through on_edge_approach.
+        
+        Args:
+            player: The player entity
+            screen_width: Current screen width
+            screen_height: Current screen height
+        """
+        reach_x = PREFETCH_EDGE_DISTANCE * screen_width / ORIGINAL_WIDTH
+        reach_y = PREFETCH_EDGE_DISTANCE * screen_height / ORIGINAL_HEIGHT
+        
+        distances = {
+            "north": player.rect.top / reach_y,
+            "east": (screen_width - player.rect.right) / reach_x,
+            "south": (screen_height - player.rect.bottom) / reach_y,
+            "west": player.rect.left / reach_x
+        }
+        for direction, distance in distances.items():
+            target_id = self.connections[direction]
+            if target_id and distance <= 1:
+                self.on_edge_approach(target_id)
 
+@dataclass
+class MapDefinition:
+    """Everything needed to build a map area when it is first entered."""
+    map_id: str
+    name: str
+    background_color: Tuple[int, int, int] = (0, 0, 0)
+    encounter_chance: float = 0.1
+    connections: Dict[str, str] = field(default_factory=dict)  # Direction -> map ID
+    populate: Optional[Callable[["MapArea"], None]] = None     # Adds NPCs to a fresh area
+    tile_map_path: Optional[str] = None
 
 class MapSystem:
     """
     Manages multiple map areas and transitions between them.
+    
+    Maps are registered as definitions and only built when entered. The
+    current map and its neighbors stay resident; other maps are evicted,
+    least recently used first, once more than max_resident_maps are built.
+    When the player nears a connected edge, the neighbor is built and its
+    tiles pre-rendered on a background thread, so the transition itself
+    only has to populate it and swap maps. Prefetched maps only become
+    resident when entered, so nothing the game simulates depends on how
+    quickly the thread finished.
     """
-    def __init__(self, encounter_manager=None):
+    def __init__(self, encounter_manager=None, max_resident_maps=MAX_RESIDENT_MAPS):
         """
         Initialize the map system.
         
         Args:
             encounter_manager: The encounter manager for random encounters
+            max_resident_maps (int): Built map areas to keep before evicting
         """
-        self.maps = {}
+        self.definitions = {}       # Map ID -> MapDefinition
+        self.maps = OrderedDict()   # Resident map areas by ID, least recently used first
+        self.map_state = {}         # Map ID -> (steps until encounter, step timer) of evicted maps
         self.current_map = None
         self.encounter_manager = encounter_manager
+        self.max_resident_maps = max_resident_maps
+        self.prefetch_executor = None  # Single worker thread, started on the first prefetch
+        self.pending = {}              # Map ID -> Future of a map built in the background, until entered
+        self.npc_scheduler = UpdateScheduler()  # Ticks NPC behaviors by distance and map
+        
+    def register_map(self, definition):
+        """
+        Register a map definition to be built on first entry.
+        
+        Args:
+            definition (MapDefinition): The map to register
+        """
+        self.definitions[definition.map_id] = definition
         
     def add_map(self, map_id, map_area):
         """
-        Add a map area to the system.
+        Add an already built map area to the system.
+        
+        Maps added this way have no definition to rebuild them from, so they
+        are never evicted.
         
         Args:
             map_id (str): Unique identifier for this map
@@ -285,10 +662,181 @@ class MapSystem:
         self.maps[map_id] = map_area
         # Set the map_id on the map_area for consistency
         map_area.map_id = map_id
+        map_area.on_edge_approach = self.prefetch
+        
+    def get_map(self, map_id):
+        """
+        Get a map area, building it from its definition if it isn't resident.
+        
+        Args:
+            map_id (str): The ID of the map
+            
+        Returns:
+            MapArea: The map area, or None if the ID is unknown
+        """
+        map_area = self.maps.get(map_id)
+        if map_area is not None:
+            self.maps.move_to_end(map_id)
+            return map_area
+        
+        definition = self.definitions.get(map_id)
+        if definition is None:
+            return None
+        
+        future = self.pending.pop(map_id, None)
+        if future is not None:
+            # Already being built in the background, so wait for it
+            try:
+                map_area = future.result()
+            except Exception:
+                map_area = self._prepare_map(definition)
+        else:
+            map_area = self._prepare_map(definition)
+        
+        self._finish_map(map_area)
+        self._evict_unused()
+        return map_area
+        
+    def _prepare_map(self, definition):
+        """
+        Build a map area from its definition and pre-render its tiles.
+        
+        Only touches the new map area, so it is safe to run on the
+        prefetch thread.
+        
+        Args:
+            definition (MapDefinition): The map to build
+            
+        Returns:
+            MapArea: The new map area
+        """
+        map_area = MapArea(definition.name, definition.background_color, definition.map_id)
+        map_area.encounter_chance = definition.encounter_chance
+        for direction, target_id in definition.connections.items():
+            map_area.connect(direction, target_id)
+        if definition.tile_map_path:
+            map_area.load_tile_map(definition.tile_map_path)
+            map_area.visible_chunks(get_render_size()[0])
+        return map_area
+        
+    def _finish_map(self, map_area):
+        """
+        Populate a prepared map area, restore its saved state and make it resident.
+        
+        Args:
+            map_area (MapArea): Map area from _prepare_map
+        """
+        definition = self.definitions[map_area.map_id]
+        if definition.populate:
+            definition.populate(map_area)
+        
+        # Pick up the encounter schedule where the player left it
+        # (set after encounter_chance, which resets the schedule)
+        state = self.map_state.pop(definition.map_id, None)
+        if state is not None:
+            map_area.steps_until_encounter, map_area.step_timer = state
+        
+        map_area.on_edge_approach = self.prefetch
+        self.maps[map_area.map_id] = map_area
+        
+    def prefetch(self, map_id):
+        """
+        Start building a map in the background if it isn't loaded or loading.
+        
+        Args:
+            map_id (str): The ID of the map the player is heading for
+        """
+        if map_id in self.maps or map_id in self.pending:
+            return
+        definition = self.definitions.get(map_id)
+        if definition is None:
+            return
+        
+        if self.prefetch_executor is None:
+            self.prefetch_executor = ThreadPoolExecutor(max_workers=1,
+                                                        thread_name_prefix="map-prefetch")
+        self.pending[map_id] = self.prefetch_executor.submit(self._prepare_map, definition)
+        
+    def poll_prefetch(self):
+        """
+        Drop prefetched maps the player can no longer walk into. Call once per frame.
+        
+        A prefetched map stays prepared but not resident until get_map picks
+        it up on entry, so this only frees memory and never changes which
+        maps (and NPCs) are live.
+        """
+        if not self.pending or not self.current_map:
+            return
+        
+        neighbors = set(self.current_map.connections.values())
+        for map_id in list(self.pending):
+            if map_id not in neighbors:
+                self._discard_prefetch(self.pending.pop(map_id))
+        
+    def _discard_prefetch(self, future):
+        """
+        Drop a background build without making it resident.
+        
+        Stops it if it hasn't started; otherwise the prepared map's tile
+        map is closed once the build is done, so its file isn't left open.
+        
+        Args:
+            future (Future): Future from prefetch
+        """
+        future.cancel()
+        # Runs right away if the future is already done or cancelled
+        future.add_done_callback(_close_prepared_map)
+        
+    def close(self):
+        """
+        Stop the prefetch thread and release the tile maps of resident maps.
+        """
+        if self.prefetch_executor is not None:
+            self.prefetch_executor.shutdown(wait=True, cancel_futures=True)
+            self.prefetch_executor = None
+        for future in self.pending.values():
+            self._discard_prefetch(future)
+        self.pending.clear()
+        for map_area in self.maps.values():
+            if map_area.tile_map:
+                map_area.tile_map.close()
+        
+    def _evict_unused(self):
+        """
+        Drop least recently used maps until the resident budget is met,
+        keeping the current map and its neighbors.
+        """
+        if len(self.maps) <= self.max_resident_maps:
+            return
+        
+        keep = set()
+        if self.current_map:
+            keep.add(self.current_map.map_id)
+            keep.update(target for target in self.current_map.connections.values() if target)
+        
+        # The most recently used map was just asked for, so it always stays
+        for map_id in list(self.maps)[:-1]:
+            if len(self.maps) <= self.max_resident_maps:
+                break
+            if map_id in keep or map_id not in self.definitions:
+                continue
+            self._evict(map_id)
+            
+    def _evict(self, map_id):
+        """
+        Unload a map area, keeping only its persistent state.
+        
+        Args:
+            map_id (str): The ID of the map to unload
+        """
+        map_area = self.maps.pop(map_id)
+        self.map_state[map_id] = (map_area.steps_until_encounter, map_area.step_timer)
+        if map_area.tile_map:
+            map_area.tile_map.close()
         
     def set_current_map(self, map_id):
         """
-        Set the current active map.
+        Set the current active map, building it if needed.
         
         Args:
             map_id (str): The ID of the map to set as current
@@ -296,11 +844,23 @@ class MapSystem:
         Returns:
             bool: True if map was found and set, False otherwise
         """
-        if map_id in self.maps:
-            self.current_map = self.maps[map_id]
+        map_area = self.get_map(map_id)
+        if map_area is not None:
+            self.current_map = map_area
+            self._evict_unused()
             return True
         return False
         
+    def update_npcs(self, player, dt):
+        """
+        Move NPCs with behaviors on the resident maps, nearest to the player most often.
+        
+        Args:
+            player: The player entity
+            dt (float): Seconds since the last frame
+        """
+        self.npc_scheduler.update(self, player, dt)
+        
     def get_current_map(self):
         """
         Get the current active map.
@@ -322,10 +882,21 @@ class MapSystem:
         Returns:
             bool: True if connection was made, False otherwise
         """
-        if map_id1 in self.maps and map_id2 in self.maps:
-            self.maps[map_id1].connect(direction, self.maps[map_id2])
-            return True
-        return False
+        known = set(self.definitions) | set(self.maps)
+        if map_id1 not in known or map_id2 not in known:
+            return False
+        
+        # Record the connection both ways, unless the other way is already taken
+        reverse_dir = REVERSE_DIRECTIONS[direction]
+        for source_id, side, target_id in ((map_id1, direction, map_id2),
+                                           (map_id2, reverse_dir, map_id1)):
+            definition = self.definitions.get(source_id)
+            if definition is not None:
+                definition.connections.setdefault(side, target_id)
+            map_area = self.maps.get(source_id)
+            if map_area is not None and map_area.connections[side] is None:
+                map_area.connect(side, target_id)
+        return True
         
     def transition_player(self, player, new_map, entry_side):
         """
@@ -333,11 +904,16 @@ class MapSystem:
         
         Args:
             player: The player entity
-            new_map (MapArea): The destination map
+            new_map: The destination map area or its map ID
             entry_side (str): The side the player is entering from
         """
+        if not isinstance(new_map, MapArea):
+            new_map = self.get_map(new_map)
+            if new_map is None:
+                return
+        
         # Get current screen dimensions
-        current_width, current_height = pygame.display.get_surface().get_size()
+        current_width, current_height = get_render_size()
         
         # Remove player from current map entities
         if self.current_map:
@@ -370,4 +946,7 @@ class MapSystem:
         player.original_y = player.rect.y * scale_factor_y
         
         # Set the new map as current
-        self.current_map = new_map
\ No newline at end of file
+        self.current_map = new_map
+        
+        # Maps that are no longer next to the player can go
+        self._evict_unused()
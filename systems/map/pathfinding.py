@@ -0,0 +1,259 @@
+"""
+Pathfinding for the RPG game.
+Finds routes for NPCs over a grid built from a map area's collision data:
+A* for one-off paths, and cached distance fields (flow fields) for goals
+that many NPCs head for at once, such as the player.
+"""
+import heapq
+from collections import OrderedDict, deque
+from constants import ORIGINAL_WIDTH, ORIGINAL_HEIGHT
+from systems.map.tile_map import LAYER_COLLISION
+
+# Grid cell size in design pixels for maps without a tile map
+NAV_CELL_SIZE = 32
+
+# Distance fields kept per map before the least recently used is dropped
+MAX_CACHED_FIELDS = 16
+
+# Distance of cells a goal can't be reached from
+UNREACHABLE = -1
+
+class NavGrid:
+    """
+    Walkability grid over the visible map area, in design pixels.
+    """
+    def __init__(self, tile_map=None):
+        """
+        Build the grid.
+
+        Args:
+            tile_map (TileMap): Tile map to take collision from (all open if not given)
+        """
+        self.cell_size = tile_map.tile_size if tile_map else NAV_CELL_SIZE
+        self.width = -(-ORIGINAL_WIDTH // self.cell_size)
+        self.height = -(-ORIGINAL_HEIGHT // self.cell_size)
+
+        # One byte per cell, row-major; non-zero cells are blocked
+        self.blocked = bytearray(self.width * self.height)
+        if tile_map:
+            for y in range(self.height):
+                for x in range(self.width):
+                    if tile_map.cell(LAYER_COLLISION, x, y):
+                        self.blocked[y * self.width + x] = 1
+
+    def cell_at(self, x, y):
+        """
+        Get the index of the cell containing a point, clamped to the grid.
+
+        Args:
+            x (float): Point x coordinate in design pixels
+            y (float): Point y coordinate in design pixels
+
+        Returns:
+            int: Cell index
+        """
+        cx = min(max(int(x) // self.cell_size, 0), self.width - 1)
+        cy = min(max(int(y) // self.cell_size, 0), self.height - 1)
+        return cy * self.width + cx
+
+    def cell_center(self, index):
+        """
+        Get the center of a cell.
+
+        Args:
+            index (int): Cell index
+
+        Returns:
+            tuple: (x, y) in design pixels
+        """
+        cy, cx = divmod(index, self.width)
+        half = self.cell_size / 2
+        return (cx * self.cell_size + half, cy * self.cell_size + half)
+
+    def neighbors(self, index):
+        """
+        Get the open cells next to a cell (no diagonals).
+
+        Args:
+            index (int): Cell index
+
+        Returns:
+            list: Indexes of walkable neighboring cells
+        """
+        width = self.width
+        cx = index % width
+        result = []
+        if cx > 0 and not self.blocked[index - 1]:
+            result.append(index - 1)
+        if cx < width - 1 and not self.blocked[index + 1]:
+            result.append(index + 1)
+        if index >= width and not self.blocked[index - width]:
+            result.append(index - width)
+        if index + width < len(self.blocked) and not self.blocked[index + width]:
+            result.append(index + width)
+        return result
+
+class Pathfinder:
+    """
+    Path and distance field queries for one map area.
+    """
+    def __init__(self, map_area):
+        """
+        Initialize the pathfinder.
+
+        Args:
+            map_area (MapArea): The map area to find paths in
+        """
+        self.map_area = map_area
+        self.grid = None
+        self.grid_version = None       # Collision version the grid was built from
+        self.fields = OrderedDict()    # Goal cell -> distance field, least recently used first
+
+    def get_grid(self):
+        """
+        Get the navigation grid, rebuilding it if the collision data changed.
+
+        Returns:
+            NavGrid: The current grid
+        """
+        version = self.map_area.collision_version
+        if self.grid is None or self.grid_version != version:
+            self.grid = NavGrid(self.map_area.tile_map)
+            self.grid_version = version
+            # Fields from the old collision data are no longer valid
+            self.fields.clear()
+        return self.grid
+
+    def find_path(self, start, goal):
+        """
+        Find a path between two points with A*.
+
+        Args:
+            start (tuple): (x, y) in design pixels
+            goal (tuple): (x, y) in design pixels
+
+        Returns:
+            list: Cell centers to walk through, ending at the goal's cell
+                  (empty if already there), or None if the goal can't be reached
+        """
+        grid = self.get_grid()
+        start_cell = grid.cell_at(*start)
+        goal_cell = grid.cell_at(*goal)
+        if grid.blocked[goal_cell]:
+            return None
+
+        width = grid.width
+        goal_x, goal_y = goal_cell % width, goal_cell // width
+
+        def estimate(cell):
+            # Manhattan distance, exact on an open 4-connected grid
+            return abs(cell % width - goal_x) + abs(cell // width - goal_y)
+
+        came_from = {start_cell: None}
+        cost = {start_cell: 0}
+        open_heap = [(estimate(start_cell), 0, start_cell)]
+        while open_heap:
+            _, current_cost, current = heapq.heappop(open_heap)
+            if current == goal_cell:
+                break
+            if current_cost > cost[current]:
+                continue  # Stale entry
+            for neighbor in grid.neighbors(current):
+                new_cost = current_cost + 1
+                if new_cost < cost.get(neighbor, new_cost + 1):
+                    cost[neighbor] = new_cost
+                    came_from[neighbor] = current
+                    heapq.heappush(open_heap, (new_cost + estimate(neighbor), new_cost, neighbor))
+        else:
+            return None
+
+        # Walk back from the goal
+        path = []
+        cell = goal_cell
+        while cell != start_cell:
+            path.append(grid.cell_center(cell))
+            cell = came_from[cell]
+        path.reverse()
+        return path
+
+    def distance_field(self, goal):
+        """
+        Get the distance from every cell to a goal, computing it once per goal cell.
+
+        Args:
+            goal (tuple): (x, y) in design pixels
+
+        Returns:
+            list: Steps to the goal per cell index (UNREACHABLE if there is no path)
+        """
+        grid = self.get_grid()
+        goal_cell = grid.cell_at(*goal)
+
+        field = self.fields.get(goal_cell)
+        if field is not None:
+            self.fields.move_to_end(goal_cell)
+            return field
+
+        # Breadth-first search outward from the goal
+        field = [UNREACHABLE] * len(grid.blocked)
+        field[goal_cell] = 0
+        queue = deque([goal_cell])
+        while queue:
+            cell = queue.popleft()
+            distance = field[cell] + 1
+            for neighbor in grid.neighbors(cell):
+                if field[neighbor] == UNREACHABLE:
+                    field[neighbor] = distance
+                    queue.append(neighbor)
+
+        self.fields[goal_cell] = field
+        if len(self.fields) > MAX_CACHED_FIELDS:
+            self.fields.popitem(last=False)
+        return field
+
+    def step_toward(self, position, goal):
+        """
+        Get the next cell to move to on a shortest path to a goal.
+
+        Args:
+            position (tuple): (x, y) in design pixels
+            goal (tuple): (x, y) in design pixels
+
+        Returns:
+            tuple: Center of the next cell, or None if at the goal or it can't be reached
+        """
+        return self._step(position, goal, toward=True)
+
+    def step_away(self, position, threat):
+        """
+        Get the next cell to move to in order to get farther from a threat.
+
+        Args:
+            position (tuple): (x, y) in design pixels
+            threat (tuple): (x, y) in design pixels
+
+        Returns:
+            tuple: Center of the next cell, or None if no neighbor is farther away
+        """
+        return self._step(position, threat, toward=False)
+
+    def _step(self, position, goal, toward):
+        """
+        Pick the neighboring cell that moves down (or up) the goal's distance field.
+        """
+        grid = self.get_grid()
+        field = self.distance_field(goal)
+        cell = grid.cell_at(*position)
+
+        best = None
+        best_distance = field[cell]
+        if best_distance == UNREACHABLE:
+            return None
+        for neighbor in grid.neighbors(cell):
+            distance = field[neighbor]
+            if distance == UNREACHABLE:
+                continue
+            if (distance < best_distance) if toward else (distance > best_distance):
+                best = neighbor
+                best_distance = distance
+        return grid.cell_center(best) if best is not None else None
@@ -0,0 +1,173 @@
+"""
+Spatial hash for the RPG game.
+A uniform grid over entity rects so collision and interaction queries only
+look at entities in nearby cells.
+"""
+
+# Default cell size in pixels (about two NPCs wide)
+DEFAULT_CELL_SIZE = 64
+
+class SpatialHash:
+    """
+    Uniform-grid index of entities by their rects.
+    """
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        """
+        Initialize an empty spatial hash.
+
+        Args:
+            cell_size (int): Width and height of each grid cell in pixels
+        """
+        self.cell_size = cell_size
+        self.cells = {}          # (cell x, cell y) -> set of entities
+        self.entity_cells = {}   # Entity -> (min cx, min cy, max cx, max cy) it occupies
+
+    def _cell_range(self, rect):
+        """
+        Get the range of cells a rect covers.
+
+        Args:
+            rect (pygame.Rect): The rect to look up
+
+        Returns:
+            tuple: (min cx, min cy, max cx, max cy), inclusive
+        """
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def insert(self, entity):
+        """
+        Add an entity, or move it if it is already indexed.
+
+        Args:
+            entity: An entity with a rect
+        """
+        cell_range = self._cell_range(entity.rect)
+        old_range = self.entity_cells.get(entity)
+        if old_range == cell_range:
+            return
+        if old_range is not None:
+            self._unlink(entity, old_range)
+
+        min_x, min_y, max_x, max_y = cell_range
+        for cx in range(min_x, max_x + 1):
+            for cy in range(min_y, max_y + 1):
+                self.cells.setdefault((cx, cy), set()).add(entity)
+        self.entity_cells[entity] = cell_range
+
+    # Moving an entity is the same as re-inserting it
+    update = insert
+
+    def remove(self, entity):
+        """
+        Remove an entity from the index.
+
+        Args:
+            entity: The entity to remove
+        """
+        cell_range = self.entity_cells.pop(entity, None)
+        if cell_range is not None:
+            self._unlink(entity, cell_range)
+
+    def _unlink(self, entity, cell_range):
+        """
+        Remove an entity from a range of cells.
+
+        Args:
+            entity: The entity to remove
+            cell_range (tuple): (min cx, min cy, max cx, max cy)
+        """
+        min_x, min_y, max_x, max_y = cell_range
+        for cx in range(min_x, max_x + 1):
+            for cy in range(min_y, max_y + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(entity)
+                    if not cell:
+                        del self.cells[(cx, cy)]
+
+    def rebuild(self, entities):
+        """
+        Re-index a set of entities from scratch (e.g. after rescaling).
+
+        Args:
+            entities: Iterable of entities with rects
+        """
+        self.cells = {}
+        self.entity_cells = {}
+        for entity in entities:
+            self.insert(entity)
+
+    def _candidates(self, min_x, min_y, max_x, max_y):
+        """
+        Collect the entities in a range of cells.
+
+        Returns:
+            set: Entities in the cells
+        """
+        found = set()
+        for cx in range(min_x, max_x + 1):
+            for cy in range(min_y, max_y + 1):
+                cell = self.cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return found
+
+    def query_rect(self, rect):
+        """
+        Find the entities whose rects overlap a rect.
+
+        Args:
+            rect (pygame.Rect): The area to search
+
+        Returns:
+            list: Overlapping entities
+        """
+        return [entity for entity in self._candidates(*self._cell_range(rect))
+                if rect.colliderect(entity.rect)]
+
+    def first_colliding(self, rect, exclude=None):
+        """
+        Find any entity overlapping a rect.
+
+        Args:
+            rect (pygame.Rect): The area to test
+            exclude: An entity to ignore (e.g. the one moving)
+
+        Returns:
+            The first overlapping entity, or None
+        """
+        for entity in self._candidates(*self._cell_range(rect)):
+            if entity is not exclude and rect.colliderect(entity.rect):
+                return entity
+        return None
+
+    def nearest(self, x, y, max_distance, predicate=None):
+        """
+        Find the entity whose center is closest to a point.
+
+        Args:
+            x (int): Point x coordinate
+            y (int): Point y coordinate
+            max_distance (float): Ignore entities farther away than this
+            predicate: Optional callable; only entities it accepts are considered
+
+        Returns:
+            The nearest matching entity, or None
+        """
+        size = self.cell_size
+        reach = int(max_distance)
+        candidates = self._candidates((x - reach) // size, (y - reach) // size,
+                                      (x + reach) // size, (y + reach) // size)
+
+        best = None
+        best_distance = max_distance * max_distance
+        for entity in candidates:
+            dx = entity.rect.centerx - x
+            dy = entity.rect.centery - y
+            distance = dx * dx + dy * dy
+            if distance <= best_distance and (predicate is None or predicate(entity)):
+                best = entity
+                best_distance = distance
+        return best
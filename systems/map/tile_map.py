@@ -0,0 +1,226 @@
+"""
+Chunked tile maps for the RPG game.
+Tile, collision and encounter-zone layers are stored on disk as fixed-width
+binary arrays in chunk-major order and memory-mapped, so only the chunks
+that are actually looked at get paged in.
+
+File layout (all little-endian):
+    header      magic "RPGTMAP1", version, tile size, width, height,
+                chunk size, layer count
+    layer table name (16 bytes), dtype code, data offset - one per layer
+    layer data  one block per layer; each block holds every chunk in
+                row-major chunk order, each chunk chunk_size x chunk_size
+                cells in row-major order (edge chunks are padded)
+"""
+import mmap
+import struct
+import numpy as np
+
+MAGIC = b"RPGTMAP1"
+VERSION = 1
+
+# Layers every tile map has, with their on-disk cell types
+LAYER_TILES = "tiles"           # Tile IDs (0 = empty)
+LAYER_COLLISION = "collision"   # Non-zero cells block movement
+LAYER_ENCOUNTER = "encounter"   # Encounter zone IDs (0 = no encounters)
+LAYER_DTYPES = {
+    LAYER_TILES: np.dtype("<u2"),
+    LAYER_COLLISION: np.dtype("u1"),
+    LAYER_ENCOUNTER: np.dtype("u1"),
+}
+
+_HEADER = struct.Struct("<8sHHIIHH")   # magic, version, tile size, width, height, chunk size, layers
+_LAYER_ENTRY = struct.Struct("<16s4sQ") # name, dtype code, data offset
+
+DEFAULT_CHUNK_SIZE = 32
+
+class TileMap:
+    """
+    Read-only, memory-mapped tile map.
+    """
+    def __init__(self, path):
+        """
+        Open a tile map file.
+
+        Args:
+            path (str): Path to the tile map file
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.tile_size, self.width, self.height, self.chunk_size, layer_count = \
+            _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a tile map")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported tile map version: {version}")
+
+        self.chunks_x = -(-self.width // self.chunk_size)
+        self.chunks_y = -(-self.height // self.chunk_size)
+        self.cells_per_chunk = self.chunk_size * self.chunk_size
+
+        # Layer name -> (dtype, data offset)
+        self.layers = {}
+        for i in range(layer_count):
+            name, code, offset = _LAYER_ENTRY.unpack_from(self._map, _HEADER.size + i * _LAYER_ENTRY.size)
+            name = name.rstrip(b"\0").decode("ascii")
+            self.layers[name] = (np.dtype(code.rstrip(b"\0").decode("ascii")), offset)
+
+    def close(self):
+        """Release the memory map and the file."""
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # A chunk view is still alive; the map closes when it is collected
+                pass
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @property
+    def pixel_size(self):
+        """(width, height) of the whole map in design pixels."""
+        return self.width * self.tile_size, self.height * self.tile_size
+
+    def chunk(self, layer, cx, cy):
+        """
+        Get one chunk of a layer without copying it.
+
+        Args:
+            layer (str): Layer name
+            cx (int): Chunk column
+            cy (int): Chunk row
+
+        Returns:
+            np.ndarray: Read-only chunk_size x chunk_size view, or None if out of range
+        """
+        if not (0 <= cx < self.chunks_x and 0 <= cy < self.chunks_y):
+            return None
+        dtype, offset = self.layers[layer]
+        index = cy * self.chunks_x + cx
+        start = offset + index * self.cells_per_chunk * dtype.itemsize
+        cells = np.frombuffer(self._map, dtype=dtype, count=self.cells_per_chunk, offset=start)
+        return cells.reshape(self.chunk_size, self.chunk_size)
+
+    def cell(self, layer, tx, ty):
+        """
+        Get a single cell of a layer.
+
+        Args:
+            layer (str): Layer name
+            tx (int): Tile column
+            ty (int): Tile row
+
+        Returns:
+            int: The cell value (0 outside the map)
+        """
+        if not (0 <= tx < self.width and 0 <= ty < self.height):
+            return 0
+        size = self.chunk_size
+        chunk = self.chunk(layer, tx // size, ty // size)
+        return int(chunk[ty % size, tx % size])
+
+    def chunks_in_rect(self, x, y, width, height):
+        """
+        List the chunks overlapping an area in design pixels.
+
+        Args:
+            x, y, width, height: The area to cover
+
+        Returns:
+            list: (cx, cy) chunk coordinates inside the map
+        """
+        span = self.chunk_size * self.tile_size
+        min_cx = max(0, int(x) // span)
+        min_cy = max(0, int(y) // span)
+        max_cx = min(self.chunks_x - 1, int(x + width - 1) // span)
+        max_cy = min(self.chunks_y - 1, int(y + height - 1) // span)
+        return [(cx, cy) for cy in range(min_cy, max_cy + 1) for cx in range(min_cx, max_cx + 1)]
+
+    def _cells_in_rect(self, layer, x, y, width, height):
+        """
+        Yield the cell values of a layer under an area in design pixels.
+        """
+        size = self.tile_size
+        min_tx = max(0, int(x) // size)
+        min_ty = max(0, int(y) // size)
+        max_tx = min(self.width - 1, int(x + width - 1) // size)
+        max_ty = min(self.height - 1, int(y + height - 1) // size)
+        for ty in range(min_ty, max_ty + 1):
+            for tx in range(min_tx, max_tx + 1):
+                yield self.cell(layer, tx, ty)
+
+    def is_blocked(self, x, y, width, height):
+        """
+        Check whether any collision cell overlaps an area in design pixels.
+
+        Args:
+            x, y, width, height: The area to test
+
+        Returns:
+            bool: True if movement into the area is blocked
+        """
+        return any(self._cells_in_rect(LAYER_COLLISION, x, y, width, height))
+
+    def encounter_zone_at(self, x, y):
+        """
+        Get the encounter zone at a point in design pixels.
+
+        Args:
+            x (float): Point x coordinate
+            y (float): Point y coordinate
+
+        Returns:
+            int: Encounter zone ID (0 = no encounters)
+        """
+        return self.cell(LAYER_ENCOUNTER, int(x) // self.tile_size, int(y) // self.tile_size)
+
+def write_tile_map(path, tiles, collision=None, encounter=None, tile_size=32,
+                   chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Write layers to a tile map file.
+
+    Args:
+        path (str): File to write
+        tiles: 2D array of tile IDs (rows x columns)
+        collision: 2D array of collision flags (all clear if not given)
+        encounter: 2D array of encounter zone IDs (none if not given)
+        tile_size (int): Tile size in design pixels
+        chunk_size (int): Chunk width and height in tiles
+    """
+    tiles = np.asarray(tiles)
+    height, width = tiles.shape
+    layers = {
+        LAYER_TILES: tiles,
+        LAYER_COLLISION: np.zeros((height, width)) if collision is None else np.asarray(collision),
+        LAYER_ENCOUNTER: np.zeros((height, width)) if encounter is None else np.asarray(encounter),
+    }
+
+    chunks_x = -(-width // chunk_size)
+    chunks_y = -(-height // chunk_size)
+
+    with open(path, "wb") as out:
+        out.write(_HEADER.pack(MAGIC, VERSION, tile_size, width, height, chunk_size, len(layers)))
+
+        # Layer data starts right after the layer table
+        offset = _HEADER.size + len(layers) * _LAYER_ENTRY.size
+        blocks = []
+        for name, data in layers.items():
+            dtype = LAYER_DTYPES[name]
+            # Pad to whole chunks, then reorder so each chunk is contiguous
+            padded = np.zeros((chunks_y * chunk_size, chunks_x * chunk_size), dtype=dtype)
+            padded[:height, :width] = data
+            block = (padded.reshape(chunks_y, chunk_size, chunks_x, chunk_size)
+                           .transpose(0, 2, 1, 3)
+                           .tobytes())
+            out.write(_LAYER_ENTRY.pack(name.encode("ascii"), dtype.str.encode("ascii"), offset))
+            blocks.append(block)
+            offset += len(block)
+
+        for block in blocks:
+            out.write(block)
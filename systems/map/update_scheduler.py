@@ -0,0 +1,221 @@
+"""
+NPC update scheduler for the RPG game.
+Ticks NPCs at different rates depending on where they are: every frame
+near the player, every few frames elsewhere on the current map, and
+rarely on resident maps the player isn't on. Each tier may tick a fixed
+number of NPCs per frame; entities that don't fit wait for the next frame.
+The cap is a tick count rather than a time budget so which NPCs move on a
+given frame doesn't depend on machine speed, and replays stay in step.
+"""
+import time
+from collections import deque
+
+# Tier names
+TIER_NEAR = "near"              # On the current map, close to the player
+TIER_FAR = "far"                # On the current map, farther away
+TIER_BACKGROUND = "background"  # On a resident map the player isn't on
+
+# NPCs whose centers are this close to the player (design pixels) are in the near tier
+NEAR_DISTANCE = 240
+
+# Frames between ticks, per tier
+TIER_INTERVALS = {
+    TIER_NEAR: 1,
+    TIER_FAR: 4,
+    TIER_BACKGROUND: 30,
+}
+
+# Most NPCs each tier may tick per frame
+TIER_MAX_TICKS = {
+    TIER_NEAR: 48,
+    TIER_FAR: 24,
+    TIER_BACKGROUND: 12,
+}
+
+# Longest time step handed to one tick, so NPCs don't jump after a long wait
+MAX_TICK_DT = 0.5
+
+class TierStats:
+    """
+    Timing of one tier's ticks.
+    """
+    def __init__(self):
+        """Initialize empty stats."""
+        self.frames = 0        # Frames the tier did any work in
+        self.ticks = 0         # Entity ticks in total
+        self.last_ticks = 0    # Entity ticks in the last frame it ran
+        self.last_ms = 0.0     # Time spent in the last frame it ran
+        self.total_ms = 0.0
+        self.peak_ms = 0.0
+        self.deferred = 0      # Entity ticks pushed to a later frame by the tick cap
+
+    @property
+    def average_ms(self):
+        """Average time per frame the tier ran in."""
+        return self.total_ms / self.frames if self.frames else 0.0
+
+    def record(self, ticks, elapsed_ms, deferred):
+        """
+        Record one frame of work.
+
+        Args:
+            ticks (int): Entities ticked
+            elapsed_ms (float): Time spent ticking them
+            deferred (int): Entities left for a later frame
+        """
+        self.frames += 1
+        self.ticks += ticks
+        self.last_ticks = ticks
+        self.last_ms = elapsed_ms
+        self.total_ms += elapsed_ms
+        self.peak_ms = max(self.peak_ms, elapsed_ms)
+        self.deferred += deferred
+
+class UpdateScheduler:
+    """
+    Spreads NPC behavior updates over frames by tier.
+    """
+    def __init__(self, max_ticks=None, intervals=None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_ticks (dict): Tier -> most ticks per frame (TIER_MAX_TICKS if not given)
+            intervals (dict): Tier -> frames between ticks (TIER_INTERVALS if not given)
+        """
+        self.max_ticks = dict(TIER_MAX_TICKS, **(max_ticks or {}))
+        self.intervals = dict(TIER_INTERVALS, **(intervals or {}))
+        self.frame = 0
+        self.clock = 0.0   # Simulated seconds so far
+        self.last_dt = 0.0
+        self.near_offset = 0  # Rotates the near tier so the cap doesn't always cut the same NPCs
+        self.pending = {tier: deque() for tier in self.intervals}  # (map area, npc) left to tick
+        self.stats = {tier: TierStats() for tier in self.intervals}
+
+    def update(self, map_system, player, dt):
+        """
+        Tick the NPCs that are due this frame.
+
+        Args:
+            map_system (MapSystem): The map system with the resident maps
+            player: The player entity
+            dt (float): Seconds since the last frame
+        """
+        self.clock += dt
+        self.last_dt = dt
+        current_map = map_system.get_current_map()
+
+        # Sort the current map's NPCs by distance to the player
+        near, far = [], []
+        if current_map:
+            player_x = player.original_x + player.original_width / 2
+            player_y = player.original_y + player.original_height / 2
+            limit = NEAR_DISTANCE * NEAR_DISTANCE
+            for npc in current_map.npcs:
+                if not npc.behavior:
+                    continue
+                center_x, center_y = npc.design_center()
+                dx = center_x - player_x
+                dy = center_y - player_y
+                (near if dx * dx + dy * dy <= limit else far).append((current_map, npc))
+
+        # Near NPCs are redone every frame, so nothing carries over
+        if near:
+            start = self.near_offset % len(near)
+            near = near[start:] + near[:start]
+        self.pending[TIER_NEAR] = deque(near)
+        if self._is_due(TIER_FAR) and not self.pending[TIER_FAR]:
+            self.pending[TIER_FAR].extend(far)
+        if self._is_due(TIER_BACKGROUND) and not self.pending[TIER_BACKGROUND]:
+            for map_area in list(map_system.maps.values()):
+                if map_area is current_map:
+                    continue
+                self.pending[TIER_BACKGROUND].extend(
+                    (map_area, npc) for npc in map_area.npcs if npc.behavior)
+
+        near_npcs = {npc for _, npc in near}
+        for tier in (TIER_NEAR, TIER_FAR, TIER_BACKGROUND):
+            self._run_tier(tier, map_system, current_map, player, near_npcs)
+
+        self.frame += 1
+
+    def _is_due(self, tier):
+        """
+        Check whether a tier starts a new round of ticks this frame.
+
+        Args:
+            tier (str): Tier name
+
+        Returns:
+            bool: True on the tier's frames
+        """
+        return self.frame % self.intervals[tier] == 0
+
+    def _run_tier(self, tier, map_system, current_map, player, near_npcs):
+        """
+        Tick a tier's pending NPCs until they are done or its tick cap is reached.
+
+        Args:
+            tier (str): Tier name
+            map_system (MapSystem): The map system
+            current_map (MapArea): The map the player is on
+            player: The player entity
+            near_npcs (set): NPCs in the near tier this frame
+        """
+        pending = self.pending[tier]
+        if not pending:
+            return
+
+        # The cap decides which NPCs tick; the clock is only read for the stats
+        max_ticks = max(1, self.max_ticks[tier])
+        start = time.perf_counter()
+        ticks = 0
+        while pending and ticks < max_ticks:
+            map_area, npc = pending.popleft()
+
+            # Skip NPCs that moved to another tier or whose map was unloaded
+            if tier == TIER_FAR and (map_area is not current_map or npc in near_npcs):
+                continue
+            if tier == TIER_BACKGROUND and (map_area is current_map or
+                                            map_system.maps.get(map_area.map_id) is not map_area):
+                continue
+
+            self._tick(map_area, npc, player if map_area is current_map else None)
+            ticks += 1
+
+        self.stats[tier].record(ticks, (time.perf_counter() - start) * 1000, len(pending))
+
+        # Near NPCs that didn't fit go first next frame
+        if tier == TIER_NEAR and pending:
+            self.near_offset += ticks
+
+    def _tick(self, map_area, npc, player):
+        """
+        Update one NPC with the time since its last tick.
+
+        Args:
+            map_area (MapArea): The map the NPC is on
+            npc: The NPC to update
+            player: The player entity, or None if the player is on another map
+        """
+        if npc.last_update is None:
+            tick_dt = self.last_dt
+        else:
+            tick_dt = min(self.clock - npc.last_update, MAX_TICK_DT)
+        npc.last_update = self.clock
+        if tick_dt > 0:
+            npc.update_behavior(map_area, player, tick_dt)
+
+    def summary(self):
+        """
+        Describe how long each tier's ticks took.
+
+        Returns:
+            str: One line per tier
+        """
+        lines = []
+        for tier, stats in self.stats.items():
+            lines.append(f"{tier}: {stats.ticks} ticks over {stats.frames} frames, "
+                         f"avg {stats.average_ms:.3f} ms, peak {stats.peak_ms:.3f} ms, "
+                         f"cap {self.max_ticks[tier]} ticks, deferred {stats.deferred}")
+        return "\n".join(lines)
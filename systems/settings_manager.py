@@ -4,8 +4,8 @@ Settings manager for the RPG game.
 import os
 import json
 from constants import (
-    TEXT_SPEED_FAST, DEFAULT_RESOLUTION, DEFAULT_DISPLAY_MODE,
-    RESOLUTION_OPTIONS, DISPLAY_MODE_OPTIONS
+    TEXT_SPEED_FAST, DEFAULT_RESOLUTION, DEFAULT_DISPLAY_MODE, DEFAULT_RENDER_MODE,
+    RESOLUTION_OPTIONS, DISPLAY_MODE_OPTIONS, RENDER_MODE_OPTIONS
 )
 
 class SettingsManager:
@@ -18,7 +18,9 @@ class SettingsManager:
         self.settings = {
             "text_speed": TEXT_SPEED_FAST,
             "resolution": DEFAULT_RESOLUTION,
-            "display_mode": DEFAULT_DISPLAY_MODE
+            "display_mode": DEFAULT_DISPLAY_MODE,
+            "dirty_rect_rendering": False,
+            "render_mode": DEFAULT_RENDER_MODE
         }
         
         # Load settings if file exists
@@ -56,6 +58,14 @@ class SettingsManager:
         # Validate display mode
         if self.settings["display_mode"] not in DISPLAY_MODE_OPTIONS:
             self.settings["display_mode"] = DEFAULT_DISPLAY_MODE
+            
+        # Validate dirty rect rendering flag
+        if not isinstance(self.settings["dirty_rect_rendering"], bool):
+            self.settings["dirty_rect_rendering"] = False
+            
+        # Validate render mode
+        if self.settings["render_mode"] not in RENDER_MODE_OPTIONS:
+            self.settings["render_mode"] = DEFAULT_RENDER_MODE
     
     def get_resolution(self):
         """
@@ -130,4 +140,52 @@ class SettingsManager:
         """
         self.settings["text_speed"] = speed
         self.save_settings()
-        return True
\ No newline at end of file
+        return True
+    
+    def get_dirty_rect_rendering(self):
+        """
+        Get whether dirty rect rendering is enabled for the world map.
+        
+        Returns:
+            bool: True if only changed screen regions should be updated
+        """
+        return self.settings["dirty_rect_rendering"]
+    
+    def set_dirty_rect_rendering(self, enabled):
+        """
+        Enable or disable dirty rect rendering for the world map.
+        
+        Args:
+            enabled (bool): Whether to update only changed screen regions
+            
+        Returns:
+            bool: True if setting was changed
+        """
+        self.settings["dirty_rect_rendering"] = bool(enabled)
+        self.save_settings()
+        return True
+    
+    def get_render_mode(self):
+        """
+        Get the current render mode.
+        
+        Returns:
+            str: Render mode setting
+        """
+        return self.settings["render_mode"]
+    
+    def set_render_mode(self, mode):
+        """
+        Set the render mode.
+        
+        Args:
+            mode: Render mode (NATIVE, LOGICAL, LOGICAL_CRISP)
+            
+        Returns:
+            bool: True if setting was changed, False if invalid
+        """
+        if mode in RENDER_MODE_OPTIONS:
+            self.settings["render_mode"] = mode
+            self.save_settings()
+            return True
+        return False
\ No newline at end of file
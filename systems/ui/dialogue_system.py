@@ -3,7 +3,9 @@ Dialogue system for the RPG game.
 """
 import pygame
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT, ORIGINAL_WIDTH, ORIGINAL_HEIGHT, BLACK, WHITE
-from utils.utils import scale_position, scale_dimensions, scale_font_size
+from utils.utils import scale_position, scale_dimensions
+from systems.ui.font_manager import font_manager
+from systems.ui import draw
 
 class DialogueSystem:
     """
@@ -85,6 +87,23 @@ class DialogueSystem:
                 self.displayed_text += self.current_dialogue[self.current_dialogue_index][self.text_index]
                 self.text_index += 1
     
+    def get_box_rect(self, screen):
+        """
+        Get the area covered by the dialogue box on the given screen.
+        
+        Args:
+            screen: The pygame surface the box is drawn on
+            
+        Returns:
+            pygame.Rect: The dialogue box rectangle
+        """
+        current_width, current_height = screen.get_size()
+        box_width = int(current_width * 0.8)
+        box_height = int(current_height * 0.2)
+        box_x = (current_width - box_width) // 2
+        box_y = current_height - box_height - int(20 * (current_height / ORIGINAL_HEIGHT))
+        return pygame.Rect(box_x, box_y, box_width, box_height)
+    
     def draw(self, screen):
         """
         Draw the dialogue box and text.
@@ -99,19 +118,15 @@ class DialogueSystem:
         current_width, current_height = screen.get_size()
         
         # Scale dialogue box dimensions and position
-        box_width = int(current_width * 0.8)
-        box_height = int(current_height * 0.2)
-        box_x = (current_width - box_width) // 2
-        box_y = current_height - box_height - int(20 * (current_height / ORIGINAL_HEIGHT))
+        box_x, box_y, box_width, box_height = self.get_box_rect(screen)
         
-        # Scale font size
-        font_size = scale_font_size(24, ORIGINAL_WIDTH, ORIGINAL_HEIGHT, current_width, current_height)
-        font = pygame.font.SysFont('Arial', font_size)
+        # Get the font scaled for the current resolution
+        font = font_manager.get_font(24, resolution=(current_width, current_height))
         
         # Draw dialogue box background
-        pygame.draw.rect(screen, BLACK, (box_x, box_y, box_width, box_height))
+        draw.rect(screen, BLACK, (box_x, box_y, box_width, box_height))
         border_width = max(1, int(2 * (current_width / ORIGINAL_WIDTH)))
-        pygame.draw.rect(screen, WHITE, (box_x, box_y, box_width, box_height), border_width)
+        draw.rect(screen, WHITE, (box_x, box_y, box_width, box_height), border_width)
         
         # Calculate text rendering position and maximum width
         text_x = box_x + int(20 * (current_width / ORIGINAL_WIDTH))
@@ -138,7 +153,7 @@ class DialogueSystem:
             lines.append(current_line)
         
         # Draw each line of text
-        line_height = int(font_size * 1.2)
+        line_height = font.get_linesize()
         for i, line in enumerate(lines):
             text_surface = font.render(line, True, WHITE)
             screen.blit(text_surface, (text_x, text_y + i * line_height))
@@ -0,0 +1,123 @@
+"""
+Dirty rectangle renderer for the RPG game.
+Redraws and pushes only the parts of the world map that changed since the last frame.
+"""
+import pygame
+from utils.utils import get_display_epoch
+
+class DirtyRectRenderer:
+    """
+    Renders the world map and dialogue states by updating only changed regions.
+    The static map layer is cached, and a full redraw happens whenever the map,
+    resolution or game state changes.
+    """
+    def __init__(self):
+        """Initialize the dirty rect renderer."""
+        self.static_layer = None       # Cached background, boundaries and map name
+        self.layer_key = None          # (map, screen size, display epoch, state) the layer belongs to
+        self.entity_rects = {}         # Entity -> rect it was last drawn at
+        self.entity_images = {}        # Entity -> image it was last drawn with
+        self.dialogue_rect = None      # Dialogue box area drawn last frame
+
+    def invalidate(self):
+        """Force a full redraw on the next frame."""
+        self.layer_key = None
+
+    def render(self, screen, current_map, state, dialogue_system=None):
+        """
+        Draw the current map (and dialogue box) and push the result to the display.
+
+        Args:
+            screen: The display surface
+            current_map: The map area being shown
+            state: The current game state
+            dialogue_system: Dialogue system to draw on top (optional)
+        """
+        # Scale entities added since the last frame (a no-op when nothing changed)
+        current_map.scale_entities(*screen.get_size())
+
+        layer_key = (current_map, screen.get_size(), get_display_epoch(), state)
+        if layer_key != self.layer_key:
+            self._full_redraw(screen, current_map, dialogue_system, layer_key)
+            return
+
+        dirty = []
+
+        # Entities that moved, changed or left the map
+        for entity in list(self.entity_rects):
+            if entity not in current_map.entities:
+                dirty.append(self.entity_rects.pop(entity))
+                self.entity_images.pop(entity, None)
+        for entity in current_map.entities:
+            old_rect = self.entity_rects.get(entity)
+            if old_rect != entity.rect or self.entity_images.get(entity) is not entity.image:
+                if old_rect is not None:
+                    dirty.append(old_rect)
+                dirty.append(entity.rect.copy())
+
+        # The dialogue box redraws every frame while it's shown, and clears when it closes
+        dialogue_rect = None
+        if dialogue_system and dialogue_system.active:
+            dialogue_rect = dialogue_system.get_box_rect(screen)
+            dirty.append(dialogue_rect)
+        if self.dialogue_rect is not None and dialogue_rect is None:
+            dirty.append(self.dialogue_rect)
+        self.dialogue_rect = dialogue_rect
+
+        if not dirty:
+            return
+
+        # Restore the static layer under every dirty region
+        for rect in dirty:
+            screen.blit(self.static_layer, rect, rect)
+
+        # Redraw any entity touching a dirty region, in group order
+        for entity in current_map.entities:
+            if entity.rect.collidelist(dirty) != -1:
+                screen.blit(entity.image, entity.rect)
+            self._remember(entity)
+
+        if dialogue_rect is not None:
+            dialogue_system.draw(screen)
+
+        pygame.display.update(dirty)
+
+    def _full_redraw(self, screen, current_map, dialogue_system, layer_key):
+        """
+        Rebuild the static layer and redraw the whole screen.
+
+        Args:
+            screen: The display surface
+            current_map: The map area being shown
+            dialogue_system: Dialogue system to draw on top (optional)
+            layer_key: Key identifying the new static layer
+        """
+        if self.static_layer is None or self.static_layer.get_size() != screen.get_size():
+            self.static_layer = pygame.Surface(screen.get_size())
+        current_map.draw_static(self.static_layer)
+        self.layer_key = layer_key
+
+        screen.blit(self.static_layer, (0, 0))
+        current_map.entities.draw(screen)
+
+        self.entity_rects = {}
+        self.entity_images = {}
+        for entity in current_map.entities:
+            self._remember(entity)
+
+        self.dialogue_rect = None
+        if dialogue_system and dialogue_system.active:
+            self.dialogue_rect = dialogue_system.get_box_rect(screen)
+            dialogue_system.draw(screen)
+
+        pygame.display.flip()
+
+    def _remember(self, entity):
+        """
+        Record where and how an entity was drawn.
+
+        Args:
+            entity: The entity that was drawn
+        """
+        self.entity_rects[entity] = entity.rect.copy()
+        self.entity_images[entity] = entity.image
@@ -0,0 +1,58 @@
+"""
+Shape drawing for the RPG game.
+Same calls as pygame.draw, but shapes drawn onto a crisp-text logical
+surface first draw in any held-back text underneath them, so the shape
+covers the text instead of the text being presented on top of it.
+"""
+import pygame
+from systems.ui.render_target import LogicalSurface
+
+def _draw_over(surface, bounds):
+    """
+    Get a surface ready for a shape to be drawn over an area.
+
+    Args:
+        surface: The surface about to be drawn on
+        bounds (pygame.Rect): Area the shape may cover
+    """
+    if isinstance(surface, LogicalSurface):
+        surface.bake_text(bounds)
+
+def _points_bounds(points, width):
+    """
+    Get the area covered by lines or a polygon through some points.
+
+    Args:
+        points: Sequence of (x, y) points
+        width (int): Line width (0 for a filled polygon)
+
+    Returns:
+        pygame.Rect: Bounding rect, grown by the line width
+    """
+    xs = [int(point[0]) for point in points]
+    ys = [int(point[1]) for point in points]
+    margin = max(width, 1)
+    return pygame.Rect(min(xs) - margin, min(ys) - margin,
+                       max(xs) - min(xs) + 2 * margin + 1,
+                       max(ys) - min(ys) + 2 * margin + 1)
+
+def rect(surface, color, rect, *args, **kwargs):
+    """Draw a rectangle, as pygame.draw.rect."""
+    _draw_over(surface, pygame.Rect(rect))
+    return pygame.draw.rect(surface, color, rect, *args, **kwargs)
+
+def line(surface, color, start_pos, end_pos, width=1):
+    """Draw a line, as pygame.draw.line."""
+    _draw_over(surface, _points_bounds((start_pos, end_pos), width))
+    return pygame.draw.line(surface, color, start_pos, end_pos, width)
+
+def polygon(surface, color, points, width=0):
+    """Draw a polygon, as pygame.draw.polygon."""
+    _draw_over(surface, _points_bounds(points, width))
+    return pygame.draw.polygon(surface, color, points, width)
+
+def circle(surface, color, center, radius, *args, **kwargs):
+    """Draw a circle, as pygame.draw.circle."""
+    x, y, r = int(center[0]), int(center[1]), int(radius) + 1
+    _draw_over(surface, pygame.Rect(x - r, y - r, 2 * r + 1, 2 * r + 1))
+    return pygame.draw.circle(surface, color, center, radius, *args, **kwargs)
@@ -0,0 +1,97 @@
+"""
+Font manager for the RPG game.
+Caches pygame fonts so draw code doesn't do a system font lookup every frame.
+"""
+import pygame
+from collections import OrderedDict
+from constants import ORIGINAL_WIDTH, ORIGINAL_HEIGHT
+from utils.utils import scale_font_size
+
+DEFAULT_FONT_FAMILY = 'Arial'
+MAX_CACHED_FONTS = 32
+
+class FontManager:
+    """
+    Shared font service keyed by (family, logical size, current resolution).
+    Least recently used fonts are evicted once the cache is full.
+    """
+    def __init__(self, max_fonts=MAX_CACHED_FONTS):
+        """
+        Initialize the font manager.
+
+        Args:
+            max_fonts (int): Maximum number of fonts to keep cached
+        """
+        self.max_fonts = max_fonts
+        self._fonts = OrderedDict()
+        self._font_keys = {}  # Font -> cache key, for looking fonts back up
+
+    def get_font(self, size, family=DEFAULT_FONT_FAMILY, resolution=None, scaled=True):
+        """
+        Get a font for the given logical size, creating it on first use.
+
+        Args:
+            size (int): Logical font size at the original design resolution
+            family (str): Font family name
+            resolution (tuple): Current (width, height), defaults to the render surface size
+            scaled (bool): Whether to scale the size to the current resolution
+
+        Returns:
+            pygame.font.Font: The cached font
+        """
+        if not scaled:
+            # Fixed-size fonts look the same at every resolution
+            resolution = None
+        elif resolution is None:
+            from systems.ui.render_target import get_render_size
+            resolution = get_render_size()
+
+        key = (family, size, resolution)
+        font = self._fonts.get(key)
+        if font is not None:
+            # Mark as most recently used
+            self._fonts.move_to_end(key)
+            return font
+
+        # Build the font at its actual pixel size
+        if scaled:
+            actual_size = scale_font_size(size, ORIGINAL_WIDTH, ORIGINAL_HEIGHT, resolution[0], resolution[1])
+        else:
+            actual_size = size
+        font = pygame.font.SysFont(family, actual_size)
+
+        self._fonts[key] = font
+        self._font_keys[font] = key
+        # Evict the least recently used font if over capacity
+        if len(self._fonts) > self.max_fonts:
+            _, evicted = self._fonts.popitem(last=False)
+            del self._font_keys[evicted]
+
+        return font
+
+    def describe(self, font):
+        """
+        Look up the family and logical size a cached font was created for.
+
+        Args:
+            font (pygame.font.Font): A font returned by get_font
+
+        Returns:
+            tuple: (family, logical size), or None if the font isn't cached
+        """
+        key = self._font_keys.get(font)
+        if key is None:
+            return None
+        family, size, _ = key
+        return family, size
+
+    def clear(self):
+        """Drop all cached fonts (e.g. after the display mode changes)."""
+        self._fonts.clear()
+        self._font_keys.clear()
+
+    def __len__(self):
+        return len(self._fonts)
+
+# Shared instance used by all draw paths
+font_manager = FontManager()
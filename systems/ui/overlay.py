@@ -0,0 +1,82 @@
+"""
+Menu overlays for the RPG game.
+Caches the semi-transparent overlays and dimmed backdrops drawn behind menus.
+"""
+import pygame
+
+# Overlay surfaces keyed by (size, color, alpha)
+_overlays = {}
+
+def get_overlay(size, color=(0, 0, 0), alpha=128):
+    """
+    Get a full-screen overlay surface, creating it on first use.
+
+    Args:
+        size (tuple): (width, height) of the overlay
+        color (tuple): RGB color of the overlay
+        alpha (int): Overlay opacity (0-255)
+
+    Returns:
+        pygame.Surface: The cached overlay
+    """
+    key = (tuple(size), tuple(color), alpha)
+    overlay = _overlays.get(key)
+    if overlay is None:
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill((*color, alpha))
+        _overlays[key] = overlay
+    return overlay
+
+def draw_overlay(screen, color=(0, 0, 0), alpha=128):
+    """
+    Draw a semi-transparent overlay over the whole screen.
+
+    Args:
+        screen: The pygame surface to draw on
+        color (tuple): RGB color of the overlay
+        alpha (int): Overlay opacity (0-255)
+    """
+    screen.blit(get_overlay(screen.get_size(), color, alpha), (0, 0))
+
+def clear_overlays():
+    """Drop all cached overlays (e.g. after the display mode changes)."""
+    _overlays.clear()
+    menu_backdrop.invalidate()
+
+class MenuBackdrop:
+    """
+    Snapshot of the scene behind a menu, composited with its overlay once
+    when the menu opens and blitted on every frame after that.
+    """
+    def __init__(self):
+        """Initialize an empty backdrop."""
+        self.surface = None
+        self.key = None
+
+    def draw(self, screen, key, draw_scene, alpha=128):
+        """
+        Draw the backdrop, rebuilding it if the key changed.
+
+        Args:
+            screen: The pygame surface to draw on
+            key: Identifies the scene being snapshotted (e.g. the menu state)
+            draw_scene (callable): Called with a surface to draw the scene behind the menu
+            alpha (int): Opacity of the dimming overlay, or None for no dimming
+        """
+        key = (key, screen.get_size(), alpha)
+        if key != self.key:
+            if self.surface is None or self.surface.get_size() != screen.get_size():
+                self.surface = pygame.Surface(screen.get_size())
+            draw_scene(self.surface)
+            if alpha:
+                draw_overlay(self.surface, alpha=alpha)
+            self.key = key
+
+        screen.blit(self.surface, (0, 0))
+
+    def invalidate(self):
+        """Force the backdrop to be rebuilt the next time a menu is drawn."""
+        self.key = None
+
+# Shared backdrop for the pause, settings, inventory and party menus
+menu_backdrop = MenuBackdrop()
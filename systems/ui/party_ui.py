@@ -4,7 +4,11 @@ Party management UI for the RPG game.
 import pygame
 from constants import (BLACK, WHITE, GREEN, RED, GRAY, BLUE, YELLOW, PURPLE,
                       ORIGINAL_WIDTH, ORIGINAL_HEIGHT, DIALOGUE)
-from utils.utils import scale_position, scale_dimensions, scale_font_size
+from utils.utils import scale_position, scale_dimensions
+from systems.ui.font_manager import font_manager
+from systems.ui import draw
+from systems.ui.text_cache import render_text
+from systems.ui.overlay import draw_overlay
 from systems.character.character_creator import CharacterCreator
 from entities.player import Player
 
@@ -391,29 +395,24 @@ class PartyManagementUI:
         current_width, current_height = screen.get_size()
         
         # Draw semi-transparent overlay 
-        overlay = pygame.Surface((current_width, current_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))  # Black with 80% opacity
-        screen.blit(overlay, (0, 0))
+        draw_overlay(screen, (0, 0, 0), 200)  # Black with 80% opacity
         
-        # Scale font sizes
-        title_font_size = scale_font_size(32, ORIGINAL_WIDTH, ORIGINAL_HEIGHT, current_width, current_height)
-        font_size = scale_font_size(24, ORIGINAL_WIDTH, ORIGINAL_HEIGHT, current_width, current_height)
-        small_font_size = scale_font_size(18, ORIGINAL_WIDTH, ORIGINAL_HEIGHT, current_width, current_height)
-        
-        title_font = pygame.font.SysFont('Arial', title_font_size)
-        font = pygame.font.SysFont('Arial', font_size)
-        small_font = pygame.font.SysFont('Arial', small_font_size)
+        # Get fonts scaled to the current resolution
+        resolution = (current_width, current_height)
+        title_font = font_manager.get_font(32, resolution=resolution)
+        font = font_manager.get_font(24, resolution=resolution)
+        small_font = font_manager.get_font(18, resolution=resolution)
         
         # Draw title
         title_text = "Party Management"
-        title_surface = title_font.render(title_text, True, WHITE)
+        title_surface = render_text(title_font, title_text, WHITE)
         title_x = (current_width - title_surface.get_width()) // 2
         title_y = int(50 * (current_height / ORIGINAL_HEIGHT))
         screen.blit(title_surface, (title_x, title_y))
         
         # Draw message if any
         if self.message:
-            msg_surface = font.render(self.message, True, YELLOW)
+            msg_surface = render_text(font, self.message, YELLOW)
             msg_x = (current_width - msg_surface.get_width()) // 2
             msg_y = int(100 * (current_height / ORIGINAL_HEIGHT))
             screen.blit(msg_surface, (msg_x, msg_y))
@@ -445,9 +444,9 @@ class PartyManagementUI:
         
         for i, option in enumerate(self.main_menu_options):
             if i == self.selected_option:
-                option_text = font.render(f"> {option}", True, WHITE)
+                option_text = render_text(font, f"> {option}", WHITE)
             else:
-                option_text = font.render(f"  {option}", True, GRAY)
+                option_text = render_text(font, f"  {option}", GRAY)
                 
             option_x = (current_width - option_text.get_width()) // 2
             option_y = option_y_base + i * option_spacing
@@ -462,7 +461,7 @@ class PartyManagementUI:
         
         # Draw class selection instructions
         instructions = "← Use arrow keys to select class →"
-        instr_surface = small_font.render(instructions, True, WHITE)
+        instr_surface = render_text(small_font, instructions, WHITE)
         instr_x = (current_width - instr_surface.get_width()) // 2
         instr_y = class_options_y - int(30 * (current_height / ORIGINAL_HEIGHT))
         screen.blit(instr_surface, (instr_x, instr_y))
@@ -481,11 +480,11 @@ class PartyManagementUI:
                 box_x = class_x - box_width // 2
                 box_y = class_options_y - int(10 * (current_height / ORIGINAL_HEIGHT))
                 
-                pygame.draw.rect(screen, BLUE, (box_x, box_y, box_width, box_height), 2)
+                draw.rect(screen, BLUE, (box_x, box_y, box_width, box_height), 2)
                 
-                class_surface = font.render(class_name, True, WHITE)
+                class_surface = render_text(font, class_name, WHITE)
             else:
-                class_surface = font.render(class_name, True, GRAY)
+                class_surface = render_text(font, class_name, GRAY)
                 
             class_surface_x = class_x - class_surface.get_width() // 2
             screen.blit(class_surface, (class_surface_x, class_options_y))
@@ -501,7 +500,7 @@ class PartyManagementUI:
             # Show class stats
             for i, (stat, value) in enumerate(selected_class.base_stats.items()):
                 stat_text = f"{stat.upper()}: {value}"
-                stat_surface = small_font.render(stat_text, True, WHITE)
+                stat_surface = render_text(small_font, stat_text, WHITE)
                 stat_x = class_center_x - stat_surface.get_width() // 2
                 stat_y = desc_y + i * int(25 * (current_height / ORIGINAL_HEIGHT))
                 screen.blit(stat_surface, (stat_x, stat_y))
@@ -509,21 +508,21 @@ class PartyManagementUI:
         # Draw current name
         name_y = int(350 * (current_height / ORIGINAL_HEIGHT))
         name_text = f"Name: {self.temp_name}"
-        name_surface = font.render(name_text, True, WHITE)
+        name_surface = render_text(font, name_text, WHITE)
         name_x = (current_width - name_surface.get_width()) // 2
         screen.blit(name_surface, (name_x, name_y))
         
         # Draw create button
         button_y = int(400 * (current_height / ORIGINAL_HEIGHT))
         button_text = "Press ENTER to name character"
-        button_surface = font.render(button_text, True, GREEN)
+        button_surface = render_text(font, button_text, GREEN)
         button_x = (current_width - button_surface.get_width()) // 2
         screen.blit(button_surface, (button_x, button_y))
         
         # Draw back instruction
         back_y = int(450 * (current_height / ORIGINAL_HEIGHT))
         back_text = "Press ESC to go back"
-        back_surface = small_font.render(back_text, True, GRAY)
+        back_surface = render_text(small_font, back_text, GRAY)
         back_x = (current_width - back_surface.get_width()) // 2
         screen.blit(back_surface, (back_x, back_y))
         
@@ -534,12 +533,12 @@ class PartyManagementUI:
         member_spacing = int(60 * (current_height / ORIGINAL_HEIGHT))
         
         # Active members
-        active_title = font.render("Active Members:", True, WHITE)
+        active_title = render_text(font, "Active Members:", WHITE)
         active_x = (current_width - active_title.get_width()) // 2
         screen.blit(active_title, (active_x, members_y_base))
         
         if not self.party.active_members:
-            no_active = small_font.render("No active members", True, GRAY)
+            no_active = render_text(small_font, "No active members", GRAY)
             no_active_x = (current_width - no_active.get_width()) // 2
             no_active_y = members_y_base + member_spacing
             screen.blit(no_active, (no_active_x, no_active_y))
@@ -551,26 +550,26 @@ class PartyManagementUI:
                 leader_mark = " (Leader)" if is_leader else ""
                 
                 member_text = f"{member.name}{leader_mark} - Level {member.level} {member.character_class.name}"
-                member_surface = small_font.render(member_text, True, color)
+                member_surface = render_text(small_font, member_text, color)
                 member_x = (current_width - member_surface.get_width()) // 2
                 member_y = members_y_base + member_spacing + i * int(30 * (current_height / ORIGINAL_HEIGHT))
                 screen.blit(member_surface, (member_x, member_y))
                 
         # Reserve members
         reserve_y = members_y_base + member_spacing * 6
-        reserve_title = font.render("Reserve Members:", True, WHITE)
+        reserve_title = render_text(font, "Reserve Members:", WHITE)
         reserve_x = (current_width - reserve_title.get_width()) // 2
         screen.blit(reserve_title, (reserve_x, reserve_y))
         
         if not self.party.reserve_members:
-            no_reserve = small_font.render("No reserve members", True, GRAY)
+            no_reserve = render_text(small_font, "No reserve members", GRAY)
             no_reserve_x = (current_width - no_reserve.get_width()) // 2
             no_reserve_y = reserve_y + member_spacing
             screen.blit(no_reserve, (no_reserve_x, no_reserve_y))
         else:
             for i, member in enumerate(self.party.reserve_members):
                 member_text = f"{member.name} - Level {member.level} {member.character_class.name}"
-                member_surface = small_font.render(member_text, True, WHITE)
+                member_surface = render_text(small_font, member_text, WHITE)
                 member_x = (current_width - member_surface.get_width()) // 2
                 member_y = reserve_y + member_spacing + i * int(30 * (current_height / ORIGINAL_HEIGHT))
                 screen.blit(member_surface, (member_x, member_y))
@@ -578,7 +577,7 @@ class PartyManagementUI:
         # Draw back instruction
         back_y = int(450 * (current_height / ORIGINAL_HEIGHT))
         back_text = "Press ENTER or ESC to go back"
-        back_surface = small_font.render(back_text, True, GRAY)
+        back_surface = render_text(small_font, back_text, GRAY)
         back_x = (current_width - back_surface.get_width()) // 2
         screen.blit(back_surface, (back_x, back_y))
         
@@ -589,9 +588,9 @@ class PartyManagementUI:
         
         for i, option in enumerate(self.manage_party_options):
             if i == self.selected_option:
-                option_text = font.render(f"> {option}", True, WHITE)
+                option_text = render_text(font, f"> {option}", WHITE)
             else:
-                option_text = font.render(f"  {option}", True, GRAY)
+                option_text = render_text(font, f"  {option}", GRAY)
                 
             option_x = (current_width - option_text.get_width()) // 2
             option_y = option_y_base + i * option_spacing
@@ -616,9 +615,9 @@ class PartyManagementUI:
             member_text = f"{prefix}{member.name}{leader_mark} - Level {member.level} {member.character_class.name}"
             
             if is_selected:
-                member_surface = font.render(member_text, True, WHITE)
+                member_surface = render_text(font, member_text, WHITE)
             else:
-                member_surface = font.render(member_text, True, GRAY)
+                member_surface = render_text(font, member_text, GRAY)
                 
             member_x = (current_width - member_surface.get_width()) // 2
             member_y = option_y_base + i * option_spacing
@@ -627,7 +626,7 @@ class PartyManagementUI:
         # Draw back instruction
         back_y = int(450 * (current_height / ORIGINAL_HEIGHT))
         back_text = "Press ESC to go back"
-        back_surface = small_font.render(back_text, True, GRAY)
+        back_surface = render_text(small_font, back_text, GRAY)
         back_x = (current_width - back_surface.get_width()) // 2
         screen.blit(back_surface, (back_x, back_y))
         
@@ -640,9 +639,9 @@ class PartyManagementUI:
             class_name = class_id.capitalize()
             
             if i == self.selected_option:
-                option_text = font.render(f"> {class_name}", True, WHITE)
+                option_text = render_text(font, f"> {class_name}", WHITE)
             else:
-                option_text = font.render(f"  {class_name}", True, GRAY)
+                option_text = render_text(font, f"  {class_name}", GRAY)
                 
             option_x = (current_width - option_text.get_width()) // 2
             option_y = option_y_base + i * option_spacing
@@ -657,13 +656,13 @@ class PartyManagementUI:
             desc_y = option_y_base + len(self.class_options) * option_spacing + int(20 * (current_height / ORIGINAL_HEIGHT))
             
             # Show class stats
-            stats_title = small_font.render("Base Stats:", True, YELLOW)
+            stats_title = render_text(small_font, "Base Stats:", YELLOW)
             stats_x = (current_width - stats_title.get_width()) // 2
             screen.blit(stats_title, (stats_x, desc_y))
             
             for i, (stat, value) in enumerate(selected_class.base_stats.items()):
                 stat_text = f"{stat.upper()}: {value}"
-                stat_surface = small_font.render(stat_text, True, WHITE)
+                stat_surface = render_text(small_font, stat_text, WHITE)
                 stat_x = (current_width - stat_surface.get_width()) // 2
                 stat_y = desc_y + int(25 * (current_height / ORIGINAL_HEIGHT)) + i * int(20 * (current_height / ORIGINAL_HEIGHT))
                 screen.blit(stat_surface, (stat_x, stat_y))
@@ -671,7 +670,7 @@ class PartyManagementUI:
         # Draw back instruction
         back_y = int(450 * (current_height / ORIGINAL_HEIGHT))
         back_text = "Press ESC to go back"
-        back_surface = small_font.render(back_text, True, GRAY)
+        back_surface = render_text(small_font, back_text, GRAY)
         back_x = (current_width - back_surface.get_width()) // 2
         screen.blit(back_surface, (back_x, back_y))
         
@@ -680,7 +679,7 @@ class PartyManagementUI:
         if not self.selected_character:
             # Should not happen, but handle it gracefully
             error_text = "No character selected!"
-            error_surface = font.render(error_text, True, RED)
+            error_surface = render_text(font, error_text, RED)
             error_x = (current_width - error_surface.get_width()) // 2
             error_y = int(150 * (current_height / ORIGINAL_HEIGHT))
             screen.blit(error_surface, (error_x, error_y))
@@ -689,7 +688,7 @@ class PartyManagementUI:
         # Draw character info
         char_y = int(150 * (current_height / ORIGINAL_HEIGHT))
         char_text = f"Editing: {self.selected_character.name} - Level {self.selected_character.level} {self.selected_character.character_class.name}"
-        char_surface = font.render(char_text, True, WHITE)
+        char_surface = render_text(font, char_text, WHITE)
         char_x = (current_width - char_surface.get_width()) // 2
         screen.blit(char_surface, (char_x, char_y))
         
@@ -700,9 +699,9 @@ class PartyManagementUI:
         
         for i, option in enumerate(options):
             if i == self.selected_option:
-                option_text = font.render(f"> {option}", True, WHITE)
+                option_text = render_text(font, f"> {option}", WHITE)
             else:
-                option_text = font.render(f"  {option}", True, GRAY)
+                option_text = render_text(font, f"  {option}", GRAY)
                 
             option_x = (current_width - option_text.get_width()) // 2
             option_y = option_y_base + i * option_spacing
@@ -711,7 +710,7 @@ class PartyManagementUI:
         # Draw back instruction
         back_y = int(450 * (current_height / ORIGINAL_HEIGHT))
         back_text = "Press ESC to go back"
-        back_surface = small_font.render(back_text, True, GRAY)
+        back_surface = render_text(small_font, back_text, GRAY)
         back_x = (current_width - back_surface.get_width()) // 2
         screen.blit(back_surface, (back_x, back_y))
         
@@ -725,7 +724,7 @@ class PartyManagementUI:
         input_x = (current_width - input_width) // 2
         
         # Draw input box
-        pygame.draw.rect(screen, WHITE, (input_x, input_y, input_width, input_height), 2)
+        draw.rect(screen, WHITE, (input_x, input_y, input_width, input_height), 2)
         
         # Draw current name
         name_surface = font.render(self.temp_name, True, WHITE)
@@ -741,12 +740,12 @@ class PartyManagementUI:
             
             # Make cursor blink
             if (pygame.time.get_ticks() // 500) % 2 == 0:
-                pygame.draw.line(screen, WHITE, (cursor_x, cursor_y), (cursor_x, cursor_y + cursor_height), 2)
+                draw.line(screen, WHITE, (cursor_x, cursor_y), (cursor_x, cursor_y + cursor_height), 2)
                 
         # Draw instructions
         instr_y = input_y + input_height + int(20 * (current_height / ORIGINAL_HEIGHT))
         instr_text = "Press ENTER to confirm or ESC to cancel"
-        instr_surface = font.render(instr_text, True, WHITE)
+        instr_surface = render_text(font, instr_text, WHITE)
         instr_x = (current_width - instr_surface.get_width()) // 2
         screen.blit(instr_surface, (instr_x, instr_y))
         
@@ -755,7 +754,7 @@ class PartyManagementUI:
         if not self.selected_character:
             # Should not happen, but handle it gracefully
             error_text = "No character selected!"
-            error_surface = font.render(error_text, True, RED)
+            error_surface = render_text(font, error_text, RED)
             error_x = (current_width - error_surface.get_width()) // 2
             error_y = int(150 * (current_height / ORIGINAL_HEIGHT))
             screen.blit(error_surface, (error_x, error_y))
@@ -764,7 +763,7 @@ class PartyManagementUI:
         # Draw character info
         char_y = int(150 * (current_height / ORIGINAL_HEIGHT))
         char_text = f"Remove {self.selected_character.name} from party?"
-        char_surface = font.render(char_text, True, WHITE)
+        char_surface = render_text(font, char_text, WHITE)
         char_x = (current_width - char_surface.get_width()) // 2
         screen.blit(char_surface, (char_x, char_y))
         
@@ -781,9 +780,9 @@ class PartyManagementUI:
             
             if is_selected:
                 # Highlight selected option
-                option_text = font.render(f"[{option}]", True, i == 0 and RED or GREEN)
+                option_text = render_text(font, f"[{option}]", i == 0 and RED or GREEN)
             else:
-                option_text = font.render(f" {option} ", True, GRAY)
+                option_text = render_text(font, f" {option} ", GRAY)
                 
             # Center the text at the option position
             option_x = option_x - option_text.get_width() // 2
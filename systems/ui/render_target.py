@@ -0,0 +1,204 @@
+"""
+Logical render target for the RPG game.
+Lets the game draw at the original design resolution and scale to the window once per frame.
+"""
+import pygame
+from constants import (ORIGINAL_WIDTH, ORIGINAL_HEIGHT,
+                      RENDER_MODE_NATIVE, RENDER_MODE_LOGICAL, RENDER_MODE_LOGICAL_CRISP)
+from systems.ui.font_manager import font_manager
+from systems.ui.text_cache import text_cache, render_text
+
+# The render target currently in use (None in native mode)
+_active_target = None
+
+def get_render_size():
+    """
+    Get the size of the surface the game is drawing to.
+
+    Returns:
+        tuple: (width, height) of the logical surface, or of the window in native mode
+    """
+    if _active_target is not None:
+        return _active_target.logical_size
+    return pygame.display.get_surface().get_size()
+
+def get_render_target():
+    """
+    Get the render target currently in use.
+
+    Returns:
+        RenderTarget: The active render target, or None in native mode
+    """
+    return _active_target
+
+class LogicalSurface(pygame.Surface):
+    """
+    Logical drawing surface that holds back cached text so it can be
+    rendered at the window's native resolution when the frame is presented.
+    Blits and fills over held-back text draw it in first; shapes do the
+    same when drawn through systems.ui.draw.
+    """
+    def __init__(self, size):
+        """
+        Initialize the logical surface.
+
+        Args:
+            size (tuple): (width, height) of the surface
+        """
+        super().__init__(size)
+        self.deferred_text = []  # (text key, logical rect) waiting for present
+
+    def fill(self, color, rect=None, special_flags=0):
+        """Fill the surface, dropping any held-back text underneath."""
+        if rect is None:
+            self.deferred_text = []
+        else:
+            self.bake_text(pygame.Rect(rect))
+        return super().fill(color, rect, special_flags)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """
+        Blit onto the surface, holding back cached text for native rendering.
+
+        Anything blitted on top of held-back text makes that text get drawn
+        at logical resolution first so layering stays correct.
+        """
+        key = text_cache.lookup(source)
+        if key is not None and area is None and special_flags == 0:
+            rect = source.get_rect(topleft=self._topleft(dest))
+            self.deferred_text.append((key, rect))
+            return rect
+
+        rect = source.get_rect(topleft=self._topleft(dest))
+        if area is not None:
+            rect.size = pygame.Rect(area).size
+        self.bake_text(rect)
+        return super().blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        """Blit a sequence of surfaces, one at a time through blit."""
+        rects = [self.blit(*args) for args in blit_sequence]
+        return rects if doreturn else None
+
+    def _topleft(self, dest):
+        """
+        Get the top-left corner of a blit destination.
+
+        Args:
+            dest: A position or rect
+
+        Returns:
+            tuple: (x, y) position
+        """
+        if isinstance(dest, pygame.Rect):
+            return dest.topleft
+        return (int(dest[0]), int(dest[1]))
+
+    def bake_text(self, rect):
+        """
+        Draw held-back text that overlaps a rect at logical resolution.
+
+        Args:
+            rect (pygame.Rect): Area about to be drawn over
+        """
+        if not self.deferred_text:
+            return
+        remaining = []
+        for key, text_rect in self.deferred_text:
+            if text_rect.colliderect(rect):
+                font, text, color, antialias = key
+                super().blit(render_text(font, text, color, antialias), text_rect)
+            else:
+                remaining.append((key, text_rect))
+        self.deferred_text = remaining
+
+class RenderTarget:
+    """
+    Owns the logical surface and presents it to the window.
+    """
+    def __init__(self, render_mode=RENDER_MODE_LOGICAL):
+        """
+        Initialize the render target and make it the active one.
+
+        Args:
+            render_mode (str): RENDER_MODE_LOGICAL or RENDER_MODE_LOGICAL_CRISP
+        """
+        global _active_target
+        self.render_mode = render_mode
+        self.logical_size = (ORIGINAL_WIDTH, ORIGINAL_HEIGHT)
+        if render_mode == RENDER_MODE_LOGICAL_CRISP:
+            self.surface = LogicalSurface(self.logical_size)
+        else:
+            self.surface = pygame.Surface(self.logical_size)
+        self.smooth = True
+        _active_target = self
+
+    def close(self):
+        """Stop using this render target."""
+        global _active_target
+        if _active_target is self:
+            _active_target = None
+
+    def present(self, window):
+        """
+        Scale the logical surface to the window and flip the display.
+
+        Args:
+            window: The display surface
+        """
+        window_size = window.get_size()
+        if window_size == self.logical_size:
+            window.blit(self.surface, (0, 0))
+        elif self.smooth:
+            pygame.transform.smoothscale(self.surface, window_size, window)
+        else:
+            pygame.transform.scale(self.surface, window_size, window)
+
+        if self.render_mode == RENDER_MODE_LOGICAL_CRISP:
+            self._draw_native_text(window)
+
+        pygame.display.flip()
+
+    def _draw_native_text(self, window):
+        """
+        Render held-back text at the window's resolution.
+
+        Args:
+            window: The display surface
+        """
+        window_width, window_height = window.get_size()
+        scale_x = window_width / self.logical_size[0]
+        scale_y = window_height / self.logical_size[1]
+
+        for key, rect in self.surface.deferred_text:
+            font, text, color, antialias = key
+            described = font_manager.describe(font)
+            if described is None:
+                # Not one of ours, fall back to scaling the logical render
+                surface = pygame.transform.smoothscale(
+                    render_text(font, text, color, antialias),
+                    (int(rect.width * scale_x), int(rect.height * scale_y)))
+            else:
+                family, size = described
+                native_font = font_manager.get_font(size, family,
+                                                    resolution=(window_width, window_height))
+                surface = render_text(native_font, text, color, antialias)
+            window.blit(surface, (int(rect.x * scale_x), int(rect.y * scale_y)))
+
+        self.surface.deferred_text = []
+
+def create_render_target(render_mode):
+    """
+    Create the render target for a render mode.
+
+    Args:
+        render_mode (str): One of the RENDER_MODE_* constants
+
+    Returns:
+        RenderTarget: The new render target, or None in native mode
+    """
+    if _active_target is not None:
+        _active_target.close()
+    if render_mode == RENDER_MODE_NATIVE:
+        return None
+    return RenderTarget(render_mode)
@@ -0,0 +1,101 @@
+"""
+Text surface cache for the RPG game.
+Keeps rendered text around so static labels aren't rasterized again every frame.
+"""
+from collections import OrderedDict
+
+MAX_CACHED_SURFACES = 512
+
+class TextCache:
+    """
+    Cache of rendered text surfaces keyed by (font, text, color, antialias).
+    Least recently used surfaces are evicted once the cache is full.
+    """
+    def __init__(self, max_surfaces=MAX_CACHED_SURFACES):
+        """
+        Initialize the text cache.
+
+        Args:
+            max_surfaces (int): Maximum number of surfaces to keep cached
+        """
+        self.max_surfaces = max_surfaces
+        self._surfaces = OrderedDict()
+        self._surface_keys = {}  # Surface -> cache key, for looking text back up
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """
+        Get a rendered text surface, rendering it on first use.
+
+        Callers must not draw onto the returned surface since it is shared.
+
+        Args:
+            font (pygame.font.Font): Font to render with
+            text (str): Text to render
+            color (tuple): RGB color of the text
+            antialias (bool): Whether to antialias the text
+
+        Returns:
+            pygame.Surface: The rendered text
+        """
+        # pygame.Color isn't hashable, so normalize to a tuple
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            # Mark as most recently used
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        self._surface_keys[surface] = key
+
+        # Evict the least recently used surface if over capacity
+        if len(self._surfaces) > self.max_surfaces:
+            _, evicted = self._surfaces.popitem(last=False)
+            del self._surface_keys[evicted]
+
+        return surface
+
+    def lookup(self, surface):
+        """
+        Find out what a cached text surface was rendered from.
+
+        Args:
+            surface (pygame.Surface): A surface returned by render
+
+        Returns:
+            tuple: (font, text, color, antialias), or None if it isn't cached text
+        """
+        return self._surface_keys.get(surface)
+
+    def clear(self):
+        """Drop all cached surfaces and reset the counters."""
+        self._surfaces.clear()
+        self._surface_keys.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+# Shared instance used by menus and the battle HUD
+text_cache = TextCache()
+
+def render_text(font, text, color, antialias=True):
+    """
+    Render text through the shared text cache.
+
+    Args:
+        font (pygame.font.Font): Font to render with
+        text (str): Text to render
+        color (tuple): RGB color of the text
+        antialias (bool): Whether to antialias the text
+
+    Returns:
+        pygame.Surface: The rendered text
+    """
+    return text_cache.render(font, text, color, antialias)
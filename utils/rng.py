@@ -0,0 +1,61 @@
+"""
+Named random streams for the RPG game.
+Each gameplay system draws from its own stream so a whole session can be
+reproduced from a handful of seeds (see core/replay.py).
+"""
+import random
+
+# Streams used by the game
+ENCOUNTER_STREAM = "encounter"    # Encounter rolls and encounter pool picks
+BATTLE_STREAM = "battle"          # Hit rolls, enemy targeting and passives in battle
+TURN_ORDER_STREAM = "turn_order"  # Turn order tiebreaks outside a battle
+PASSIVE_STREAM = "passive"        # Passive triggers outside a battle
+EFFECTS_STREAM = "effects"        # Battle backgrounds, particles and effect offsets
+
+STREAM_NAMES = (ENCOUNTER_STREAM, BATTLE_STREAM, TURN_ORDER_STREAM,
+                PASSIVE_STREAM, EFFECTS_STREAM)
+
+# Stream name -> (seed, random.Random)
+_streams = {}
+
+def get_stream(name):
+    """
+    Get a named random stream, creating it with a fresh seed if needed.
+
+    Args:
+        name (str): Name of the stream
+
+    Returns:
+        random.Random: The stream's generator
+    """
+    if name not in _streams:
+        seed = random.SystemRandom().getrandbits(64)
+        _streams[name] = (seed, random.Random(seed))
+    return _streams[name][1]
+
+def seed_streams(seeds=None):
+    """
+    Reseed every named stream.
+
+    Args:
+        seeds (dict): Stream name -> seed; streams without a seed get a fresh one
+
+    Returns:
+        dict: Stream name -> seed actually used
+    """
+    seeds = dict(seeds or {})
+    for name in STREAM_NAMES:
+        if name not in seeds:
+            seeds[name] = random.SystemRandom().getrandbits(64)
+    for name, seed in seeds.items():
+        _streams[name] = (seed, random.Random(seed))
+    return seeds
+
+def get_seeds():
+    """
+    Get the seeds of the streams created so far.
+
+    Returns:
+        dict: Stream name -> seed
+    """
+    return {name: seed for name, (seed, _) in _streams.items()}
@@ -2,6 +2,29 @@
 Utility functions for the RPG game.
 """
 
+# Incremented whenever the display mode or resolution changes
+_display_epoch = 0
+
+def get_display_epoch():
+    """
+    Get the current display epoch.
+    
+    Returns:
+        int: Counter that changes whenever display settings are applied
+    """
+    return _display_epoch
+
+def bump_display_epoch():
+    """
+    Advance the display epoch so scaled objects know to rebuild.
+    
+    Returns:
+        int: The new display epoch
+    """
+    global _display_epoch
+    _display_epoch += 1
+    return _display_epoch
+
 def scale_position(x, y, orig_width, orig_height, current_width, current_height):
     """
     Scale a position from the original resolution to the current resolution.